@@ -14,13 +14,47 @@ class DynamicArray:
     """
     Class implementing a Dynamic Array
     Supported methods are:
-    append, pop, swap, get_at_index, set_at_index, length
+    append, pop, swap, get_at_index, set_at_index, length,
+    filled, get_slice, set_slice, get_unchecked, set_unchecked
     """
 
     def __init__(self, arr=None) -> None:
         """Initialize new dynamic array using a list."""
         self._data = arr.copy() if arr else []
 
+    @classmethod
+    def filled(cls, size: int, value: object = None, factory=None) -> "DynamicArray":
+        """
+        Create a new array of the given size in one step.
+        Every element is set to value, or to a fresh factory() result
+        when a factory is given (use this for mutable elements).
+        """
+        if size < 0:
+            raise DynamicArrayException
+        da = cls()
+        if factory is None:
+            da._data = [value] * size
+        else:
+            da._data = [factory() for _ in range(size)]
+        return da
+
+    @classmethod
+    def from_list(cls, values: list) -> "DynamicArray":
+        """
+        Create a new array that takes over the given list without copying it.
+        For internal use by bulk operations of the hash maps.
+        """
+        da = cls()
+        da._data = values
+        return da
+
+    def to_list(self) -> list:
+        """
+        Return a copy of the elements as a list.
+        For internal use by bulk operations of the hash maps.
+        """
+        return self._data.copy()
+
     def __iter__(self):
         """
         Disable iterator capability for DynamicArray class
@@ -75,6 +109,35 @@ class DynamicArray:
         """Return length of array."""
         return len(self._data)
 
+    def get_slice(self, start: int, stop: int) -> "DynamicArray":
+        """Return a new array with the elements from index start up to (not including) stop."""
+        if start < 0 or stop > self.length() or start > stop:
+            raise DynamicArrayException
+        da = DynamicArray()
+        da._data = self._data[start:stop]
+        return da
+
+    def set_slice(self, start: int, values: "DynamicArray") -> None:
+        """Overwrite the elements starting at index start with the elements of values."""
+        stop = start + values.length()
+        if start < 0 or stop > self.length():
+            raise DynamicArrayException
+        self._data[start:stop] = values._data
+
+    def get_unchecked(self, index: int):
+        """
+        Return value of element at a given index without bounds checking.
+        For internal use by the hash maps; index must already be valid.
+        """
+        return self._data[index]
+
+    def set_unchecked(self, index: int, value: object) -> None:
+        """
+        Set value of element at a given index without bounds checking.
+        For internal use by the hash maps; index must already be valid.
+        """
+        self._data[index] = value
+
 
 def hash_function_1(key: str) -> int:
     """Sample Hash function #1 to be used with HashMap implementation"""
@@ -101,11 +164,15 @@ class SLNode:
     Singly Linked List node for use in a hash map
     """
 
-    def __init__(self, key: str, value: object, next: "SLNode" = None) -> None:
-        """Initialize node given a key and value."""
+    def __init__(self, key: str, value: object, next: "SLNode" = None, hash: int = None) -> None:
+        """
+        Initialize node given a key and value.
+        The hash map may also cache the key's hash value in the node.
+        """
         self.key = key
         self.value = value
         self.next = next
+        self.hash = hash
 
     def __str__(self) -> str:
         """Override string method to provide more readable output."""
@@ -139,7 +206,7 @@ class LinkedListIterator:
 class LinkedList:
     """
     Class implementing a Singly Linked List
-    Supported methods are: insert, remove, contains, length, iterator
+    Supported methods are: insert, insert_node, remove, remove_node, contains, length, iterator
     """
 
     def __init__(self) -> None:
@@ -166,9 +233,15 @@ class LinkedList:
         """Return an iterator for the list, starting at the head."""
         return LinkedListIterator(self._head)
 
-    def insert(self, key: str, value: object) -> None:
-        """Insert new node at front of the list."""
-        self._head = SLNode(key, value, self._head)
+    def insert(self, key: str, value: object, hash: int = None) -> None:
+        """Insert new node at front of the list, optionally caching the key's hash value."""
+        self._head = SLNode(key, value, self._head, hash)
+        self._size += 1
+
+    def insert_node(self, node: SLNode) -> None:
+        """Link an existing node in at the front of the list, without allocating."""
+        node.next = self._head
+        self._head = node
         self._size += 1
 
     def remove(self, key: str) -> bool:
@@ -190,6 +263,25 @@ class LinkedList:
             previous, node = node, node.next
         return False
 
+    def remove_node(self, key: str) -> SLNode:
+        """
+        Remove first node with matching key and return it,
+        or return None if no match.
+        """
+        previous, node = None, self._head
+        while node:
+
+            if node.key == key:
+                if previous:
+                    previous.next = node.next
+                else:
+                    self._head = node.next
+                self._size -= 1
+                return node
+
+            previous, node = node, node.next
+        return None
+
     def contains(self, key: str) -> SLNode:
         """Return node with matching key, or None if no match"""
         node = self._head
@@ -208,10 +300,14 @@ class LinkedList:
 
 class HashEntry:
 
-    def __init__(self, key: str, value: object) -> None:
-        """Initialize an entry for use in a hash map."""
+    def __init__(self, key: str, value: object, hash: int = None) -> None:
+        """
+        Initialize an entry for use in a hash map.
+        The hash map may also cache the key's hash value in the entry.
+        """
         self.key = key
         self.value = value
+        self.hash = hash
 
         # Set this value to True when you "delete" a HashEntry
         self.is_tombstone = False
@@ -0,0 +1,91 @@
+# Description: Benchmark of batch lookups and inserts in the NumPy-backed HashMap in
+# hash_map_numpy.py against per-key calls on the open addressing HashMap in
+# hash_map_oa.py (string keys, builtin hash) and the integer HashMap in hash_map_int.py.
+# Each map is filled with N random 64-bit IDs, then probed with a column of N lookups
+# of which about half are present. For each map it reports the time to insert and to
+# look up the whole column, and the lookup speedup over hash_map_oa.HashMap.get.
+#
+# Usage: python benchmark_batch.py [--keys N] [--seed S]
+
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+import hash_map_int
+import hash_map_numpy
+import hash_map_oa
+
+
+def run_oa(keys: list, probes: list) -> tuple:
+    """Insert and look up every key one call at a time; return (insert s, lookup s, hits)."""
+    # the pre-written hash functions cluster numeric strings, so use the builtin hash
+    m = hash_map_oa.HashMap(11, hash)
+    start = time.perf_counter()
+    for key in keys:
+        m.put(str(key), key)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hits = sum(m.get(str(key)) is not None for key in probes)
+    return insert_time, time.perf_counter() - start, hits
+
+
+def run_int(keys: list, probes: list) -> tuple:
+    """Insert and look up every key one call at a time; return (insert s, lookup s, hits)."""
+    m = hash_map_int.HashMap(11, float_values=True)
+    start = time.perf_counter()
+    for key in keys:
+        m.put(key, key)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hits = sum(m.get(key) is not None for key in probes)
+    return insert_time, time.perf_counter() - start, hits
+
+
+def run_numpy(keys: list, probes: list) -> tuple:
+    """Insert and look up the keys as two batches; return (insert s, lookup s, hits)."""
+    key_array = np.array(keys, dtype=np.int64)
+    probe_array = np.array(probes, dtype=np.int64)
+    m = hash_map_numpy.HashMap(11)
+    start = time.perf_counter()
+    m.insert_batch(key_array, key_array.astype(np.float64))
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, found = m.lookup_batch(probe_array)
+    return insert_time, time.perf_counter() - start, int(found.sum())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare batch and per-key lookups.')
+    parser.add_argument('--keys', type=int, default=200000, help='number of keys inserted and looked up')
+    parser.add_argument('--seed', type=int, default=50, help='random seed for the keys')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    distinct = set()
+    while len(distinct) < 2 * args.keys:
+        distinct.add(rng.getrandbits(64) - 2 ** 63)
+    ids = sorted(distinct)
+    rng.shuffle(ids)
+    keys = ids[:args.keys]
+    probes = rng.sample(keys, args.keys // 2) + ids[args.keys:args.keys + args.keys - args.keys // 2]
+    rng.shuffle(probes)
+
+    print(f"{'map':<24}{'insert ms':>11}{'lookup ms':>11}{'lookups/s':>13}{'speedup':>9}{'hits':>9}")
+    baseline = None
+    for name, run in (('hash_map_oa (per key)', run_oa),
+                      ('hash_map_int (per key)', run_int),
+                      ('hash_map_numpy (batch)', run_numpy)):
+        insert_time, lookup_time, hits = run(keys, probes)
+        baseline = baseline or lookup_time
+        print(f"{name:<24}{insert_time * 1000:>11.1f}{lookup_time * 1000:>11.1f}"
+              f"{len(probes) / lookup_time:>13.0f}{baseline / lookup_time:>8.1f}x{hits:>9}")
+
+
+if __name__ == "__main__":
+    main()
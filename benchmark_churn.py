@@ -0,0 +1,77 @@
+# Description: Benchmark of node churn in the separate chaining HashMap in hash_map_sc.py.
+# It grows a map from its initial capacity to N keys (every resize relinks the existing
+# nodes), then runs rounds of put/remove churn that keep the size steady, where removed
+# nodes are recycled by later inserts through the map's node pool. Each phase is run
+# with the pool disabled and with the given pool size, and reports its time, operations
+# per second, and the number of garbage collections it triggered.
+#
+# Usage: python benchmark_churn.py [--keys N] [--rounds R] [--pool P] [--seed S]
+
+
+import argparse
+import gc
+import random
+import time
+
+from hash_map_sc import NODE_POOL_SIZE, HashMap
+
+
+def collections() -> int:
+    """Return the number of garbage collections run so far, over every generation."""
+    return sum(stats['collections'] for stats in gc.get_stats())
+
+
+def run_one(keys: list, churn: list, pool_size: int) -> tuple:
+    """
+    Grow a map to hold every key, then for each churn key remove a random present key
+    and put the churn key. Return (grow seconds, grow collections, churn seconds,
+    churn collections).
+    """
+    # the builtin hash keeps chains short, so node allocation dominates the cost
+    m = HashMap(11, hash, node_pool_size=pool_size)
+    rng = random.Random(len(keys))
+
+    gc.collect()
+    before = collections()
+    start = time.perf_counter()
+    for index, key in enumerate(keys):
+        m.put(key, index)
+    grow_time = time.perf_counter() - start
+    grow_collections = collections() - before
+
+    present = list(keys)
+    before = collections()
+    start = time.perf_counter()
+    for index, key in enumerate(churn):
+        position = rng.randrange(len(present))
+        m.remove(present[position])
+        m.put(key, index)
+        present[position] = key
+    churn_time = time.perf_counter() - start
+    churn_collections = collections() - before
+
+    return grow_time, grow_collections, churn_time, churn_collections
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure put/remove churn in the chaining HashMap.')
+    parser.add_argument('--keys', type=int, default=200000, help='number of keys held by the map')
+    parser.add_argument('--rounds', type=int, default=200000, help='number of remove + put rounds')
+    parser.add_argument('--pool', type=int, default=NODE_POOL_SIZE, help='node pool size to compare with no pool')
+    parser.add_argument('--seed', type=int, default=261, help='random seed for the keys')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    ids = rng.sample(range(10 ** 9), args.keys + args.rounds)
+    keys = [str(i) for i in ids[:args.keys]]
+    churn = [str(i) for i in ids[args.keys:]]
+
+    print(f"{'pool':>6}{'grow ms':>10}{'grow gc':>9}{'churn ms':>10}{'churn ops/s':>13}{'churn gc':>10}")
+    for pool_size in (0, args.pool):
+        grow_time, grow_collections, churn_time, churn_collections = run_one(keys, churn, pool_size)
+        print(f"{pool_size:>6}{grow_time * 1000:>10.1f}{grow_collections:>9}{churn_time * 1000:>10.1f}"
+              f"{2 * len(churn) / churn_time:>13.0f}{churn_collections:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Description: Benchmark comparing the probing strategies of the open addressing
+# HashMap in hash_map_oa.py (linear probing, quadratic probing, and double hashing)
+# across several key distributions and both pre-written hash functions. For each
+# combination it reports the time to insert every key, the time for successful and
+# unsuccessful lookups, and the average probe length of a successful lookup.
+#
+# Usage: python benchmark_probing.py [--keys N] [--seed S]
+
+
+import argparse
+import random
+import time
+
+from DynamicArray_and_SinglyLinkedList import hash_function_1, hash_function_2
+from hash_map_oa import HashMap, double_hashing, linear_probing, quadratic_probing
+
+
+STRATEGIES = (
+    ('linear', linear_probing),
+    ('quadratic', quadratic_probing),
+    ('double', double_hashing),
+)
+
+HASH_FUNCTIONS = (
+    ('hash_function_1', hash_function_1),
+    ('hash_function_2', hash_function_2),
+)
+
+
+def make_key_sets(count: int, rng: random.Random) -> tuple:
+    """
+    Return (name, present keys, absent keys) triples for each key distribution:
+    sequential keys with a common prefix, numeric IDs, and random lowercase words.
+    """
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+
+    def random_word() -> str:
+        return ''.join(rng.choice(letters) for _ in range(rng.randint(4, 12)))
+
+    ids = rng.sample(range(10 ** 9), 2 * count)
+    words = set()
+    while len(words) < 2 * count:
+        words.add(random_word())
+    words = list(words)
+
+    return (
+        ('sequential', ['key' + str(i) for i in range(count)],
+         ['key' + str(i) for i in range(count, 2 * count)]),
+        ('numeric ids', [str(i) for i in ids[:count]], [str(i) for i in ids[count:]]),
+        ('random words', words[:count], words[count:]),
+    )
+
+
+def run_one(keys: list, missing: list, function: callable, probing: callable) -> tuple:
+    """
+    Build a map with the given hash function and probing strategy, then time inserts,
+    hits, and misses. Return (put seconds, hit seconds, miss seconds, average probe length).
+    """
+    m = HashMap(11, function, probing=probing)
+
+    start = time.perf_counter()
+    for index, key in enumerate(keys):
+        m.put(key, index)
+    put_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in keys:
+        m.get(key)
+    hit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in missing:
+        m.get(key)
+    miss_time = time.perf_counter() - start
+
+    return put_time, hit_time, miss_time, m.average_probe_length()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare open addressing probing strategies.')
+    parser.add_argument('--keys', type=int, default=5000, help='number of keys per run')
+    parser.add_argument('--seed', type=int, default=261, help='random seed for the key sets')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'keys':<14}{'hash':<17}{'probing':<11}{'put ms':>9}{'hit ms':>9}{'miss ms':>9}{'probes':>9}")
+    for key_set, keys, missing in make_key_sets(args.keys, rng):
+        for function_name, function in HASH_FUNCTIONS:
+            for strategy_name, probing in STRATEGIES:
+                put_time, hit_time, miss_time, probes = run_one(keys, missing, function, probing)
+                print(f"{key_set:<14}{function_name:<17}{strategy_name:<11}"
+                      f"{put_time * 1000:>9.1f}{hit_time * 1000:>9.1f}{miss_time * 1000:>9.1f}{probes:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Description: Load generator for the key-value server in map_server.py. It starts a
+# server on localhost (or targets a running one with --port), preloads the keys, then
+# runs several concurrent workers that each send pipelined batches of multi-key GET and
+# PUT commands through a pooled MapClient. It reports the request throughput, the key
+# throughput, and the latency percentiles of a whole pipelined batch.
+#
+# Usage: python benchmark_server.py [--map sc|oa] [--port P] [--keys N] [--requests N]
+#                                   [--concurrency C] [--pipeline D] [--batch B]
+#                                   [--read-ratio R] [--seed S]
+
+
+import argparse
+import asyncio
+import random
+import time
+
+from DynamicArray_and_SinglyLinkedList import DynamicArray
+from map_server import MapClient, MapServer, make_map
+from workload_trace import percentile
+
+
+MAP_NAME = 'bench'
+
+
+async def _worker(client: MapClient, rng: random.Random, keys: list, requests: int,
+                  pipeline: int, batch: int, read_ratio: float, latencies: DynamicArray) -> None:
+    """Send requests in pipelined groups, recording the latency of each group."""
+    sent = 0
+    while sent < requests:
+        depth = min(pipeline, requests - sent)
+        commands = []
+        for _ in range(depth):
+            chosen = rng.sample(keys, batch)
+            if rng.random() < read_ratio:
+                commands.append(('GET', MAP_NAME, *chosen))
+            else:
+                args = ['PUT', MAP_NAME]
+                for key in chosen:
+                    args.append(key)
+                    args.append(str(rng.randrange(1000000)))
+                commands.append(tuple(args))
+
+        start = time.perf_counter()
+        await client.pipeline(commands)
+        latencies.append(time.perf_counter() - start)
+        sent += depth
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = None
+    port = args.port
+    if port is None:
+        server = await MapServer(dict([make_map(MAP_NAME + ':' + args.map)])).start('127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+
+    client = MapClient('127.0.0.1', port, pool_size=args.concurrency)
+    await client.connect()
+
+    keys = ['key' + str(i) for i in range(args.keys)]
+    for start in range(0, len(keys), 1000):
+        await client.put(MAP_NAME, [(key, '0') for key in keys[start:start + 1000]])
+
+    latencies = DynamicArray()
+    per_worker = args.requests // args.concurrency
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _worker(client, random.Random(args.seed + worker), keys, per_worker,
+                args.pipeline, args.batch, args.read_ratio, latencies)
+        for worker in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    await client.close()
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+    samples = sorted(latencies.get_unchecked(index) for index in range(latencies.length()))
+    total = per_worker * args.concurrency
+    print(f"{total} requests of {args.batch} keys, {args.concurrency} connections, pipeline depth {args.pipeline}")
+    print(f"{total / elapsed:,.0f} requests/s, {total * args.batch / elapsed:,.0f} keys/s")
+    print(f"batch latency: p50 {percentile(samples, 0.50) * 1e3:.2f} ms, "
+          f"p99 {percentile(samples, 0.99) * 1e3:.2f} ms, "
+          f"p99.9 {percentile(samples, 0.999) * 1e3:.2f} ms, max {samples[-1] * 1e3:.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the HashMap key-value server.')
+    parser.add_argument('--map', choices=('sc', 'oa'), default='sc', help='map type of the built-in server')
+    parser.add_argument('--port', type=int, help='port of a running server (default: start one)')
+    parser.add_argument('--keys', type=int, default=10000, help='number of distinct keys')
+    parser.add_argument('--requests', type=int, default=20000, help='total number of commands')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent connections')
+    parser.add_argument('--pipeline', type=int, default=16, help='commands sent per round trip')
+    parser.add_argument('--batch', type=int, default=4, help='keys per GET or PUT command')
+    parser.add_argument('--read-ratio', type=float, default=0.9, help='fraction of commands that are GETs')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# Description: Implementation of a counting Bloom filter that can be placed in front
+# of either HashMap to answer definite misses without touching the hash table. Each
+# key sets (increments) a fixed number of counters chosen by double hashing; a key
+# whose counters are not all non-zero was never added. Counters rather than bits are
+# kept so that keys can also be removed. The filter also tracks how many "maybe"
+# answers turned out to be false positives.
+
+
+# number of counters per expected item; with the matching number of hash
+# functions this gives a false positive rate of roughly 1%
+COUNTERS_PER_ITEM = 10
+NUM_HASHES = 7
+
+# counters stop counting at this value and are never decremented afterwards
+MAX_COUNT = 255
+
+
+class CountingBloomFilter:
+    """
+    Counting Bloom filter sized for an expected number of items
+    Supported methods are:
+    add, remove, might_contain, record_false_positive, clear,
+    false_positive_rate, stats
+    """
+
+    def __init__(self, expected_items: int) -> None:
+        """Initialize an empty filter with room for the expected number of items."""
+        self._num_counters = max(COUNTERS_PER_ITEM, expected_items * COUNTERS_PER_ITEM)
+        self._counters = bytearray(self._num_counters)
+        self._items = 0
+
+        # lookups answered, lookups answered "definitely not", and "maybe" answers
+        # that the table then reported as misses
+        self._queries = 0
+        self._negatives = 0
+        self._false_positives = 0
+
+    def _positions(self, key: str):
+        """Yield the counter indices for the given key using double hashing."""
+        hash = hash_key(key)
+        first = hash & 0xFFFFFFFF
+        step = (hash >> 32) | 1
+        for i in range(NUM_HASHES):
+            yield (first + i * step) % self._num_counters
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter. The key must not already be in the filter."""
+        counters = self._counters
+        for index in self._positions(key):
+            if counters[index] < MAX_COUNT:
+                counters[index] += 1
+        self._items += 1
+
+    def remove(self, key: str) -> None:
+        """Remove a key that was previously added to the filter."""
+        counters = self._counters
+        for index in self._positions(key):
+            # a saturated counter no longer knows its true count, so it stays put
+            if counters[index] < MAX_COUNT:
+                counters[index] -= 1
+        self._items -= 1
+
+    def might_contain(self, key: str) -> bool:
+        """
+        Return False if the key is definitely not in the filter,
+        or True if it might be.
+        """
+        self._queries += 1
+        counters = self._counters
+        for index in self._positions(key):
+            if counters[index] == 0:
+                self._negatives += 1
+                return False
+        return True
+
+    def record_false_positive(self) -> None:
+        """Record that a "maybe" answer from might_contain was a miss in the table."""
+        self._false_positives += 1
+
+    def clear(self) -> None:
+        """Remove every key from the filter and reset its statistics."""
+        self._counters = bytearray(self._num_counters)
+        self._items = 0
+        self._queries = 0
+        self._negatives = 0
+        self._false_positives = 0
+
+    def false_positive_rate(self) -> float:
+        """Return the estimated false positive rate from the fraction of non-zero counters."""
+        filled = self._num_counters - self._counters.count(0)
+        return (filled / self._num_counters) ** NUM_HASHES
+
+    def stats(self) -> dict:
+        """
+        Return a dictionary describing the filter: its size, the number of items,
+        the estimated and observed false positive rates, and how many lookups it
+        answered as definite misses.
+        """
+        maybes = self._queries - self._negatives
+        observed = self._false_positives / maybes if maybes else 0.0
+        return {
+            'counters': self._num_counters,
+            'hashes': NUM_HASHES,
+            'items': self._items,
+            'queries': self._queries,
+            'definite_misses': self._negatives,
+            'false_positives': self._false_positives,
+            'estimated_false_positive_rate': self.false_positive_rate(),
+            'observed_false_positive_rate': observed,
+        }
+
+
+def hash_key(key: str) -> int:
+    """
+    Return a 64-bit hash of the key for choosing filter counters. Python's own
+    string hash is used since it is well mixed and cached on the string object;
+    the filter only lives as long as the process, so its per-process seed is fine.
+    """
+    return hash(key) & 0xFFFFFFFFFFFFFFFF
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nadd / might_contain example")
+    print("---------------------------")
+    bloom = CountingBloomFilter(1000)
+    for i in range(1000):
+        bloom.add('key' + str(i))
+    result = True
+    for i in range(1000):
+        result &= bloom.might_contain('key' + str(i))
+    print(result)
+
+    false_positives = 0
+    for i in range(1000, 11000):
+        if bloom.might_contain('key' + str(i)):
+            false_positives += 1
+    print(round(false_positives / 10000, 3), round(bloom.false_positive_rate(), 3))
+
+    print("\nremove example")
+    print("--------------")
+    for i in range(0, 1000, 2):
+        bloom.remove('key' + str(i))
+    result = True
+    for i in range(1, 1000, 2):
+        result &= bloom.might_contain('key' + str(i))
+    print(result, bloom.stats()['items'])
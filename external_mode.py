@@ -0,0 +1,198 @@
+# Description: Out-of-core counting for inputs with more distinct values than fit in
+# memory. find_mode() in hash_map_sc.py counts every value in one Counter, so its memory
+# grows with the number of distinct values. Here the values are streamed from any
+# iterable (or a file, one value per line) and spilled into hash partitions on disk, so
+# every occurrence of a value lands in the same partition. Each partition is then
+# counted on its own with the in-memory Counter, holding at most max_keys distinct
+# values at a time; a partition with more distinct values than that is split again
+# with a differently salted hash. The per-partition counts are merged into exact
+# group-by counts (group_counts) and exact modes (find_mode_external) in bounded RAM.
+#
+# Partition format: one record per value, its UTF-8 length (4 bytes, little-endian)
+# followed by the UTF-8 encoded value.
+#
+# Usage: python external_mode.py VALUES_FILE [--partitions N] [--max-keys N]
+#                                [--function 1|2] [--directory DIR] [--top K]
+
+
+import argparse
+import hashlib
+import os
+import struct
+import tempfile
+import time
+
+from DynamicArray_and_SinglyLinkedList import DynamicArray, hash_function_1, hash_function_2
+from hash_map_sc import Counter
+
+
+LENGTH = struct.Struct('<I')
+
+# number of partition files the values are spilled into at each level
+PARTITIONS = 64
+
+# most distinct values counted in memory at once
+MAX_KEYS = 100000
+
+# a partition still too large after this many splits is counted in memory regardless
+MAX_DEPTH = 4
+
+# size of the write and read buffer of each partition file
+BUFFER_SIZE = 1 << 16
+
+HASH_FUNCTIONS = {'1': hash_function_1, '2': hash_function_2}
+
+
+def read_values(path: str):
+    """Yields the values in a text file, one per line, without their line endings."""
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            yield line.rstrip('\r\n')
+
+
+def _values_of(values):
+    """Yields the values of a DynamicArray (which does not support iteration) or an iterable."""
+    if isinstance(values, DynamicArray):
+        for index in range(values.length()):
+            yield values.get_unchecked(index)
+    else:
+        yield from values
+
+
+def _partition_of(encoded: bytes, depth: int, partitions: int) -> int:
+    """
+    Return the partition of an encoded value at the given level of splitting. Each
+    level salts the hash differently, so the values of one partition spread over
+    all partitions of the next level.
+    """
+    digest = hashlib.blake2b(encoded, digest_size=8, salt=depth.to_bytes(16, 'little')).digest()
+    return int.from_bytes(digest, 'little') % partitions
+
+
+def _spill(encoded_values, prefix: str, depth: int, partitions: int) -> list:
+    """
+    Writes every encoded value to its partition file, named prefix.N for partition N,
+    and returns the paths of the partition files.
+
+    :complexity: O(n), where n is the number of values
+    """
+    paths = [f'{prefix}.{index}' for index in range(partitions)]
+    files = [open(path, 'wb', buffering=BUFFER_SIZE) for path in paths]
+    try:
+        for encoded in encoded_values:
+            file = files[_partition_of(encoded, depth, partitions)]
+            file.write(LENGTH.pack(len(encoded)))
+            file.write(encoded)
+    finally:
+        for file in files:
+            file.close()
+    return paths
+
+
+def _read_partition(path: str):
+    """Yields the encoded values stored in a partition file."""
+    with open(path, 'rb', buffering=BUFFER_SIZE) as file:
+        while True:
+            header = file.read(LENGTH.size)
+            if not header:
+                return
+            yield file.read(LENGTH.unpack(header)[0])
+
+
+def _count_partition(path: str, depth: int, partitions: int, max_keys: int, function: callable):
+    """
+    Yields the (value, count) pairs of a partition file, counting it in memory if it
+    holds at most max_keys distinct values and otherwise splitting it into partitions
+    of its own. The file is deleted once it has been counted or split.
+
+    :complexity: O(n), where n is the number of values in the partition
+    """
+    counter = Counter(11, function)
+    fits = True
+    records = _read_partition(path)
+    for encoded in records:
+        counter.increment(str(encoded, 'utf-8'))
+        if counter.get_size() > max_keys and depth < MAX_DEPTH:
+            fits = False
+            break
+    records.close()
+
+    if fits:
+        os.remove(path)
+        pairs = counter.get_keys_and_values()
+        for index in range(pairs.length()):
+            yield pairs.get_unchecked(index)
+        return
+
+    # free the partial counts before splitting the partition one level further
+    counter = None
+    paths = _spill(_read_partition(path), path, depth + 1, partitions)
+    os.remove(path)
+    for sub_path in paths:
+        yield from _count_partition(sub_path, depth + 1, partitions, max_keys, function)
+
+
+def group_counts(values, partitions: int = PARTITIONS, max_keys: int = MAX_KEYS,
+                 function: callable = hash_function_2, directory: str = None):
+    """
+    Yields a (value, count) pair for every distinct value in the given DynamicArray or
+    iterable of strings, in no particular order. The values are spilled into hash
+    partitions in a temporary directory (inside directory if given), and each partition
+    is counted with a Counter of at most max_keys distinct values. The temporary files
+    are removed when the generator finishes or is closed.
+
+    :complexity: O(n) expected time, where n is the number of values; O(max_keys) memory
+    """
+    with tempfile.TemporaryDirectory(prefix='hashmap-groups-', dir=directory) as spill_directory:
+        encoded_values = (value.encode('utf-8') for value in _values_of(values))
+        prefix = os.path.join(spill_directory, 'partition')
+        for path in _spill(encoded_values, prefix, 0, partitions):
+            yield from _count_partition(path, 0, partitions, max_keys, function)
+
+
+def find_mode_external(values, partitions: int = PARTITIONS, max_keys: int = MAX_KEYS,
+                       function: callable = hash_function_2, directory: str = None) -> tuple[DynamicArray, int]:
+    """
+    Returns the same result as find_mode() for a DynamicArray or iterable of strings
+    that may have too many distinct values to count in memory: a dynamic array of the
+    mode value(s) and their frequency. The counts of each hash partition are merged
+    as they are produced, so only the current best values are kept.
+
+    :complexity: O(n) expected time, where n is the number of values; O(max_keys) memory
+    """
+    mode_values = DynamicArray()
+    highest_frequency = 1        # assume there will be at least one element
+
+    for value, count in group_counts(values, partitions, max_keys, function, directory):
+        if count > highest_frequency:
+            mode_values = DynamicArray()
+            mode_values.append(value)
+            highest_frequency = count
+        elif count == highest_frequency:
+            mode_values.append(value)
+
+    return mode_values, highest_frequency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Find the modes of a file of values that may not fit in memory.')
+    parser.add_argument('values_file', help='text file with one value per line')
+    parser.add_argument('--partitions', type=int, default=PARTITIONS, help='number of partitions per level')
+    parser.add_argument('--max-keys', type=int, default=MAX_KEYS, help='most distinct values counted in memory at once')
+    parser.add_argument('--function', choices=sorted(HASH_FUNCTIONS), default='2', help='hash function of the Counter')
+    parser.add_argument('--directory', help='directory for the temporary partition files')
+    parser.add_argument('--top', type=int, default=10, help='number of mode values to print')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    mode_values, frequency = find_mode_external(read_values(args.values_file), args.partitions, args.max_keys,
+                                                HASH_FUNCTIONS[args.function], args.directory)
+    elapsed = time.perf_counter() - start
+
+    print(f"{mode_values.length()} mode value(s) with frequency {frequency} ({elapsed:.2f} s)")
+    for index in range(min(args.top, mode_values.length())):
+        print(mode_values.get_unchecked(index))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# Description: Command-line tool for judging hash functions against a real key corpus
+# before choosing one for a HashMap. The corpus is read from a file (one key per line).
+# Every available hash function is run over the keys at each requested capacity and
+# the tool reports how evenly the keys spread over the buckets (a chi-squared statistic
+# against a uniform distribution), how many bucket and full-hash collisions occur, the
+# average and longest chains a separate chaining HashMap would have, the average and
+# longest probe sequences an open addressing HashMap with quadratic probing would have,
+# and how fast the function hashes the corpus. Capacities are rounded up to the next
+# prime number, as the HashMap classes do.
+#
+# Usage: python hash_analyzer.py KEYS_FILE [--capacity C ...] [--function MODULE:NAME ...]
+
+
+import argparse
+import importlib
+import math
+import sys
+import time
+
+from DynamicArray_and_SinglyLinkedList import DynamicArray, hash_function_1, hash_function_2
+
+
+HASH_FUNCTIONS = (
+    ('hash_function_1', hash_function_1),
+    ('hash_function_2', hash_function_2),
+)
+
+
+def next_prime(capacity: int) -> int:
+    """
+    Return the capacity a HashMap would use for the given capacity: the smallest odd
+    prime number greater than or equal to it, exactly as HashMap._next_prime().
+    """
+    if capacity % 2 == 0:
+        capacity += 1
+    while capacity == 1 or any(capacity % factor == 0 for factor in range(3, math.isqrt(capacity) + 1, 2)):
+        capacity += 2
+    return capacity
+
+
+def read_keys(path: str) -> DynamicArray:
+    """Read one key per line from the given file, or from standard input if path is '-'."""
+    keys = DynamicArray()
+    source = sys.stdin if path == '-' else open(path, encoding='utf-8')
+    try:
+        for line in source:
+            key = line.rstrip('\r\n')
+            if key:
+                keys.append(key)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    return keys
+
+
+def load_function(spec: str) -> tuple:
+    """Return (name, function) for a 'module:function' specification."""
+    module_name, _, function_name = spec.partition(':')
+    if not function_name:
+        raise argparse.ArgumentTypeError(f"expected MODULE:FUNCTION, got '{spec}'")
+    return spec, getattr(importlib.import_module(module_name), function_name)
+
+
+def hash_keys(keys: DynamicArray, function: callable) -> tuple:
+    """Return (dynamic array of hash values, seconds taken) for the keys."""
+    hashes = DynamicArray.filled(keys.length(), 0)
+    start = time.perf_counter()
+    for index in range(keys.length()):
+        hashes.set_unchecked(index, function(keys.get_unchecked(index)))
+    return hashes, time.perf_counter() - start
+
+
+def bucket_statistics(hashes: DynamicArray, capacity: int) -> dict:
+    """
+    Return the distribution statistics of the hash values over the given number of buckets:
+    chi-squared against uniform (and its z-score), bucket collisions, and the average
+    successful-search and longest chain lengths of a separate chaining table.
+    """
+    count = hashes.length()
+    buckets = DynamicArray.filled(capacity, 0)
+    for index in range(count):
+        bucket = hashes.get_unchecked(index) % capacity
+        buckets.set_unchecked(bucket, buckets.get_unchecked(bucket) + 1)
+
+    expected = count / capacity
+    chi_squared = 0.0
+    occupied = 0
+    search_cost = 0
+    longest = 0
+    for bucket in range(capacity):
+        observed = buckets.get_unchecked(bucket)
+        chi_squared += (observed - expected) ** 2 / expected
+        if observed:
+            occupied += 1
+            # finding each of the chain's keys costs 1, 2, ..., observed comparisons
+            search_cost += observed * (observed + 1) // 2
+            longest = max(longest, observed)
+
+    degrees = capacity - 1
+    return {
+        'chi_squared': chi_squared,
+        'z_score': (chi_squared - degrees) / math.sqrt(2 * degrees) if degrees else 0.0,
+        'collisions': count - occupied,
+        'average_chain': search_cost / count if count else 0.0,
+        'longest_chain': longest,
+    }
+
+
+def quadratic_probe_statistics(hashes: DynamicArray, capacity: int) -> tuple:
+    """
+    Simulate inserting the hash values into an open addressing table with quadratic probing
+    (without resizing) and return (average probes per insert, longest probe sequence), or
+    None if the keys do not fit at a load factor of at most 0.5.
+    """
+    count = hashes.length()
+    if count > capacity // 2:
+        return None
+
+    occupied = bytearray(capacity)
+    total = 0
+    longest = 0
+    for index in range(count):
+        bucket = hashes.get_unchecked(index) % capacity
+        addend = 1
+        probes = 1
+        while occupied[bucket]:
+            bucket = (bucket + addend) % capacity
+            addend += 2
+            probes += 1
+        occupied[bucket] = 1
+        total += probes
+        longest = max(longest, probes)
+
+    return total / count if count else 0.0, longest
+
+
+def distinct_hashes(hashes: DynamicArray) -> int:
+    """Return the number of distinct hash values."""
+    seen = set()
+    for index in range(hashes.length()):
+        seen.add(hashes.get_unchecked(index))
+    return len(seen)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare hash functions on a corpus of keys.')
+    parser.add_argument('keys_file', help="file with one key per line ('-' for standard input)")
+    parser.add_argument('--capacity', type=int, action='append',
+                        help='table capacity to analyze (repeatable; default: n and 2n)')
+    parser.add_argument('--function', type=load_function, action='append', default=[],
+                        help='extra hash function to analyze, as MODULE:FUNCTION (repeatable)')
+    args = parser.parse_args()
+
+    keys = read_keys(args.keys_file)
+    count = keys.length()
+    if count == 0:
+        parser.error('the key file is empty')
+
+    capacities = args.capacity or [count, 2 * count]
+    capacities = [next_prime(capacity) for capacity in capacities]
+
+    print(f"{count} keys")
+    for name, function in HASH_FUNCTIONS + tuple(args.function):
+        hashes, seconds = hash_keys(keys, function)
+        rate = count / seconds if seconds else float('inf')
+        full_collisions = count - distinct_hashes(hashes)
+        print(f"\n{name}: {rate:,.0f} keys/s, {full_collisions} keys share a full hash value")
+        print(f"{'capacity':>10}{'chi2':>14}{'z':>10}{'collisions':>12}"
+              f"{'avg chain':>11}{'max chain':>11}{'avg probes':>12}{'max probes':>12}")
+
+        for capacity in capacities:
+            stats = bucket_statistics(hashes, capacity)
+            probing = quadratic_probe_statistics(hashes, capacity)
+            average_probes, longest_probe = ('-', '-') if probing is None else (f"{probing[0]:.2f}", probing[1])
+            print(f"{capacity:>10}{stats['chi_squared']:>14.1f}{stats['z_score']:>10.1f}"
+                  f"{stats['collisions']:>12}{stats['average_chain']:>11.2f}{stats['longest_chain']:>11}"
+                  f"{average_probes:>12}{longest_probe:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,536 @@
+# Description: Implementation of a HashMap class that uses a dynamic array to
+# store the hash table and two-choice Cuckoo Hashing for collision resolution.
+# Every key lives in one of exactly two candidate buckets (one per hash function)
+# or in a small stash, so get() and contains_key() check at most two buckets plus
+# the stash regardless of how full the table is. The public interface matches the
+# open addressing HashMap in hash_map_oa.py. The table resizes when the load factor
+# exceeds 0.5. When the two hash functions cannot place a key, the table is rehashed
+# using seeded variants of the same two functions.
+
+
+from DynamicArray_and_SinglyLinkedList import (DynamicArray, DynamicArrayException, HashEntry,
+                        hash_function_1, hash_function_2)
+
+
+# number of entries that may live in the stash before the table is rehashed
+STASH_SIZE = 4
+
+# maximum number of evictions attempted by a single insert before using the stash
+MAX_DISPLACEMENTS = 64
+
+# number of rehash attempts at the same capacity before the capacity is doubled
+MAX_REHASHES = 4
+
+
+def seeded_variant(function: callable, seed: int) -> callable:
+    """
+    Return a seeded variant of the given hash function. The result of the
+    original function is folded into a multiplicative string hash, so keys that
+    collide under the original function are spread out by the seed.
+    """
+    def seeded_hash(key: str) -> int:
+        hash = function(key) ^ seed
+        for letter in key:
+            hash = ((hash * 1000003) ^ ord(letter)) & 0xFFFFFFFFFFFFFFFF
+        return hash
+
+    return seeded_hash
+
+
+class HashMap:
+    def __init__(self,
+                 capacity: int,
+                 function: callable = hash_function_1,
+                 function_2: callable = hash_function_2) -> None:
+        """
+        Initialize new HashMap that uses
+        cuckoo hashing for collision resolution
+        """
+        # capacity must be a prime number
+        self._capacity = self._next_prime(capacity)
+        self._buckets = DynamicArray.filled(self._capacity, None)
+        self._stash = DynamicArray()
+
+        self._hash_function = function
+        self._hash_function_2 = function_2
+
+        # the functions currently used to choose buckets; replaced by seeded
+        # variants of the two hash functions whenever the table is rehashed
+        self._seed = 0
+        self._index_function_1 = function
+        self._index_function_2 = function_2
+
+        self._size = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._buckets.length()):
+            out += str(i) + ': ' + str(self._buckets[i]) + '\n'
+        out += 'stash: ' + str([str(self._stash[i]) for i in range(self._stash.length())]) + '\n'
+        return out
+
+    def _next_prime(self, capacity: int) -> int:
+        """
+        Increment from given number to find the closest prime number
+        """
+        if capacity % 2 == 0:
+            capacity += 1
+
+        while not self._is_prime(capacity):
+            capacity += 2
+
+        return capacity
+
+    @staticmethod
+    def _is_prime(capacity: int) -> bool:
+        """
+        Determine if given integer is a prime number and return boolean
+        """
+        if capacity == 2 or capacity == 3:
+            return True
+
+        if capacity == 1 or capacity % 2 == 0:
+            return False
+
+        factor = 3
+        while factor ** 2 <= capacity:
+            if capacity % factor == 0:
+                return False
+            factor += 2
+
+        return True
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _find_in_stash(self, key: str) -> int:
+        """
+        Returns the index of the stash entry with the given key, or -1 if the key
+        is not in the stash.
+
+        :complexity: O(1), the stash holds at most STASH_SIZE entries
+        """
+        for index in range(self._stash.length()):
+            if self._stash.get_unchecked(index).key == key:
+                return index
+        return -1
+
+    def _place(self, entry: HashEntry) -> HashEntry:
+        """
+        Places an entry whose key is not already in the table. If either candidate
+        bucket is empty the entry goes there; otherwise entries are evicted to their
+        alternate bucket until an empty bucket is found. An entry that still has no
+        bucket after MAX_DISPLACEMENTS evictions is moved to the stash.
+
+        :param entry: The HashEntry to place in the table.
+
+        :return: None if every entry found a home, otherwise the entry that could not
+                 be placed because the stash is full.
+
+        :complexity: Amortized O(1)
+        """
+        buckets = self._buckets
+        index = self._index_function_1(entry.key) % self._capacity
+        if buckets.get_unchecked(index) is None:
+            buckets.set_unchecked(index, entry)
+            return None
+
+        alternate = self._index_function_2(entry.key) % self._capacity
+        if buckets.get_unchecked(alternate) is None:
+            buckets.set_unchecked(alternate, entry)
+            return None
+
+        # both buckets are taken, so kick out the occupant of the first bucket
+        for _ in range(MAX_DISPLACEMENTS):
+            occupant = buckets.get_unchecked(index)
+            buckets.set_unchecked(index, entry)
+            if occupant is None:
+                return None
+
+            # the evicted entry moves to whichever of its buckets it was not in
+            entry = occupant
+            first = self._index_function_1(entry.key) % self._capacity
+            if first == index:
+                index = self._index_function_2(entry.key) % self._capacity
+            else:
+                index = first
+
+        if self._stash.length() < STASH_SIZE:
+            self._stash.append(entry)
+            return None
+
+        return entry
+
+    def _rehash(self, new_capacity: int, pending: HashEntry = None) -> None:
+        """
+        Rebuilds the table at the given capacity using fresh seeded variants of the
+        two hash functions until every entry (plus the pending entry, if any) has
+        been placed. After MAX_REHASHES failed attempts the capacity is doubled.
+
+        :param new_capacity: The prime capacity for the rebuilt table.
+        :param pending: An entry that is not currently stored in the table or stash.
+
+        :complexity: Expected O(n)
+        """
+        entries = self.get_entries()
+        if pending is not None:
+            entries.append(pending)
+
+        attempts = 0
+        while True:
+            self._capacity = new_capacity
+            self._buckets = DynamicArray.filled(self._capacity, None)
+            self._stash = DynamicArray()
+
+            placed = True
+            for index in range(entries.length()):
+                if self._place(entries.get_unchecked(index)) is not None:
+                    placed = False
+                    break
+            if placed:
+                return
+
+            # pick a new pair of hash functions and, if that keeps failing, grow
+            self._seed += 1
+            self._index_function_1 = seeded_variant(self._hash_function, self._seed * 0x9E3779B1)
+            self._index_function_2 = seeded_variant(self._hash_function_2, self._seed * 0x85EBCA77)
+            attempts += 1
+            if attempts % MAX_REHASHES == 0:
+                new_capacity = self._next_prime(new_capacity * 2)
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates the key/value pair in the hash map. If the given key already exists in
+        the hash map, its associated value is replaced with the new value. If the given
+        key is not in the hash map, a new key/value pair is added.
+
+        When method is called, if the current load factor of the table is greater than
+        or equal to 0.5, the table is resized to double its current capacity.
+
+        :param key: The key associated with the value to be inserted or updated in the hash map.
+        :param value: The value to be associated with the given key.
+
+        :post-conditions: The key/value pair is added to the hash map, or the existing key's
+            value is updated. If the load factor is >= 0.5, the hash map's capacity is increased
+            and elements are rehashed.
+
+        :complexity: Amortized O(1)
+        """
+        if self.table_load() >= 0.5:
+            self.resize_table(self._capacity * 2)
+
+        # if the key is already in one of its two buckets or the stash, replace the value
+        buckets = self._buckets
+        hash_entry = buckets.get_unchecked(self._index_function_1(key) % self._capacity)
+        if hash_entry is not None and hash_entry.key == key:
+            hash_entry.value = value
+            return
+
+        hash_entry = buckets.get_unchecked(self._index_function_2(key) % self._capacity)
+        if hash_entry is not None and hash_entry.key == key:
+            hash_entry.value = value
+            return
+
+        stash_index = self._find_in_stash(key)
+        if stash_index != -1:
+            self._stash.get_unchecked(stash_index).value = value
+            return
+
+        # otherwise place a new entry, rehashing if the table cannot hold it
+        self._size += 1
+        homeless = self._place(HashEntry(key, value))
+        if homeless is not None:
+            self._rehash(self._capacity, homeless)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the underlying table. All key/value pairs are
+        put into the new table. If new_capacity is not a prime number, it is
+        changed to the next highest prime number.
+
+        :validation: Checks that new_capacity is not less than the current number of elements
+                     in the hash map; if so, the method does nothing.
+
+        :param new_capacity: The new capacity for the hash table.
+
+        :post-condition: The hash map's capacity is updated to the first prime number greater
+                        than or equal to the input new_capacity (or larger, if the entries
+                        could not be placed at that capacity). All existing key/value pairs
+                        are rehashed into the new table.
+
+        :complexity: Expected O(n)
+        """
+        if new_capacity < 1 or new_capacity < self._size:
+            return
+
+        if self._is_prime(new_capacity) is False:
+            new_capacity = self._next_prime(new_capacity)
+
+        self._rehash(new_capacity)
+
+    def table_load(self) -> float:
+        """
+        Returns the current hash table load factor, which is the ratio
+        of the number of elements in the hash table to the current
+        capacity of the hash table.
+
+        :return: the load factor (float value) of the current hash table.
+
+        :complexity: O(1)
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets in the hash table.
+
+        :return: The number of empty buckets (as an integer) in the hash table.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        empty = 0
+        for index in range(self._capacity):
+            if self._buckets.get_unchecked(index) is None:
+                empty += 1
+        return empty
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value associated with the given key. If the key is not in the hash
+        map, the method returns None.
+
+        :param key: The key whose associated value is to be returned.
+
+        :return: The value associated with the given key, or None if the
+        key is not in the hash map.
+
+        :complexity: Worst case - O(1): two buckets and the stash
+        """
+        buckets = self._buckets
+        hash_entry = buckets.get_unchecked(self._index_function_1(key) % self._capacity)
+        if hash_entry is not None and hash_entry.key == key:
+            return hash_entry.value
+
+        hash_entry = buckets.get_unchecked(self._index_function_2(key) % self._capacity)
+        if hash_entry is not None and hash_entry.key == key:
+            return hash_entry.value
+
+        stash_index = self._find_in_stash(key)
+        if stash_index != -1:
+            return self._stash.get_unchecked(stash_index).value
+
+        return None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if the given key is in the hash map, otherwise it returns False.
+        An empty hash map does not contain any keys.
+
+        :param key: The key to check to see if it's in the hash map.
+
+        :return: True if the key is in the hash map, False otherwise.
+
+        :complexity: Worst case - O(1): two buckets and the stash
+        """
+        buckets = self._buckets
+        hash_entry = buckets.get_unchecked(self._index_function_1(key) % self._capacity)
+        if hash_entry is not None and hash_entry.key == key:
+            return True
+
+        hash_entry = buckets.get_unchecked(self._index_function_2(key) % self._capacity)
+        if hash_entry is not None and hash_entry.key == key:
+            return True
+
+        return self._find_in_stash(key) != -1
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the given key and its associated value from the hash map.
+        If the key is not in the hash map, the method does nothing. Cuckoo
+        hashing never probes past a key's two buckets, so no tombstone is needed.
+
+        :param key: The key for the key/value pair to be removed from the hash map.
+
+        :post-conditions: The key, given it is actually in the hash map, and its associated
+        value are removed from the hash table. If key is not in hash table, there is no change.
+
+        :complexity: Worst case - O(1)
+        """
+        buckets = self._buckets
+        index = self._index_function_1(key) % self._capacity
+        hash_entry = buckets.get_unchecked(index)
+        if hash_entry is None or hash_entry.key != key:
+            index = self._index_function_2(key) % self._capacity
+            hash_entry = buckets.get_unchecked(index)
+
+        if hash_entry is not None and hash_entry.key == key:
+            buckets.set_unchecked(index, None)
+            self._size -= 1
+            return
+
+        # move the last stash entry into the removed entry's spot
+        stash_index = self._find_in_stash(key)
+        if stash_index != -1:
+            last = self._stash.pop()
+            if stash_index < self._stash.length():
+                self._stash.set_unchecked(stash_index, last)
+            self._size -= 1
+
+    def get_entries(self) -> DynamicArray:
+        """
+        Returns a dynamic array of every HashEntry in the table and the stash.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        entries = DynamicArray()
+        for index in range(self._capacity):
+            hash_entry = self._buckets.get_unchecked(index)
+            if hash_entry is not None:
+                entries.append(hash_entry)
+        for index in range(self._stash.length()):
+            entries.append(self._stash.get_unchecked(index))
+        return entries
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a dynamic array where each index contains a tuple of a key/value pair
+        stored in the hash map. The order of the keys in the dynamic array does not matter.
+
+        :return: A DynamicArray containing tuples of key/value pairs from the hash map.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        entries = self.get_entries()
+        new_array = DynamicArray()
+        for index in range(entries.length()):
+            hash_entry = entries.get_unchecked(index)
+            new_array.append((hash_entry.key, hash_entry.value))
+        return new_array
+
+    def clear(self) -> None:
+        """
+        Clears the contents of the hash map.
+
+        :post-conditions: All key/value pairs are removed form the hash map.
+        The underlying hash table capacity remains unchanged.
+
+        :complexity: O(n)
+        """
+        self._buckets = DynamicArray.filled(self._capacity, None)
+        self._stash = DynamicArray()
+        self._size = 0
+
+    def __iter__(self):
+        """
+        This method enables the hash map to iterate across itself, visiting the
+        table and then the stash.
+
+        :return: The hash map itself as an iterator.
+
+        :complexity: O(1)
+        """
+        self._index = 0
+        return self
+
+    def __next__(self):
+        """
+        Returns the next HashEntry in the hash map during iteration. If there are no more
+        elements to iterate over, it raises StopIteration.
+
+        :return: The next HashEntry in the hash map.
+
+        :raises StopIteration: If there are no more elements to iterate over.
+        """
+        try:
+            while self._index < self._capacity:
+                current = self._buckets[self._index]
+                self._index += 1
+                if current is not None:
+                    return current
+
+            current = self._stash[self._index - self._capacity]
+            self._index += 1
+            return current
+        except DynamicArrayException:
+            raise StopIteration
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput example 1")
+    print("-------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nput example 2")
+    print("-------------")
+    m = HashMap(41, hash_function_2)
+    for i in range(50):
+        m.put('str' + str(i // 3), i * 100)
+        if i % 10 == 9:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nresize example")
+    print("--------------")
+    m = HashMap(75, hash_function_2)
+    keys = [i for i in range(25, 1000, 13)]
+    for key in keys:
+        m.put(str(key), key * 42)
+    print(m.get_size(), m.get_capacity())
+
+    for capacity in range(111, 1000, 117):
+        m.resize_table(capacity)
+
+        m.put('some key', 'some value')
+        result = m.contains_key('some key')
+        m.remove('some key')
+
+        for key in keys:
+            # all inserted keys must be present
+            result &= m.contains_key(str(key))
+            # NOT inserted keys must be absent
+            result &= not m.contains_key(str(key + 1))
+        print(capacity, result, m.get_size(), m.get_capacity(), round(m.table_load(), 2))
+
+    print("\nget / remove example")
+    print("--------------------")
+    m = HashMap(31, hash_function_1)
+    for i in range(1000):
+        m.put('key' + str(i), i)
+    result = True
+    for i in range(1000):
+        result &= m.get('key' + str(i)) == i
+    for i in range(0, 1000, 2):
+        m.remove('key' + str(i))
+    for i in range(1000):
+        result &= m.contains_key('key' + str(i)) == (i % 2 == 1)
+    print(result, m.get_size(), m.get_capacity())
+
+    print("\n__iter__(), __next__() example")
+    print("------------------------------")
+    m = HashMap(10, hash_function_2)
+    for i in range(5):
+        m.put(str(i), str(i * 24))
+    m.remove('0')
+    m.remove('4')
+    for item in m:
+        print('K:', item.key, 'V:', item.value)
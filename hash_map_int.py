@@ -0,0 +1,427 @@
+# Description: Implementation of an open addressing HashMap class specialized for
+# 64-bit integer keys. Keys are stored in a typed array('q') buffer and, optionally,
+# float values in an array('d') buffer, so the table holds no per-key Python objects
+# and never converts IDs to strings. Bucket states (empty, full, tombstone) live in
+# a parallel bytearray. Keys are spread with an integer mixing hash instead of the
+# character-loop hash functions, and collisions are resolved with linear probing.
+# The public interface matches the open addressing HashMap in hash_map_oa.py,
+# including a table resize when the load factor reaches 0.5.
+
+
+from array import array
+
+from DynamicArray_and_SinglyLinkedList import DynamicArray, HashEntry
+
+
+# bucket states
+EMPTY = 0
+FULL = 1
+TOMBSTONE = 2
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def hash_int(key: int) -> int:
+    """
+    Integer mixing hash (the SplitMix64 finalizer). Every bit of the key affects
+    every bit of the result, so sequential IDs are spread across the table.
+    """
+    key &= 0xFFFFFFFFFFFFFFFF
+    key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return key ^ (key >> 31)
+
+
+class HashMap:
+    def __init__(self,
+                 capacity: int = 11,
+                 function: callable = hash_int,
+                 float_values: bool = False) -> None:
+        """
+        Initialize new HashMap for integer keys that uses
+        linear probing for collision resolution. If float_values
+        is True, values are stored in a typed array of doubles.
+        """
+        self._hash_function = function
+        self._float_values = float_values
+        self._allocate(self._next_prime(capacity))
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._capacity):
+            if self._states[i] == FULL:
+                out += str(i) + ': ' + str(self._keys[i]) + ': ' + str(self._values[i]) + '\n'
+            else:
+                out += str(i) + ': None\n'
+        return out
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replace the table with an empty one of the given (prime) capacity.
+        """
+        self._capacity = capacity
+        self._states = bytearray(capacity)
+        self._keys = array('q', [0]) * capacity
+        if self._float_values:
+            self._values = array('d', [0.0]) * capacity
+        else:
+            self._values = DynamicArray.filled(capacity, None)
+        self._size = 0
+        self._tombstones = 0
+
+    def _next_prime(self, capacity: int) -> int:
+        """
+        Increment from given number to find the closest prime number
+        """
+        if capacity % 2 == 0:
+            capacity += 1
+
+        while not self._is_prime(capacity):
+            capacity += 2
+
+        return capacity
+
+    @staticmethod
+    def _is_prime(capacity: int) -> bool:
+        """
+        Determine if given integer is a prime number and return boolean
+        """
+        if capacity == 2 or capacity == 3:
+            return True
+
+        if capacity == 1 or capacity % 2 == 0:
+            return False
+
+        factor = 3
+        while factor ** 2 <= capacity:
+            if capacity % factor == 0:
+                return False
+            factor += 2
+
+        return True
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _find_index(self, key: int) -> int:
+        """
+        Follows the linear probe sequence for the given key until the key or an
+        empty bucket is found.
+
+        :param key: The key to look for.
+
+        :return: The index of the bucket holding the key, or -1 if the key is not in the hash map.
+
+        :complexity: Average case - O(1)
+        """
+        capacity = self._capacity
+        states = self._states
+        keys = self._keys
+        index = self._hash_function(key) % capacity
+
+        for _ in range(capacity):
+            state = states[index]
+            if state == EMPTY:
+                return -1
+            if state == FULL and keys[index] == key:
+                return index
+            index += 1
+            if index == capacity:
+                index = 0
+
+        return -1
+
+    def put(self, key: int, value: object) -> None:
+        """
+        Updates the key/value pair in the hash map. If the given key already exists in
+        the hash map, its associated value is replaced with the new value. If the given
+        key is not in the hash map, a new key/value pair is added.
+
+        When method is called, if the full buckets and tombstones make up half or more of
+        the table, the table is resized to double its current capacity (or rebuilt at the
+        same capacity if most of those buckets are tombstones).
+
+        :param key: A 64-bit signed integer key.
+        :param value: The value to be associated with the given key (a float if the map
+                      stores float values).
+
+        :raises OverflowError: If the key does not fit in 64 bits.
+
+        :post-conditions: The key/value pair is added to the hash map, or the existing key's
+            value is updated.
+
+        :complexity: Average case - O(1)
+        """
+        if key < INT64_MIN or key > INT64_MAX:
+            raise OverflowError('HashMap keys must fit in a signed 64-bit integer')
+
+        # rebuild in place when tombstones dominate, otherwise grow
+        if (self._size + self._tombstones) / self._capacity >= 0.5:
+            if self._tombstones > self._size:
+                self.resize_table(self._capacity)
+            else:
+                self.resize_table(self._capacity * 2)
+
+        capacity = self._capacity
+        states = self._states
+        keys = self._keys
+        index = self._hash_function(key) % capacity
+        available = -1      # first empty bucket or tombstone along the probe sequence
+
+        for _ in range(capacity):
+            state = states[index]
+            if state == EMPTY:
+                if available == -1:
+                    available = index
+                break
+            if state == TOMBSTONE:
+                if available == -1:
+                    available = index
+            elif keys[index] == key:
+                self._values[index] = value
+                return
+            index += 1
+            if index == capacity:
+                index = 0
+
+        if states[available] == TOMBSTONE:
+            self._tombstones -= 1
+        states[available] = FULL
+        keys[available] = key
+        self._values[available] = value
+        self._size += 1
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the underlying table. All key/value pairs are put into
+        the new table and tombstones are discarded. If new_capacity is not a prime number,
+        it is changed to the next highest prime number.
+
+        :validation: Checks that new_capacity is not less than the current number of elements
+                     in the hash map; if so, the method does nothing.
+
+        :param new_capacity: The new capacity for the hash table.
+
+        :complexity: O(n)
+        """
+        if new_capacity < 1 or new_capacity < self._size:
+            return
+
+        old_capacity = self._capacity
+        old_states = self._states
+        old_keys = self._keys
+        old_values = self._values
+
+        self._allocate(self._next_prime(new_capacity))
+        capacity = self._capacity
+        states = self._states
+        keys = self._keys
+        values = self._values
+
+        # the keys are known to be distinct, so each one only needs an empty bucket
+        for old_index in range(old_capacity):
+            if old_states[old_index] != FULL:
+                continue
+            key = old_keys[old_index]
+            index = self._hash_function(key) % capacity
+            while states[index] != EMPTY:
+                index += 1
+                if index == capacity:
+                    index = 0
+            states[index] = FULL
+            keys[index] = key
+            values[index] = old_values[old_index]
+            self._size += 1
+
+    def table_load(self) -> float:
+        """
+        Returns the current hash table load factor, which is the ratio
+        of the number of elements in the hash table to the current
+        capacity of the hash table.
+
+        :return: the load factor (float value) of the current hash table.
+
+        :complexity: O(1)
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets (including tombstones) in the hash table.
+
+        :return: The number of empty buckets (as an integer) in the hash table.
+
+        :complexity: O(1)
+        """
+        return self._capacity - self._size
+
+    def get(self, key: int) -> object:
+        """
+        Returns the value associated with the given key. If the key is not in the hash
+        map, the method returns None.
+
+        :param key: The key whose associated value is to be returned.
+
+        :return: The value associated with the given key, or None if the
+        key is not in the hash map.
+
+        :complexity: Average case - O(1)
+        """
+        index = self._find_index(key)
+        if index == -1:
+            return None
+        return self._values[index]
+
+    def contains_key(self, key: int) -> bool:
+        """
+        Returns True if the given key is in the hash map, otherwise it returns False.
+
+        :param key: The key to check to see if it's in the hash map.
+
+        :return: True if the key is in the hash map, False otherwise.
+
+        :complexity: Average case - O(1)
+        """
+        return self._find_index(key) != -1
+
+    def remove(self, key: int) -> None:
+        """
+        Removes the given key and its associated value from the hash map.
+        If the key is not in the hash map, the method does nothing.
+
+        :param key: The key for the key/value pair to be removed from the hash map.
+
+        :post-conditions: The key, given it is actually in the hash map, and its associated
+        value are removed from the hash table. If key is not in hash table, there is no change.
+
+        :complexity: Average case - O(1)
+        """
+        index = self._find_index(key)
+        if index == -1:
+            return
+
+        self._states[index] = TOMBSTONE
+        if not self._float_values:
+            self._values[index] = None
+        self._size -= 1
+        self._tombstones += 1
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a dynamic array where each index contains a tuple of a key/value pair
+        stored in the hash map. The order of the keys in the dynamic array does not matter.
+
+        :return: A DynamicArray containing tuples of key/value pairs from the hash map.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        new_array = DynamicArray()
+        for index in range(self._capacity):
+            if self._states[index] == FULL:
+                new_array.append((self._keys[index], self._values[index]))
+        return new_array
+
+    def clear(self) -> None:
+        """
+        Clears the contents of the hash map.
+
+        :post-conditions: All key/value pairs are removed form the hash map.
+        The underlying hash table capacity remains unchanged.
+
+        :complexity: O(n)
+        """
+        self._allocate(self._capacity)
+
+    def __iter__(self):
+        """
+        This method enables the hash map to iterate across itself.
+
+        :return: The hash map itself as an iterator.
+
+        :complexity: O(1)
+        """
+        self._index = 0
+        return self
+
+    def __next__(self):
+        """
+        Returns the next key/value pair in the hash map during iteration, as a HashEntry.
+        If there are no more elements to iterate over, it raises StopIteration.
+
+        :return: A HashEntry holding the next key/value pair in the hash map.
+
+        :raises StopIteration: If there are no more elements to iterate over.
+        """
+        while self._index < self._capacity:
+            index = self._index
+            self._index += 1
+            if self._states[index] == FULL:
+                return HashEntry(self._keys[index], self._values[index])
+
+        raise StopIteration
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput example")
+    print("-----------")
+    m = HashMap(53)
+    for i in range(150):
+        m.put(i * 1000003, i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nget / contains_key / remove example")
+    print("-----------------------------------")
+    m = HashMap()
+    ids = [(i * 2654435761) % 2 ** 63 - 2 ** 62 for i in range(5000)]
+    for key in ids:
+        m.put(key, key // 7)
+    result = True
+    for key in ids:
+        result &= m.get(key) == key // 7
+        result &= not m.contains_key(key + 1)
+    for key in ids[::2]:
+        m.remove(key)
+    for index, key in enumerate(ids):
+        result &= m.contains_key(key) == (index % 2 == 1)
+    print(result, m.get_size(), m.get_capacity())
+
+    print("\nfloat values example")
+    print("--------------------")
+    m = HashMap(11, float_values=True)
+    for i in range(10):
+        m.put(i, i / 4)
+    m.put(3, -1.5)
+    print(m.get(3), m.get(8), m.get(42), m.get_size())
+    m.resize_table(100)
+    print(m.get_keys_and_values().length(), m.get_capacity())
+    m.clear()
+    print(m.get_size(), m.get_capacity())
+
+    print("\n__iter__(), __next__() example")
+    print("------------------------------")
+    m = HashMap(10)
+    for i in range(5):
+        m.put(i, str(i * 24))
+    m.remove(0)
+    m.remove(4)
+    for item in sorted((item.key, item.value) for item in m):
+        print('K:', item[0], 'V:', item[1])
@@ -0,0 +1,512 @@
+# Description: Implementation of an open addressing HashMap class for 64-bit integer
+# keys whose table lives in NumPy arrays (bucket states, keys and values), built for
+# looking up or inserting a whole column of keys at once. lookup_batch() and
+# insert_batch() hash every key in one vectorized operation and then probe all keys
+# together in rounds: each round compares every pending key with the bucket it has
+# reached, resolves the keys that hit (or reach an empty bucket), and moves the rest one
+# bucket along. Keys are spread with the same integer mixing hash as hash_map_int.py,
+# and collisions are resolved with linear probing at a load factor of at most 0.5.
+# The single-key methods match the interface of hash_map_int.py, but each runs as a
+# batch of one, so this map pays off only for batches. Requires NumPy.
+
+
+import numpy as np
+
+import rehash
+from DynamicArray_and_SinglyLinkedList import DynamicArray, HashEntry
+from hash_map_int import EMPTY, FULL, TOMBSTONE, hash_int
+
+
+# SplitMix64 finalizer constants, as used by hash_int
+MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def hash_keys(keys):
+    """
+    Return hash_int() of every key of an int64 array, as a uint64 array.
+
+    :complexity: O(n)
+    """
+    mixed = keys.view(np.uint64)
+    mixed = (mixed ^ (mixed >> np.uint64(30))) * MIX_1
+    mixed = (mixed ^ (mixed >> np.uint64(27))) * MIX_2
+    return mixed ^ (mixed >> np.uint64(31))
+
+
+class HashMap:
+    def __init__(self,
+                 capacity: int = 11,
+                 value_dtype=np.float64) -> None:
+        """
+        Initialize new HashMap for integer keys that stores its table in NumPy arrays
+        and uses linear probing for collision resolution. Values are stored in an
+        array of value_dtype (use object to store arbitrary values). Keys must be
+        integers that fit in a signed 64-bit integer; every method raises TypeError
+        for any other key rather than truncating it.
+        """
+        self._value_dtype = np.dtype(value_dtype)
+        self._allocate(self._next_prime(capacity))
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._capacity):
+            if self._states[i] == FULL:
+                out += str(i) + ': ' + str(self._keys[i]) + ': ' + str(self._values[i]) + '\n'
+            else:
+                out += str(i) + ': None\n'
+        return out
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replace the table with an empty one of the given (prime) capacity.
+        """
+        self._capacity = capacity
+        self._states = np.zeros(capacity, dtype=np.uint8)
+        self._keys = np.zeros(capacity, dtype=np.int64)
+        self._values = self._empty_values(capacity)
+        self._size = 0
+        self._tombstones = 0
+
+    def _empty_values(self, count: int):
+        """
+        Return an array of count values of the map's value type: zeros, or None for
+        object values.
+        """
+        if self._value_dtype == object:
+            return np.full(count, None, dtype=object)
+        return np.zeros(count, dtype=self._value_dtype)
+
+    def _value_at(self, index: int) -> object:
+        """
+        Return the value in the bucket at index as a Python object.
+        """
+        if self._value_dtype == object:
+            return self._values[index]
+        return self._values[index].item()
+
+    def _next_prime(self, capacity: int) -> int:
+        """
+        Increment from given number to find the closest prime number
+        """
+        if capacity % 2 == 0:
+            capacity += 1
+
+        while not self._is_prime(capacity):
+            capacity += 2
+
+        return capacity
+
+    @staticmethod
+    def _is_prime(capacity: int) -> bool:
+        """
+        Determine if given integer is a prime number and return boolean
+        """
+        if capacity == 2 or capacity == 3:
+            return True
+
+        if capacity == 1 or capacity % 2 == 0:
+            return False
+
+        factor = 3
+        while factor ** 2 <= capacity:
+            if capacity % factor == 0:
+                return False
+            factor += 2
+
+        return True
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _home_buckets(self, keys):
+        """
+        Return the bucket at which the probe sequence of each key starts.
+
+        :complexity: O(n)
+        """
+        return (hash_keys(keys) % np.uint64(self._capacity)).astype(np.int64)
+
+    def _locate(self, keys):
+        """
+        Follows the linear probe sequences of all the given keys together, one bucket
+        per round, until each key is found or reaches an empty bucket.
+
+        :param keys: An int64 array of keys.
+
+        :return: An array holding, for each key, the index of the bucket holding it,
+                 or -1 if the key is not in the hash map.
+
+        :complexity: Average case - O(n)
+        """
+        capacity = self._capacity
+        states = self._states
+        table_keys = self._keys
+
+        located = np.full(keys.size, -1, dtype=np.int64)
+        buckets = self._home_buckets(keys)
+        pending = np.arange(keys.size)
+
+        for _ in range(capacity):
+            if pending.size == 0:
+                break
+
+            # resolve the keys that hit, drop the keys that reached an empty bucket
+            current = buckets[pending]
+            state = states[current]
+            hit = (state == FULL) & (table_keys[current] == keys[pending])
+            located[pending[hit]] = current[hit]
+
+            moving = ~hit & (state != EMPTY)
+            pending = pending[moving]
+            buckets[pending] = (current[moving] + 1) % capacity
+
+        return located
+
+    @staticmethod
+    def _key_array(keys):
+        """
+        Return the keys as an int64 array. Only integer (or boolean) keys are accepted:
+        a float key is rejected rather than truncated, and an unsigned key of 2 ** 63 or
+        more is rejected rather than wrapped around.
+
+        :raises TypeError: If a key is not an integer.
+        :raises OverflowError: If a key does not fit in a signed 64-bit integer.
+        """
+        keys = np.asarray(keys)
+        if keys.size == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Python ints too large for any NumPy integer type end up in an object array
+        if keys.dtype.kind == 'O':
+            if not all(isinstance(key, int) for key in keys.flat):
+                raise TypeError('keys must be integers')
+            return np.array(keys.ravel(), dtype=np.int64)
+
+        if keys.dtype.kind not in 'biu':
+            raise TypeError(f'keys must be integers, not {keys.dtype}')
+        if keys.dtype == np.uint64:
+            if keys.max() >= 2 ** 63:
+                raise OverflowError('key does not fit in a signed 64-bit integer')
+            return keys.astype(np.int64).ravel()
+        return keys.astype(np.int64, casting='safe').ravel()
+
+    def lookup_batch(self, keys) -> tuple:
+        """
+        Looks up every key of an array (or sequence) of integer keys at once.
+
+        :param keys: The keys to look up, of an integer dtype or Python ints.
+
+        :return: A tuple (values, found): an array with the value of each key (zero,
+                 or None for object values, where the key is missing) and a boolean
+                 array that is True where the key is in the hash map.
+
+        :raises TypeError: If a key is not an integer.
+        :raises OverflowError: If a key does not fit in a signed 64-bit integer.
+
+        :complexity: Average case - O(n), in a few vectorized rounds
+        """
+        keys = self._key_array(keys)
+        located = self._locate(keys)
+        found = located != -1
+
+        values = self._empty_values(keys.size)
+        values[found] = self._values[located[found]]
+        return values, found
+
+    def contains_batch(self, keys):
+        """
+        Returns a boolean array that is True where the key is in the hash map.
+
+        :raises TypeError: If a key is not an integer.
+        :raises OverflowError: If a key does not fit in a signed 64-bit integer.
+
+        :complexity: Average case - O(n), in a few vectorized rounds
+        """
+        return self._locate(self._key_array(keys)) != -1
+
+    def insert_batch(self, keys, values) -> None:
+        """
+        Puts every key/value pair of two arrays (or sequences) into the hash map at
+        once, with the same result as calling put() for each pair in order: a key that
+        appears more than once ends up with its last value.
+
+        The table is first grown, if needed, so that it stays at most half full even
+        if every key is new. Existing keys are updated in place, and the new keys are
+        placed together in rounds: the first new key to reach an empty bucket or a
+        tombstone claims it, and the rest move one bucket along.
+
+        :param keys: The keys to put, of an integer dtype or Python ints.
+        :param values: The value of each key.
+
+        :raises TypeError: If a key is not an integer.
+        :raises OverflowError: If a key does not fit in a signed 64-bit integer.
+        :raises ValueError: If keys and values differ in length.
+
+        :complexity: Average case - O(n log n), in a few vectorized rounds
+        """
+        keys = self._key_array(keys)
+        values = np.asarray(values, dtype=self._value_dtype).ravel()
+        if keys.size != values.size:
+            raise ValueError('insert_batch needs one value per key')
+
+        # keep only the last occurrence of each key
+        unique_keys, last = np.unique(keys[::-1], return_index=True)
+        values = values[::-1][last]
+        keys = unique_keys
+
+        # rebuild in place when tombstones dominate, otherwise grow
+        if (self._size + self._tombstones + keys.size) / self._capacity >= 0.5:
+            if self._tombstones > self._size + keys.size:
+                self.resize_table(self._capacity)
+            else:
+                self.resize_table(max(self._capacity * 2, 2 * (self._size + keys.size) + 1))
+
+        located = self._locate(keys)
+        found = located != -1
+        self._values[located[found]] = values[found]
+
+        new = ~found
+        if not new.any():
+            return
+        keys, values = keys[new], values[new]
+
+        # tombstones are free buckets for keys known not to be in the table
+        occupied = self._states == FULL
+        buckets = rehash.place_open_addressing(self._home_buckets(keys), 1, 0, self._capacity, occupied)
+        self._tombstones -= int(np.count_nonzero(self._states[buckets] == TOMBSTONE))
+        self._states[buckets] = FULL
+        self._keys[buckets] = keys
+        self._values[buckets] = values
+        self._size += keys.size
+
+    def put(self, key: int, value: object) -> None:
+        """
+        Updates the key/value pair in the hash map. If the given key already exists in
+        the hash map, its associated value is replaced with the new value. If the given
+        key is not in the hash map, a new key/value pair is added.
+
+        :param key: A 64-bit signed integer key.
+        :param value: The value to be associated with the given key.
+
+        :raises TypeError: If the key is not an integer.
+        :raises OverflowError: If the key does not fit in a signed 64-bit integer.
+
+        :complexity: Average case - O(1)
+        """
+        values = np.empty(1, dtype=self._value_dtype)
+        values[0] = value
+        self.insert_batch([key], values)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the underlying table. All key/value pairs are put into
+        the new table and tombstones are discarded. If new_capacity is not a prime number,
+        it is changed to the next highest prime number.
+
+        :validation: Checks that new_capacity is not less than the current number of elements
+                     in the hash map; if so, the method does nothing.
+
+        :param new_capacity: The new capacity for the hash table.
+
+        :complexity: O(n log n), in a few vectorized rounds
+        """
+        if new_capacity < 1 or new_capacity < self._size:
+            return
+
+        full = self._states == FULL
+        keys = self._keys[full]
+        values = self._values[full]
+
+        self._allocate(self._next_prime(new_capacity))
+
+        # the keys are known to be distinct, so each one only needs an empty bucket
+        buckets = rehash.place_open_addressing(self._home_buckets(keys), 1, 0, self._capacity)
+        self._states[buckets] = FULL
+        self._keys[buckets] = keys
+        self._values[buckets] = values
+        self._size = keys.size
+
+    def table_load(self) -> float:
+        """
+        Returns the current hash table load factor, which is the ratio
+        of the number of elements in the hash table to the current
+        capacity of the hash table.
+
+        :return: the load factor (float value) of the current hash table.
+
+        :complexity: O(1)
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets (including tombstones) in the hash table.
+
+        :return: The number of empty buckets (as an integer) in the hash table.
+
+        :complexity: O(1)
+        """
+        return self._capacity - self._size
+
+    def get(self, key: int) -> object:
+        """
+        Returns the value associated with the given key. If the key is not in the hash
+        map, the method returns None.
+
+        :param key: The key whose associated value is to be returned.
+
+        :return: The value associated with the given key, or None if the
+        key is not in the hash map.
+
+        :complexity: Average case - O(1)
+        """
+        index = int(self._locate(self._key_array([key]))[0])
+        if index == -1:
+            return None
+        return self._value_at(index)
+
+    def contains_key(self, key: int) -> bool:
+        """
+        Returns True if the given key is in the hash map, otherwise it returns False.
+
+        :param key: The key to check to see if it's in the hash map.
+
+        :return: True if the key is in the hash map, False otherwise.
+
+        :complexity: Average case - O(1)
+        """
+        return bool(self.contains_batch([key])[0])
+
+    def remove(self, key: int) -> None:
+        """
+        Removes the given key and its associated value from the hash map.
+        If the key is not in the hash map, the method does nothing.
+
+        :param key: The key for the key/value pair to be removed from the hash map.
+
+        :complexity: Average case - O(1)
+        """
+        index = int(self._locate(self._key_array([key]))[0])
+        if index == -1:
+            return
+
+        self._states[index] = TOMBSTONE
+        if self._value_dtype == object:
+            self._values[index] = None
+        self._size -= 1
+        self._tombstones += 1
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a dynamic array where each index contains a tuple of a key/value pair
+        stored in the hash map. The order of the keys in the dynamic array does not matter.
+
+        :return: A DynamicArray containing tuples of key/value pairs from the hash map.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        full = self._states == FULL
+        return DynamicArray.from_list(list(zip(self._keys[full].tolist(), self._values[full].tolist())))
+
+    def clear(self) -> None:
+        """
+        Clears the contents of the hash map.
+
+        :post-conditions: All key/value pairs are removed form the hash map.
+        The underlying hash table capacity remains unchanged.
+
+        :complexity: O(n)
+        """
+        self._allocate(self._capacity)
+
+    def __iter__(self):
+        """
+        This method enables the hash map to iterate across itself.
+
+        :return: The hash map itself as an iterator.
+
+        :complexity: O(1)
+        """
+        self._index = 0
+        return self
+
+    def __next__(self):
+        """
+        Returns the next key/value pair in the hash map during iteration, as a HashEntry.
+        If there are no more elements to iterate over, it raises StopIteration.
+
+        :return: A HashEntry holding the next key/value pair in the hash map.
+
+        :raises StopIteration: If there are no more elements to iterate over.
+        """
+        while self._index < self._capacity:
+            index = self._index
+            self._index += 1
+            if self._states[index] == FULL:
+                return HashEntry(int(self._keys[index]), self._value_at(index))
+
+        raise StopIteration
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput example")
+    print("-----------")
+    m = HashMap(53)
+    for i in range(150):
+        m.put(i * 1000003, i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nbatch example")
+    print("-------------")
+    m = HashMap()
+    ids = np.array([(i * 2654435761) % 2 ** 63 - 2 ** 62 for i in range(5000)], dtype=np.int64)
+    m.insert_batch(ids, ids // 7)
+    values, found = m.lookup_batch(ids)
+    result = bool(found.all()) and bool((values == ids // 7).all())
+    result &= not m.contains_batch(ids + 1).any()
+    for key in ids[::2].tolist():
+        m.remove(key)
+    found = m.contains_batch(ids)
+    result &= bool((found == (np.arange(ids.size) % 2 == 1)).all())
+    print(result, m.get_size(), m.get_capacity())
+    print(hash_keys(ids[:3]).tolist() == [hash_int(key) for key in ids[:3].tolist()])
+
+    print("\nobject values example")
+    print("---------------------")
+    m = HashMap(11, value_dtype=object)
+    m.insert_batch([1, 2, 3, 2], ['one', 'two', 'three', 'TWO'])
+    m.put(4, 'four')
+    print(m.get(2), m.get(4), m.get(5), m.get_size())
+    m.resize_table(100)
+    print(m.get_keys_and_values().length(), m.get_capacity())
+    m.clear()
+    print(m.get_size(), m.get_capacity())
+
+    print("\n__iter__(), __next__() example")
+    print("------------------------------")
+    m = HashMap(10)
+    for i in range(5):
+        m.put(i, i * 24)
+    m.remove(0)
+    m.remove(4)
+    for item in sorted((item.key, item.value) for item in m):
+        print('K:', item[0], 'V:', item[1])
@@ -9,41 +9,116 @@
 # checking, and removing key/value pairs, as well as clearing the hash map.
 # It also includes the dunder methods __iter__() and __next__() to facilitate
 # iteration through the HashMap. The table resizes when the load factor exceeds
-# 0.5 to maintain performance. This implementation makes use of the pre-written
-# DynamicArray and HashEntry classes in a6_include.py. The number of objects stored
-# in the hash map will be between 0 and 1,000,000 inclusive. Additionally, two
-# pre-written hash functions are provided in the skeleton code.
+# 0.5 to maintain performance (the threshold, growth factor and an optional shrink
+# threshold can be set per map, or tuned automatically toward a target probe
+# length). This implementation makes use of the pre-written DynamicArray and
+# HashEntry classes in a6_include.py. The number of objects stored in the hash map
+# will be between 0 and 1,000,000 inclusive. Additionally, two pre-written hash
+# functions are provided in the skeleton code. The probing strategy is selectable:
+# linear probing, quadratic probing (the default), or double hashing with
+# hash_function_2 as the step.
 
 
 from DynamicArray_and_SinglyLinkedList import (DynamicArray, DynamicArrayException, HashEntry,
                         hash_function_1, hash_function_2)
+import rehash
+from bloom_filter import CountingBloomFilter
+from skip_list import SkipList
+
+
+# maps start by storing up to this many entries in a flat array, without hashing
+SMALL_MAP_SIZE = 8
+
+# bounds for the max load factor chosen by auto-tuning
+MIN_TUNED_LOAD_FACTOR = 0.25
+MAX_TUNED_LOAD_FACTOR = 0.9
+
+
+# Probing strategies: each returns the (step, increment) pair for a key's probe
+# sequence, so that every probe moves index = (index + step) % capacity and then
+# step += increment.
+
+def linear_probing(key: str, capacity: int) -> tuple[int, int]:
+    """Probe consecutive buckets; the most cache-friendly sequence."""
+    return 1, 0
+
+
+def quadratic_probing(key: str, capacity: int) -> tuple[int, int]:
+    """Probe at offsets 1, 4, 9, ... from the initial index (the default)."""
+    return 1, 2
+
+
+def double_hashing(key: str, capacity: int) -> tuple[int, int]:
+    """
+    Probe with a fixed step taken from hash_function_2. The step is between 1 and
+    capacity - 1, so with a prime capacity the sequence visits every bucket.
+    """
+    return 1 + hash_function_2(key) % (capacity - 1), 0
 
 
 class HashMap:
-    def __init__(self, capacity: int, function) -> None:
+    def __init__(self,
+                 capacity: int,
+                 function,
+                 bloom_filter: bool = False,
+                 probing: callable = None,
+                 ordered: bool = False,
+                 max_load_factor: float = 0.5,
+                 growth_factor: float = 2.0,
+                 min_load_factor: float = 0.0,
+                 target_probe_length: float = None,
+                 small_map_size: int = SMALL_MAP_SIZE,
+                 resize_threads: int = 1) -> None:
         """
-        Initialize new HashMap that uses
-        quadratic probing for collision resolution
-        DO NOT CHANGE THIS METHOD IN ANY WAY (pre-written by professor)
+        Initialize new HashMap that uses open addressing for collision resolution,
+        with quadratic probing unless another probing strategy is given.
+        If bloom_filter is True, a counting Bloom filter answers definite misses.
+        If ordered is True, a skip list of the keys supports sorted and range queries.
+        The table grows by growth_factor when its load factor reaches max_load_factor,
+        and shrinks (never below its initial capacity) when a removal leaves it below
+        min_load_factor. If target_probe_length is given, max_load_factor is retuned
+        at every growth from the measured average probe length.
+        Up to small_map_size entries are kept in a flat array and found by comparing
+        keys, without hashing; the table is allocated when the map grows past that.
+        Resizes of large tables compute the new buckets with NumPy when it is installed,
+        splitting the work across resize_threads threads.
         """
-        self._buckets = DynamicArray()
+        self._check_load_factors(max_load_factor, growth_factor, min_load_factor)
+        if max_load_factor >= 1:
+            raise ValueError('max_load_factor must be less than 1 for open addressing')
 
         # capacity must be a prime number
         self._capacity = self._next_prime(capacity)
-        for _ in range(self._capacity):
-            self._buckets.append(None)
+        self._small_map_size = small_map_size
+        self._resize_threads = resize_threads
+        self._allocate_storage()
 
         self._hash_function = function
+        self._probing = probing if probing is not None else quadratic_probing
         self._size = 0
 
+        self._max_load_factor = max_load_factor
+        self._growth_factor = growth_factor
+        self._min_load_factor = min_load_factor
+        self._target_probe_length = target_probe_length
+        self._min_capacity = self._capacity
+
+        # sized for the most entries the table holds before it resizes
+        self._bloom = CountingBloomFilter(self._bloom_capacity()) if bloom_filter else None
+
+        # ordered index of the keys, kept alongside the table
+        self._ordered = SkipList() if ordered else None
+
     def __str__(self) -> str:
         """
         Override string method to provide more readable output
-        DO NOT CHANGE THIS METHOD IN ANY WAY (pre-written by professor)
+        The output format is pre-written by the professor; the body reads the active
+        storage, printing a small map as the table it would switch to (_small_table()).
         """
+        buckets = self._buckets if self._small is None else self._small_table()
         out = ''
-        for i in range(self._buckets.length()):
-            out += str(i) + ': ' + str(self._buckets[i]) + '\n'
+        for i in range(buckets.length()):
+            out += str(i) + ': ' + str(buckets[i]) + '\n'
         return out
 
     def _next_prime(self, capacity: int) -> int:
@@ -93,8 +168,287 @@ class HashMap:
         """
         return self._capacity
 
+    @staticmethod
+    def _check_load_factors(max_load_factor: float, growth_factor: float, min_load_factor: float) -> None:
+        """
+        Raise ValueError unless the thresholds are usable: a shrink must never leave the
+        table at or above the load factor that triggers the next growth.
+        """
+        if max_load_factor <= 0:
+            raise ValueError('max_load_factor must be positive')
+        if growth_factor <= 1:
+            raise ValueError('growth_factor must be greater than 1')
+        if min_load_factor < 0 or min_load_factor * growth_factor >= max_load_factor:
+            raise ValueError('min_load_factor must be at least 0 and less than max_load_factor / growth_factor')
+
+    def load_factor_settings(self) -> dict:
+        """
+        Return the current max load factor, growth factor and min load factor,
+        and the target probe length if auto-tuning is enabled.
+        """
+        return {'max_load_factor': self._max_load_factor,
+                'growth_factor': self._growth_factor,
+                'min_load_factor': self._min_load_factor,
+                'target_probe_length': self._target_probe_length}
+
+    def _allocate_storage(self) -> None:
+        """
+        Start with an empty flat array of entries if small maps are enabled,
+        otherwise with an empty table.
+        """
+        if self._small_map_size > 0:
+            self._buckets = None
+            self._small = DynamicArray()
+        else:
+            self._buckets = DynamicArray.filled(self._capacity, None)
+            self._small = None
+
+    def _small_find(self, key: str) -> int:
+        """
+        Returns the position of the key in the flat array of a small map, or -1.
+
+        :complexity: O(n), where n is at most the small map size
+        """
+        small = self._small
+        for position in range(small.length()):
+            hash_entry = small.get_unchecked(position)
+            if hash_entry.key == key and hash_entry.is_tombstone is False:
+                return position
+        return -1
+
+    def _small_insert(self, key: str, value: object) -> None:
+        """
+        Adds a key that is not in the small map. If the flat array is full, its
+        tombstones are dropped first, and if it holds no tombstones the map switches
+        to the hashed table.
+
+        :complexity: O(1), or O(n) when the array is compacted or the map switches to the table
+        """
+        if self._small.length() >= self._small_map_size and self._size < self._small.length():
+            self._small = self._small_entries()
+
+        if self._small.length() < self._small_map_size:
+            self._small.append(HashEntry(key, value))
+            self._size += 1
+            if self._ordered is not None:
+                self._ordered.add(key)
+            return
+
+        self._upgrade()
+        hash = self._hash_function(key)
+        index, found = self._find_slot(key, hash)
+        self._insert_at(index, key, value, hash)
+
+    def _small_entries(self) -> DynamicArray:
+        """
+        Returns a new flat array of the entries of a small map that are not tombstones.
+
+        :complexity: O(n), where n is at most the small map size
+        """
+        entries = DynamicArray()
+        for position in range(self._small.length()):
+            hash_entry = self._small.get_unchecked(position)
+            if hash_entry.is_tombstone is False:
+                entries.append(hash_entry)
+        return entries
+
+    def _small_table(self) -> DynamicArray:
+        """
+        Returns the table a small map would switch to, with its removed entries left as
+        tombstones, without switching. Entries are placed in insertion order, and the
+        table grows by the growth factor as put() would grow it. Used for printing.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        capacity = self._capacity
+        while True:
+            table = DynamicArray.filled(capacity, None)
+            for position in range(self._small.length()):
+                if position / capacity >= self._max_load_factor:
+                    break
+                hash_entry = self._small.get_unchecked(position)
+                index = self._hash_function(hash_entry.key) % capacity
+                step, increment = self._probing(hash_entry.key, capacity)
+                for _ in range(capacity):
+                    if table.get_unchecked(index) is None:
+                        table.set_unchecked(index, hash_entry)
+                        break
+                    index = (index + step) % capacity
+                    step += increment
+                else:
+                    break
+            else:
+                return table
+            capacity = self._next_prime(int(capacity * self._growth_factor))
+
+    def _upgrade(self) -> None:
+        """
+        Switches a small map to the hashed table, hashing every entry of the flat array
+        into a table of the map's capacity.
+
+        :complexity: O(n), where n is at most the small map size
+        """
+        small = self._small_entries()
+        self._small = None
+        self._buckets = DynamicArray.filled(self._capacity, None)
+        self._size = 0
+        for position in range(small.length()):
+            hash_entry = small.get_unchecked(position)
+            hash = self._hash_function(hash_entry.key)
+            index, found = self._find_slot(hash_entry.key, hash)
+            self._insert_at(index, hash_entry.key, hash_entry.value, hash)
+
+    def _bloom_capacity(self) -> int:
+        """
+        Return the number of entries the Bloom filter is sized for: the most the table
+        holds before it resizes.
+        """
+        return int(self._capacity * self._max_load_factor) + 1
+
     # ------------------------------------------------------------------ #
 
+    def _find_index(self, key: str) -> int:
+        """
+        Follows the probe sequence for the given key until the key or an empty
+        bucket is found.
+
+        :param key: The key to look for.
+
+        :return: The index of the bucket holding the key, or -1 if the key is not in the hash map.
+
+        :pre-condition: The map is not in small mode; callers check the flat array themselves.
+
+        :complexity: Average case - O(1)
+        """
+        capacity = self._capacity
+        index = self._hash_function(key) % capacity
+        step, increment = self._probing(key, capacity)
+
+        # probe indices are always reduced modulo capacity, so the unchecked accessors are safe
+        buckets = self._buckets
+
+        for _ in range(capacity):
+            hash_entry = buckets.get_unchecked(index)
+            if hash_entry is None:
+                return -1
+            # if the key is found, and it's not a tombstone
+            if hash_entry.key == key and hash_entry.is_tombstone is False:
+                return index
+            # otherwise, compute the next index in the probing sequence
+            index = (index + step) % capacity
+            step += increment
+
+        return -1
+
+    def _find_slot(self, key: str, hash: int) -> tuple[int, bool]:
+        """
+        Prepares to insert or update the given key with a single pass over its probe
+        sequence. If the load factor is greater than or equal to the max load factor,
+        the table is first grown by the growth factor. If the probe sequence visits no
+        reusable bucket (possible with quadratic probing above a load factor of 0.5),
+        the table is grown and the search repeated.
+
+        :param key: The key to look for.
+        :param hash: The key's hash value.
+
+        :return: (index, True) if the key is in the bucket at index, otherwise
+                 (index, False) where index is the first reusable bucket for the key.
+
+        :complexity: Average case - O(1)
+        """
+        if self.table_load() >= self._max_load_factor:
+            self._grow()
+
+        # Use the hash value to compute an initial index for the element.
+        capacity = self._capacity
+        index = hash % capacity
+        step, increment = self._probing(key, capacity)
+
+        buckets = self._buckets
+        available = -1      # first empty bucket or tombstone along the probe sequence
+
+        # follow the probe sequence until an empty bucket shows that the key is not in the table
+        for _ in range(capacity):
+            current_hash_entry = buckets.get_unchecked(index)
+            if current_hash_entry is None:
+                if available == -1:
+                    available = index
+                break
+
+            # a tombstone can be reused, but the key may still be further along the sequence
+            elif current_hash_entry.is_tombstone is True:
+                if available == -1:
+                    available = index
+
+            # or if the key at index matches the input key, it can be updated in place
+            elif current_hash_entry.key == key:
+                return index, True
+
+            index = (index + step) % capacity
+            step += increment
+
+        if available == -1:
+            self.resize_table(int(self._capacity * self._growth_factor))
+            return self._find_slot(key, hash)
+
+        return available, False
+
+    def _grow(self) -> None:
+        """
+        Resizes the table by the growth factor. With auto-tuning enabled, the max load
+        factor is first adjusted from the average probe length measured at the load
+        factor the table has just reached.
+
+        :complexity: O(n)
+        """
+        if self._target_probe_length is not None and self._size > 0:
+            self._tune_max_load_factor(self.average_probe_length())
+        self.resize_table(int(self._capacity * self._growth_factor))
+
+    def _tune_max_load_factor(self, measured: float) -> None:
+        """
+        Moves the max load factor toward the highest load that meets the target
+        average probe length. The cost above one probe grows roughly in proportion to
+        the load factor, so the load is scaled by (target - 1) / (measured - 1),
+        limited to a 25% change per growth and to the tuning bounds.
+
+        :complexity: O(1)
+        """
+        if measured > 1:
+            ratio = (self._target_probe_length - 1) / (measured - 1)
+        else:
+            ratio = 1.25
+        ratio = min(1.25, max(0.75, ratio))
+        load_factor = min(MAX_TUNED_LOAD_FACTOR, max(MIN_TUNED_LOAD_FACTOR, self._max_load_factor * ratio))
+
+        self._max_load_factor = load_factor
+        # keep shrinking from re-triggering growth
+        self._min_load_factor = min(self._min_load_factor, load_factor / self._growth_factor / 2)
+
+    def _shrink_if_sparse(self) -> None:
+        """
+        Resizes the table down by the growth factor, but not below its initial capacity,
+        when its load factor has fallen below the min load factor.
+
+        :complexity: O(1), or O(n) when the table is resized
+        """
+        if self._size < self._capacity * self._min_load_factor and self._capacity > self._min_capacity:
+            self.resize_table(max(self._min_capacity, int(self._capacity / self._growth_factor)))
+
+    def _insert_at(self, index: int, key: str, value: object, hash: int) -> None:
+        """
+        Stores a new key/value pair, and its cached hash value, in the reusable
+        bucket at index, as returned by _find_slot.
+
+        :complexity: O(1)
+        """
+        self._buckets.set_unchecked(index, HashEntry(key, value, hash))
+        self._size += 1
+        if self._bloom is not None:
+            self._bloom.add(key)
+        if self._ordered is not None:
+            self._ordered.add(key)
+
     def put(self, key: str, value: object) -> None:
         """
         Inserts an element in an open addressing-based hash table. Specifically,
@@ -103,51 +457,32 @@ class HashMap:
         If the given key is not in the hash map, a new key/value pair must be added.
 
         When method is called, if the current load factor of the table is greater than
-        or equal to 0.5, the table is resized to double its current capacity.
+        or equal to the max load factor (0.5 by default), the table is resized by the
+        growth factor (to double its current capacity by default).
 
         :param key: The key associated with the value to be inserted or updated in the hash map.
         :param value: The value to be associated with the given key.
 
         :post-conditions: The key/value pair is added to the hash map, or the existing key's
-            value is updated. If the load factor is >= 0.5, the hash map's capacity is increased
-            and elements are rehashed.
+            value is updated. If the load factor is >= the max load factor, the hash map's
+            capacity is increased and elements are rehashed.
 
         :complexity: Average case - O(1)
         """
-        if self.table_load() >= 0.5:
-            self.resize_table(self._capacity * 2)
-
-        # create HashEntry for the new key/value pair
-        new_pair = HashEntry(key, value)
-
-        # Use the hash function to compute an initial index for the element.
-        initial_index = self._hash_function(key) % self._capacity
-        addend = 1      # initial increment value for quadratic probing
-
-        # starting at hashed index, iterate through the buckets until empty bucket found
-        for bucket in range(self._capacity):
-            # if the hash table array at initial_index is empty, insert the element there and stop
-            current_hash_entry = self._buckets.get_at_index(initial_index)
-            if current_hash_entry is None:
-                self._buckets.set_at_index(initial_index, new_pair)
-                self._size += 1
-                return
-            # or if the initial_index is a tombstone, insert the element there and stop
-            elif current_hash_entry.is_tombstone is True:
-                self._buckets.set_at_index(initial_index, new_pair)
-                self._size += 1
-                return
-
-            # or if the key at initial_index matches the input key, then replace the value and stop
-            elif current_hash_entry.key == key and current_hash_entry.is_tombstone is False:
-                self._buckets.set_at_index(initial_index, new_pair)
-                return
-
-            # otherwise, compute the next index in the probing sequence and repeat
+        if self._small is not None:
+            position = self._small_find(key)
+            if position == -1:
+                self._small_insert(key, value)
             else:
-                # next index uses quadratic probing with wrap around
-                initial_index = (initial_index + addend) % self._capacity
-                addend += 2
+                self._small.get_unchecked(position).value = value
+            return
+
+        hash = self._hash_function(key)
+        index, found = self._find_slot(key, hash)
+        if found:
+            self._buckets.get_unchecked(index).value = value
+        else:
+            self._insert_at(index, key, value, hash)
 
     def resize_table(self, new_capacity: int) -> None:
         """
@@ -172,7 +507,9 @@ class HashMap:
         if new_capacity < 1 or new_capacity < self._size:
             return
 
-        old_capacity = self._capacity
+        if self._small is not None:
+            self._upgrade()
+
         old_hashmap = self._buckets
 
         # if new_capacity is not a prime number
@@ -183,19 +520,69 @@ class HashMap:
         else:
             self._capacity = new_capacity
 
-        # create new array
-        self._buckets = DynamicArray()
-        for index in range(self._capacity):
-            self._buckets.append(None)
+        # the Bloom filter is refilled as entries are put into the new array
         self._size = 0
+        if self._bloom is not None:
+            self._bloom = CountingBloomFilter(self._bloom_capacity())
 
-        # iterate through the old DynamicArray/HashMap
-        for index in range(old_capacity):
-            hash_entry = old_hashmap[index]
-            # only put valid, non-tombstone key/value pairs into the new array
-            if hash_entry is not None:
-                if hash_entry.is_tombstone is False:
-                    self.put(hash_entry.key, hash_entry.value)
+        # the keys do not change, so the ordered index is left as it is
+        index_of_keys = self._ordered
+        self._ordered = None
+
+        # only valid, non-tombstone key/value pairs are put into the new array
+        entries = [hash_entry for hash_entry in old_hashmap.to_list()
+                   if hash_entry is not None and hash_entry.is_tombstone is False]
+
+        # reuse each entry's cached hash value instead of rehashing its key,
+        # placing every entry at once if the table is large enough
+        if not self._place_vectorized(entries):
+            # create new array and insert the entries one by one
+            self._buckets = DynamicArray.filled(self._capacity, None)
+            for hash_entry in entries:
+                new_index, found = self._find_slot(hash_entry.key, hash_entry.hash)
+                self._insert_at(new_index, hash_entry.key, hash_entry.value, hash_entry.hash)
+
+        self._ordered = index_of_keys
+
+    def _place_vectorized(self, entries: list) -> bool:
+        """
+        Builds the new table from the given entries, computing every entry's bucket
+        with NumPy from its cached hash value. The entries end up where inserting them
+        one by one could have put them, so every lookup works unchanged.
+
+        Returns False, leaving the table to be built entry by entry, if NumPy is not installed, there are
+        too few entries to gain from it, the entries would reach the max load factor,
+        or a hash value does not fit in 64 bits.
+
+        :complexity: O(n log n) on NumPy arrays, plus O(n) to gather the entries
+        """
+        capacity = self._capacity
+        if not rehash.enabled(len(entries)) or len(entries) >= capacity * self._max_load_factor:
+            return False
+
+        hashes = rehash.hash_array([hash_entry.hash for hash_entry in entries])
+        if hashes is None:
+            return False
+
+        # the built-in probing strategies use the same sequence for every key
+        if self._probing is linear_probing or self._probing is quadratic_probing:
+            step, increment = self._probing(None, capacity)
+        else:
+            sequences = [self._probing(hash_entry.key, capacity) for hash_entry in entries]
+            step = [sequence[0] for sequence in sequences]
+            increment = [sequence[1] for sequence in sequences]
+
+        indices = rehash.bucket_indices(hashes, capacity, self._resize_threads)
+        slots = rehash.place_open_addressing(indices, step, increment, capacity)
+        if slots is None:
+            return False
+
+        self._buckets = DynamicArray.from_list(rehash.scatter(entries, slots, capacity))
+        self._size = len(entries)
+        if self._bloom is not None:
+            for hash_entry in entries:
+                self._bloom.add(hash_entry.key)
+        return True
 
     def table_load(self) -> float:
         """
@@ -218,13 +605,18 @@ class HashMap:
 
         :complexity: O(n), where n is the capacity of the hash table.
         """
+        # every bucket of the table a small map will allocate is empty except its entries' own
+        if self._small is not None:
+            return self._capacity - self._size
+
         empty = 0
 
         # iterate through the hash table looking for empty bucket or a tombstone
         for index in range(self._capacity):
-            if self._buckets[index] is None:
+            hash_entry = self._buckets.get_unchecked(index)
+            if hash_entry is None:
                 empty += 1
-            elif self._buckets[index].is_tombstone:
+            elif hash_entry.is_tombstone:
                 empty += 1
 
         return empty
@@ -241,22 +633,21 @@ class HashMap:
 
         :complexity: Average case - O(1)
         """
-        initial_index = self._hash_function(key) % self._capacity
-        addend = 1      # initial increment value for quadratic probing
+        if self._small is not None:
+            position = self._small_find(key)
+            return None if position == -1 else self._small.get_unchecked(position).value
 
-        # Iterate through the hash table to find the key using quadratic probing
-        while self._buckets[initial_index] is not None:
-            current_hash_entry = self._buckets.get_at_index(initial_index)
-            # if the key is found, and it's not a tombstone
-            if current_hash_entry.key == key and current_hash_entry.is_tombstone is False:
-                return current_hash_entry.value
-            # if the key was not found at the current index
-            else:
-                # compute the next index in the quadratic probing sequence
-                initial_index = (initial_index + addend) % self._capacity
-                addend += 2
+        # a definite miss in the Bloom filter means the table need not be probed
+        if self._bloom is not None and not self._bloom.might_contain(key):
+            return None
 
-        return None
+        index = self._find_index(key)
+        if index == -1:
+            if self._bloom is not None:
+                self._bloom.record_false_positive()
+            return None
+
+        return self._buckets.get_unchecked(index).value
 
     def contains_key(self, key: str) -> bool:
         """
@@ -269,22 +660,18 @@ class HashMap:
 
         :complexity: Average case - O(1)
         """
-        initial_index = self._hash_function(key) % self._capacity
-        addend = 1      # initial increment value for quadratic probing
+        if self._small is not None:
+            return self._small_find(key) != -1
 
-        # start at hashed index and search for key until found or vacant spot is reached
-        while self._buckets[initial_index] is not None:
-            current_hash_entry = self._buckets.get_at_index(initial_index)
-            # if the key is found at the current index, and it's not a tombstone
-            if current_hash_entry.key == key and current_hash_entry.is_tombstone is False:
-                return True
-            # if the key was not found at the current index
-            else:
-                # compute the next index in the quadratic probing sequence
-                initial_index = (initial_index + addend) % self._capacity
-                addend += 2
+        if self._bloom is not None and not self._bloom.might_contain(key):
+            return False
 
-        return False
+        if self._find_index(key) == -1:
+            if self._bloom is not None:
+                self._bloom.record_false_positive()
+            return False
+
+        return True
 
     def remove(self, key: str) -> None:
         """
@@ -298,24 +685,257 @@ class HashMap:
 
         :complexity: Average case - O(1)
         """
-        initial_index = self._hash_function(key) % self._capacity
-        addend = 1      # initial increment value for quadratic probing
+        self.pop(key)
+
+    def increment(self, key: str, delta: object = 1) -> object:
+        """
+        Adds delta to the value associated with the given key, probing the table once.
+        If the key is not in the hash map, it is added with delta as its value.
+
+        :param key: The key whose value is to be incremented.
+        :param delta: The amount to add to the value.
+
+        :return: The new value associated with the key.
+
+        :complexity: Average case - O(1)
+        """
+        if self._small is not None:
+            position = self._small_find(key)
+            if position == -1:
+                self._small_insert(key, delta)
+                return delta
+            hash_entry = self._small.get_unchecked(position)
+            hash_entry.value += delta
+            return hash_entry.value
+
+        hash = self._hash_function(key)
+        index, found = self._find_slot(key, hash)
+        if not found:
+            self._insert_at(index, key, delta, hash)
+            return delta
+
+        hash_entry = self._buckets.get_unchecked(index)
+        hash_entry.value += delta
+        return hash_entry.value
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Returns the value associated with the given key, probing the table once. If the
+        key is not in the hash map, it is added with default as its value.
+
+        :param key: The key whose value is to be returned.
+        :param default: The value to add if the key is not in the hash map.
+
+        :return: The value associated with the key after the call.
+
+        :complexity: Average case - O(1)
+        """
+        if self._small is not None:
+            position = self._small_find(key)
+            if position == -1:
+                self._small_insert(key, default)
+                return default
+            return self._small.get_unchecked(position).value
+
+        hash = self._hash_function(key)
+        index, found = self._find_slot(key, hash)
+        if not found:
+            self._insert_at(index, key, default, hash)
+            return default
+
+        return self._buckets.get_unchecked(index).value
+
+    def update(self, key: str, function: callable, default: object = None) -> object:
+        """
+        Replaces the value associated with the given key by function(value), probing the
+        table once. If the key is not in the hash map, it is added with function(default)
+        as its value.
 
-        # iterate through hash table until key found or end of the hash table is reached
-        while self._buckets[initial_index] is not None:
-            current_hash_entry = self._buckets.get_at_index(initial_index)
-            # check if the current hash entry is the key and is not a tombstone
-            if current_hash_entry.key == key and current_hash_entry.is_tombstone is False:
-                # key was found, so mark the entry as a tombstone and decrement the size
-                current_hash_entry.is_tombstone = True
-                self._size -= 1
-                return
+        :param key: The key whose value is to be updated.
+        :param function: A function computing the new value from the current one.
+        :param default: The current value to assume if the key is not in the hash map.
 
-            # if the key was not found at the current index
-            else:
-                # move to the next index using quadratic probing
-                initial_index = (initial_index + addend) % self._capacity
-                addend += 2
+        :return: The new value associated with the key.
+
+        :complexity: Average case - O(1), plus the cost of function
+        """
+        if self._small is not None:
+            position = self._small_find(key)
+            if position == -1:
+                value = function(default)
+                self._small_insert(key, value)
+                return value
+            hash_entry = self._small.get_unchecked(position)
+            hash_entry.value = function(hash_entry.value)
+            return hash_entry.value
+
+        hash = self._hash_function(key)
+        index, found = self._find_slot(key, hash)
+        if not found:
+            value = function(default)
+            self._insert_at(index, key, value, hash)
+            return value
+
+        hash_entry = self._buckets.get_unchecked(index)
+        hash_entry.value = function(hash_entry.value)
+        return hash_entry.value
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes the given key from the hash map and returns its associated value.
+
+        :param key: The key for the key/value pair to be removed from the hash map.
+        :param default: The value to return if the key is not in the hash map.
+
+        :return: The value that was associated with the key, or default if the key
+                 is not in the hash map.
+
+        :complexity: Average case - O(1)
+        """
+        if self._small is not None:
+            position = self._small_find(key)
+            if position == -1:
+                return default
+            # mark the entry as a tombstone, as in the table; put() drops it when the array fills
+            hash_entry = self._small.get_unchecked(position)
+            hash_entry.is_tombstone = True
+            self._size -= 1
+            if self._ordered is not None:
+                self._ordered.remove(key)
+            return hash_entry.value
+
+        index = self._find_index(key)
+        if index == -1:
+            return default
+
+        # key was found, so mark the entry as a tombstone and decrement the size
+        hash_entry = self._buckets.get_unchecked(index)
+        hash_entry.is_tombstone = True
+        self._size -= 1
+        if self._bloom is not None:
+            self._bloom.remove(key)
+        if self._ordered is not None:
+            self._ordered.remove(key)
+        if self._min_load_factor:
+            self._shrink_if_sparse()
+        return hash_entry.value
+
+    def merge(self, other, combine: callable = None) -> None:
+        """
+        Adds every key/value pair of another map into this hash map. For a key found in
+        both maps, the new value is combine(this map's value, other's value), or other's
+        value if no combine function is given (last writer wins).
+
+        The table is resized once up front for the combined size rather than repeatedly
+        while merging, and if other is an open addressing HashMap with the same hash
+        function, its cached hash values are reused instead of rehashing every key.
+
+        :param other: The map to merge into this one. It is not modified.
+        :param combine: A function of (existing value, incoming value) returning the merged value.
+
+        :post-conditions: This hash map contains every key of both maps.
+
+        :complexity: O(n + m), where n and m are the sizes of the two maps
+        """
+        if self._small is not None:
+            self._upgrade()
+
+        # presize so that no insert made by the merge triggers a resize
+        combined = self._size + other.get_size()
+        if combined >= self._capacity * self._max_load_factor:
+            self.resize_table(int(combined / self._max_load_factor) + 1)
+
+        if not isinstance(other, HashMap) or other._small is not None:
+            pairs = other.get_keys_and_values()
+            for index in range(pairs.length()):
+                key, value = pairs.get_unchecked(index)
+                self._merge_one(key, value, self._hash_function(key), combine)
+            return
+
+        same_function = other._hash_function is self._hash_function
+        for index in range(other._capacity):
+            hash_entry = other._buckets.get_unchecked(index)
+            if hash_entry is None or hash_entry.is_tombstone:
+                continue
+            hash = hash_entry.hash if same_function else self._hash_function(hash_entry.key)
+            self._merge_one(hash_entry.key, hash_entry.value, hash, combine)
+
+    def _merge_one(self, key: str, value: object, hash: int, combine: callable) -> None:
+        """
+        Inserts or combines a single key/value pair for merge().
+
+        :complexity: Average case - O(1)
+        """
+        index, found = self._find_slot(key, hash)
+        if not found:
+            self._insert_at(index, key, value, hash)
+        elif combine is None:
+            self._buckets.get_unchecked(index).value = value
+        else:
+            hash_entry = self._buckets.get_unchecked(index)
+            hash_entry.value = combine(hash_entry.value, value)
+
+    def probe_length(self, key: str) -> int:
+        """
+        Returns the number of buckets a lookup of the given key examines, whether or
+        not the key is in the hash map. Used for sampling probe counts.
+
+        :complexity: Average case - O(1)
+        """
+        if self._small is not None:
+            position = self._small_find(key)
+            return self._small.length() if position == -1 else position + 1
+
+        capacity = self._capacity
+        index = self._hash_function(key) % capacity
+        step, increment = self._probing(key, capacity)
+
+        for probes in range(1, capacity + 1):
+            hash_entry = self._buckets.get_unchecked(index)
+            if hash_entry is None:
+                return probes
+            if hash_entry.key == key and hash_entry.is_tombstone is False:
+                return probes
+            index = (index + step) % capacity
+            step += increment
+
+        return capacity
+
+    def average_probe_length(self) -> float:
+        """
+        Returns the average number of buckets examined by a successful lookup, taken
+        over every key in the hash map. Useful for comparing probing strategies.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        if self._size == 0:
+            return 0.0
+
+        # the key at position i of a small map's flat array is found after i + 1 comparisons
+        if self._small is not None:
+            total = 0
+            for position in range(self._small.length()):
+                if self._small.get_unchecked(position).is_tombstone is False:
+                    total += position + 1
+            return total / self._size
+
+        capacity = self._capacity
+        total = 0
+        for bucket in range(capacity):
+            hash_entry = self._buckets.get_unchecked(bucket)
+            if hash_entry is None or hash_entry.is_tombstone:
+                continue
+
+            # walk the key's probe sequence until its own bucket is reached
+            index = hash_entry.hash % capacity
+            step, increment = self._probing(hash_entry.key, capacity)
+            total += 1
+            while index != bucket:
+                index = (index + step) % capacity
+                step += increment
+                total += 1
+
+        return total / self._size
 
     def get_keys_and_values(self) -> DynamicArray:
         """
@@ -328,9 +948,16 @@ class HashMap:
         """
         new_array = DynamicArray()
 
+        if self._small is not None:
+            for position in range(self._small.length()):
+                hash_entry = self._small.get_unchecked(position)
+                if hash_entry.is_tombstone is False:
+                    new_array.append((hash_entry.key, hash_entry.value))
+            return new_array
+
         # iterate through each bucket in the hash table
         for index in range(self._capacity):
-            bucket = self._buckets[index]
+            bucket = self._buckets.get_unchecked(index)
             # if the bucket is not empty and not a tombstone
             if bucket is not None:
                 if bucket.is_tombstone is False:
@@ -349,13 +976,71 @@ class HashMap:
 
         :complexity: O(n)
         """
-        empty_array = DynamicArray()
+        self._allocate_storage()
         self._size = 0
+        if self._bloom is not None:
+            self._bloom.clear()
+        if self._ordered is not None:
+            self._ordered.clear()
 
-        for index in range(self._capacity):
-            empty_array.append(None)
+    def bloom_stats(self) -> dict:
+        """
+        Returns the statistics of the Bloom filter in front of the table, including its
+        estimated and observed false positive rates, or None if the map has no filter.
+
+        :complexity: O(m), where m is the number of counters in the filter.
+        """
+        if self._bloom is None:
+            return None
+        return self._bloom.stats()
+
+    def _require_index(self) -> SkipList:
+        """Return the ordered index, raising ValueError if the map was built without one."""
+        if self._ordered is None:
+            raise ValueError('ordered queries need a HashMap created with ordered=True')
+        return self._ordered
 
-        self._buckets = empty_array
+    def min_key(self) -> str:
+        """
+        Returns the smallest key in the hash map, or None if the map is empty.
+        Requires the ordered index.
+
+        :complexity: O(1)
+        """
+        return self._require_index().first()
+
+    def max_key(self) -> str:
+        """
+        Returns the largest key in the hash map, or None if the map is empty.
+        Requires the ordered index.
+
+        :complexity: O(log n) expected
+        """
+        return self._require_index().last()
+
+    def range(self, lo: str = None, hi: str = None) -> DynamicArray:
+        """
+        Returns a dynamic array of the (key, value) pairs with lo <= key < hi, in
+        ascending key order. A bound of None leaves that end of the range open, so
+        range() returns every pair in sorted order. Requires the ordered index.
+
+        :complexity: O(log n + k) expected, where k is the number of pairs returned
+        """
+        new_array = DynamicArray()
+        for key in self._require_index().keys_from(lo):
+            if hi is not None and key >= hi:
+                break
+            new_array.append((key, self.get(key)))
+        return new_array
+
+    def get_sorted_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a dynamic array of every key/value pair in ascending key order, read
+        from the ordered index instead of sorting. Requires the ordered index.
+
+        :complexity: O(n)
+        """
+        return self.range()
 
     def __iter__(self):
         """
@@ -378,6 +1063,14 @@ class HashMap:
 
         :raises StopIteration: If there are no more elements to iterate over.
         """
+        if self._small is not None:
+            while self._index < self._small.length():
+                self._index += 1
+                hash_entry = self._small.get_unchecked(self._index - 1)
+                if hash_entry.is_tombstone is False:
+                    return hash_entry
+            raise StopIteration
+
         # a flag to indicate when the next valid entry is found
         found = 0
         try:
@@ -397,6 +1090,29 @@ class HashMap:
         return value
 
 
+def merge_maps(first: HashMap, second: HashMap, combine: callable = None) -> HashMap:
+    """
+    Merges two hash maps by iterating the smaller one into the larger one, and returns
+    the larger map, which then holds every key. For a key found in both maps, the merged
+    value is combine(first's value, second's value), or second's value if no combine
+    function is given. Useful for reducing per-worker maps into one.
+
+    :return: Whichever of first and second was larger, updated in place.
+
+    :complexity: O(min(n, m)) inserts, where n and m are the sizes of the two maps
+    """
+    if first.get_size() >= second.get_size():
+        first.merge(second, combine)
+        return first
+
+    # the values being merged in come from first, so keep the argument order of combine
+    if combine is None:
+        second.merge(first, lambda existing, incoming: existing)
+    else:
+        second.merge(first, lambda existing, incoming: combine(incoming, existing))
+    return second
+
+
 # ------------------- BASIC TESTING ---------------------------------------- #
 # I am NOT the author of this testing segment. It was written by Oregon State University professor(s) and intended to be shared with this code file for testing.
 
@@ -0,0 +1,447 @@
+# Description: Implementation of an open addressing HashMap that stores its string
+# keys packed in a single byte arena (key_arena.py) instead of as separate str objects
+# held by HashEntry objects. Each bucket is described by parallel typed arrays: the
+# bucket state (empty, full, tombstone) in a bytearray, and the key's cached hash,
+# arena offset and encoded length in array('Q')/array('I') buffers; only the values
+# remain Python object references. Lookups compare the cached hash first and then the
+# key's bytes in place in the arena, so a table of millions of short keys holds no
+# per-key objects. The public interface and the quadratic probing and resizing rules
+# match the open addressing HashMap in hash_map_oa.py; a resize also compacts the
+# arena, dropping the bytes of removed keys.
+
+
+from array import array
+
+from DynamicArray_and_SinglyLinkedList import DynamicArray, HashEntry, hash_function_1, hash_function_2
+from key_arena import KeyArena
+
+
+# bucket states
+EMPTY = 0
+FULL = 1
+TOMBSTONE = 2
+
+HASH_MASK = 0xFFFFFFFFFFFFFFFF
+
+# removed keys' bytes are reclaimed once they exceed half of the arena and this size
+MIN_GARBAGE = 4096
+
+
+class HashMap:
+    def __init__(self,
+                 capacity: int,
+                 function: callable) -> None:
+        """
+        Initialize new HashMap with packed keys that uses
+        quadratic probing for collision resolution
+        """
+        self._hash_function = function
+        self._allocate(self._next_prime(capacity), KeyArena())
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._capacity):
+            if self._states[i] == FULL:
+                out += str(i) + ': ' + self._key_at(i) + ': ' + str(self._values.get_unchecked(i)) + '\n'
+            else:
+                out += str(i) + ': None\n'
+        return out
+
+    def _allocate(self, capacity: int, arena: KeyArena) -> None:
+        """
+        Replace the table with an empty one of the given (prime) capacity.
+        """
+        self._capacity = capacity
+        self._states = bytearray(capacity)
+        self._hashes = array('Q', [0]) * capacity
+        self._offsets = array('Q', [0]) * capacity
+        self._lengths = array('I', [0]) * capacity
+        self._values = DynamicArray.filled(capacity, None)
+        self._arena = arena
+        self._size = 0
+        self._tombstones = 0
+
+    def _next_prime(self, capacity: int) -> int:
+        """
+        Increment from given number to find the closest prime number
+        """
+        if capacity % 2 == 0:
+            capacity += 1
+
+        while not self._is_prime(capacity):
+            capacity += 2
+
+        return capacity
+
+    @staticmethod
+    def _is_prime(capacity: int) -> bool:
+        """
+        Determine if given integer is a prime number and return boolean
+        """
+        if capacity == 2 or capacity == 3:
+            return True
+
+        if capacity == 1 or capacity % 2 == 0:
+            return False
+
+        factor = 3
+        while factor ** 2 <= capacity:
+            if capacity % factor == 0:
+                return False
+            factor += 2
+
+        return True
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    def _key_at(self, index: int) -> str:
+        """Decode the key stored in the bucket at index."""
+        return self._arena.decode(self._offsets[index], self._lengths[index])
+
+    # ------------------------------------------------------------------ #
+
+    def _find_index(self, encoded: bytes, hash: int) -> int:
+        """
+        Follows the quadratic probe sequence for an encoded key until the key or an
+        empty bucket is found, comparing the arena bytes only when the hashes match.
+
+        :return: The index of the bucket holding the key, or -1 if the key is not in the hash map.
+
+        :complexity: Average case - O(1)
+        """
+        capacity = self._capacity
+        states = self._states
+        hashes = self._hashes
+        index = hash % capacity
+        step = 1
+
+        for _ in range(capacity):
+            state = states[index]
+            if state == EMPTY:
+                return -1
+            if (state == FULL and hashes[index] == hash
+                    and self._arena.equals(self._offsets[index], self._lengths[index], encoded)):
+                return index
+            index = (index + step) % capacity
+            step += 2
+
+        return -1
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates the key/value pair in the hash map. If the given key already exists in
+        the hash map, its associated value is replaced with the new value. If the given
+        key is not in the hash map, a new key/value pair is added and the key's bytes
+        are appended to the arena.
+
+        When method is called, if the full buckets and tombstones make up half or more of
+        the table, the table is resized to double its current capacity (or rebuilt at the
+        same capacity if most of those buckets are tombstones).
+
+        :param key: The key associated with the value to be inserted or updated in the hash map.
+        :param value: The value to be associated with the given key.
+
+        :post-conditions: The key/value pair is added to the hash map, or the existing key's
+            value is updated.
+
+        :complexity: Average case - O(1)
+        """
+        # rebuild in place when tombstones dominate, otherwise grow
+        if (self._size + self._tombstones) / self._capacity >= 0.5:
+            if self._tombstones > self._size:
+                self.resize_table(self._capacity)
+            else:
+                self.resize_table(self._capacity * 2)
+
+        encoded = key.encode('utf-8')
+        hash = self._hash_function(key) & HASH_MASK
+        capacity = self._capacity
+        states = self._states
+        hashes = self._hashes
+        index = hash % capacity
+        step = 1
+        available = -1      # first empty bucket or tombstone along the probe sequence
+
+        for _ in range(capacity):
+            state = states[index]
+            if state == EMPTY:
+                if available == -1:
+                    available = index
+                break
+            if state == TOMBSTONE:
+                if available == -1:
+                    available = index
+            elif hashes[index] == hash and self._arena.equals(self._offsets[index], self._lengths[index], encoded):
+                self._values.set_unchecked(index, value)
+                return
+            index = (index + step) % capacity
+            step += 2
+
+        if states[available] == TOMBSTONE:
+            self._tombstones -= 1
+        states[available] = FULL
+        hashes[available] = hash
+        self._offsets[available] = self._arena.store(encoded)
+        self._lengths[available] = len(encoded)
+        self._values.set_unchecked(available, value)
+        self._size += 1
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the underlying table. All key/value pairs are put into
+        the new table using their cached hashes, tombstones are discarded, and the keys
+        are copied into a new, compact arena. If new_capacity is not a prime number,
+        it is changed to the next highest prime number, and it is doubled until the
+        table load is below 0.5, so every quadratic probe sequence reaches an empty bucket.
+
+        :validation: Checks that new_capacity is not less than the current number of elements
+                     in the hash map; if so, the method does nothing.
+
+        :param new_capacity: The new capacity for the hash table.
+
+        :complexity: O(n)
+        """
+        if new_capacity < 1 or new_capacity < self._size:
+            return
+
+        old_capacity = self._capacity
+        old_states = self._states
+        old_hashes = self._hashes
+        old_offsets = self._offsets
+        old_lengths = self._lengths
+        old_values = self._values
+        old_arena = self._arena
+
+        capacity = self._next_prime(new_capacity)
+        while self._size / capacity >= 0.5:
+            capacity = self._next_prime(capacity * 2)
+
+        self._allocate(capacity, KeyArena(old_arena.used() - old_arena.garbage()))
+        capacity = self._capacity
+        states = self._states
+
+        # the keys are known to be distinct, so each one only needs an empty bucket
+        for old_index in range(old_capacity):
+            if old_states[old_index] != FULL:
+                continue
+            hash = old_hashes[old_index]
+            index = hash % capacity
+            step = 1
+            for _ in range(capacity):
+                if states[index] == EMPTY:
+                    break
+                index = (index + step) % capacity
+                step += 2
+            else:
+                # unreachable below load 0.5 with a prime capacity
+                raise RuntimeError('no empty bucket on the probe sequence')
+
+            offset = old_offsets[old_index]
+            length = old_lengths[old_index]
+            states[index] = FULL
+            self._hashes[index] = hash
+            self._offsets[index] = self._arena.store(old_arena.view(offset, length))
+            self._lengths[index] = length
+            self._values.set_unchecked(index, old_values.get_unchecked(old_index))
+            self._size += 1
+
+    def table_load(self) -> float:
+        """
+        Returns the current hash table load factor, which is the ratio
+        of the number of elements in the hash table to the current
+        capacity of the hash table.
+
+        :return: the load factor (float value) of the current hash table.
+
+        :complexity: O(1)
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets (including tombstones) in the hash table.
+
+        :return: The number of empty buckets (as an integer) in the hash table.
+
+        :complexity: O(1)
+        """
+        return self._capacity - self._size
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value associated with the given key. If the key is not in the hash
+        map, the method returns None.
+
+        :param key: The key whose associated value is to be returned.
+
+        :return: The value associated with the given key, or None if the
+        key is not in the hash map.
+
+        :complexity: Average case - O(1)
+        """
+        index = self._find_index(key.encode('utf-8'), self._hash_function(key) & HASH_MASK)
+        if index == -1:
+            return None
+        return self._values.get_unchecked(index)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if the given key is in the hash map, otherwise it returns False.
+
+        :param key: The key to check to see if it's in the hash map.
+
+        :return: True if the key is in the hash map, False otherwise.
+
+        :complexity: Average case - O(1)
+        """
+        return self._find_index(key.encode('utf-8'), self._hash_function(key) & HASH_MASK) != -1
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the given key and its associated value from the hash map.
+        If the key is not in the hash map, the method does nothing. Once the bytes
+        of removed keys make up more than half of the arena, the table is rebuilt
+        at the same capacity to reclaim them.
+
+        :param key: The key for the key/value pair to be removed from the hash map.
+
+        :post-conditions: The key, given it is actually in the hash map, and its associated
+        value are removed from the hash table. If key is not in hash table, there is no change.
+
+        :complexity: Average case - O(1)
+        """
+        index = self._find_index(key.encode('utf-8'), self._hash_function(key) & HASH_MASK)
+        if index == -1:
+            return
+
+        self._states[index] = TOMBSTONE
+        self._values.set_unchecked(index, None)
+        self._arena.discard(self._lengths[index])
+        self._size -= 1
+        self._tombstones += 1
+
+        garbage = self._arena.garbage()
+        if garbage > MIN_GARBAGE and garbage > self._arena.used() // 2:
+            self.resize_table(self._capacity)
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a dynamic array where each index contains a tuple of a key/value pair
+        stored in the hash map. The order of the keys in the dynamic array does not matter.
+
+        :return: A DynamicArray containing tuples of key/value pairs from the hash map.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        new_array = DynamicArray()
+        for index in range(self._capacity):
+            if self._states[index] == FULL:
+                new_array.append((self._key_at(index), self._values.get_unchecked(index)))
+        return new_array
+
+    def clear(self) -> None:
+        """
+        Clears the contents of the hash map.
+
+        :post-conditions: All key/value pairs are removed form the hash map.
+        The underlying hash table capacity remains unchanged.
+
+        :complexity: O(n)
+        """
+        self._allocate(self._capacity, KeyArena())
+
+    def __iter__(self):
+        """
+        This method enables the hash map to iterate across itself.
+
+        :return: The hash map itself as an iterator.
+
+        :complexity: O(1)
+        """
+        self._index = 0
+        return self
+
+    def __next__(self):
+        """
+        Returns the next key/value pair in the hash map during iteration, as a HashEntry.
+        If there are no more elements to iterate over, it raises StopIteration.
+
+        :return: A HashEntry holding the next key/value pair in the hash map.
+
+        :raises StopIteration: If there are no more elements to iterate over.
+        """
+        while self._index < self._capacity:
+            index = self._index
+            self._index += 1
+            if self._states[index] == FULL:
+                return HashEntry(self._key_at(index), self._values.get_unchecked(index))
+
+        raise StopIteration
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    import tracemalloc
+
+    import hash_map_oa
+
+    print("\nput / get / remove example")
+    print("--------------------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+    m.put('str7', -7)
+    m.put('ключ', 'unicode')
+    for i in range(0, 150, 2):
+        m.remove('str' + str(i))
+    print(m.get('str7'), m.get('str8'), m.get('ключ'), m.contains_key('str9'), m.get_size())
+
+    print("\narena compaction example")
+    print("------------------------")
+    m = HashMap(11, hash_function_2)
+    for round_number in range(5):
+        for i in range(2000):
+            m.put('round' + str(round_number) + '-' + str(i), i)
+        for i in range(2000):
+            m.remove('round' + str(round_number) + '-' + str(i))
+    m.put('survivor', 1)
+    print(m.get_size(), m.get('survivor'), m._arena.used() < 20000)
+
+    print("\nmemory example")
+    print("--------------")
+    keys = ['user' + str(i) for i in range(50000)]
+    for module in (hash_map_oa, None):
+        tracemalloc.start()
+        m = hash_map_oa.HashMap(11, hash_function_2) if module else HashMap(11, hash_function_2)
+        for key in keys:
+            m.put(key, None)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print('HashEntry objects' if module else 'packed keys', memory // len(keys) // 10 * 10, 'bytes per key (approx.)')
+
+    print("\n__iter__(), __next__() example")
+    print("------------------------------")
+    m = HashMap(10, hash_function_2)
+    for i in range(5):
+        m.put(str(i), str(i * 24))
+    m.remove('0')
+    m.remove('4')
+    for item in sorted((item.key, item.value) for item in m):
+        print('K:', item[0], 'V:', item[1])
@@ -0,0 +1,345 @@
+# Description: Implementation of a persistent (immutable) HashMap as a hash array
+# mapped trie (HAMT). put() and remove() never modify a map; they return a new
+# version that shares every untouched node with the old one, copying only the
+# O(log32 n) nodes on the path to the changed key. Keeping a reference to a version
+# is therefore an O(1) snapshot: readers can hold on to one while a writer keeps
+# producing new versions, and neither blocks nor copies the other's data. Keys are
+# hashed with the project's hash functions; the result is mixed into 64 bits and
+# consumed 5 bits per trie level, with keys whose hashes are fully equal kept
+# together in a collision node.
+
+
+from DynamicArray_and_SinglyLinkedList import (DynamicArray, HashEntry,
+                        hash_function_1, hash_function_2)
+
+
+# number of hash bits consumed at each level of the trie
+BITS_PER_LEVEL = 5
+LEVEL_MASK = (1 << BITS_PER_LEVEL) - 1
+
+
+def _mix(hash: int) -> int:
+    """
+    Scramble a hash value into 64 well-distributed bits, so that every
+    level of the trie sees a different, evenly spread slice of the hash.
+    """
+    hash = (hash * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    hash ^= hash >> 32
+    hash = (hash * 0xD6E8FEB86659FD93) & 0xFFFFFFFFFFFFFFFF
+    return hash ^ (hash >> 32)
+
+
+class _Leaf:
+    """A single key/value pair stored in the trie, with its mixed hash."""
+    __slots__ = ('key', 'value', 'hash')
+
+    def __init__(self, key: str, value: object, hash: int) -> None:
+        self.key = key
+        self.value = value
+        self.hash = hash
+
+
+class _CollisionNode:
+    """Leaves whose keys are different but whose mixed hashes are identical."""
+    __slots__ = ('hash', 'leaves')
+
+    def __init__(self, hash: int, leaves: tuple) -> None:
+        self.hash = hash
+        self.leaves = leaves
+
+
+class _BitmapNode:
+    """
+    An interior trie node. Bit i of the bitmap is set when the node has a child for
+    hash slice i; the children are stored densely in slice order.
+    """
+    __slots__ = ('bitmap', 'children')
+
+    def __init__(self, bitmap: int, children: tuple) -> None:
+        self.bitmap = bitmap
+        self.children = children
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+
+def _merge_leaves(first: _Leaf, second: _Leaf, shift: int):
+    """Return the smallest subtree, starting at the given shift, holding two leaves."""
+    if first.hash == second.hash:
+        return _CollisionNode(first.hash, (first, second))
+
+    first_slice = (first.hash >> shift) & LEVEL_MASK
+    second_slice = (second.hash >> shift) & LEVEL_MASK
+    if first_slice == second_slice:
+        return _BitmapNode(1 << first_slice, (_merge_leaves(first, second, shift + BITS_PER_LEVEL),))
+
+    if first_slice < second_slice:
+        return _BitmapNode((1 << first_slice) | (1 << second_slice), (first, second))
+    return _BitmapNode((1 << first_slice) | (1 << second_slice), (second, first))
+
+
+def _put(node, shift: int, leaf: _Leaf) -> tuple:
+    """
+    Return (new node, added) for the subtree rooted at node with leaf inserted,
+    where added is True if the key was not already present.
+    """
+    if isinstance(node, _CollisionNode):
+        for index, existing in enumerate(node.leaves):
+            if existing.key == leaf.key:
+                leaves = node.leaves[:index] + (leaf,) + node.leaves[index + 1:]
+                return _CollisionNode(node.hash, leaves), False
+        return _CollisionNode(node.hash, node.leaves + (leaf,)), True
+
+    bit = 1 << ((leaf.hash >> shift) & LEVEL_MASK)
+    position = (node.bitmap & (bit - 1)).bit_count()
+    children = node.children
+
+    # no child for this hash slice yet, so the leaf goes directly in this node
+    if not node.bitmap & bit:
+        return _BitmapNode(node.bitmap | bit, children[:position] + (leaf,) + children[position:]), True
+
+    child = children[position]
+    if isinstance(child, _Leaf):
+        if child.key == leaf.key:
+            new_child, added = leaf, False
+        else:
+            new_child, added = _merge_leaves(child, leaf, shift + BITS_PER_LEVEL), True
+    else:
+        new_child, added = _put(child, shift + BITS_PER_LEVEL, leaf)
+
+    return _BitmapNode(node.bitmap, children[:position] + (new_child,) + children[position + 1:]), added
+
+
+def _remove(node, shift: int, key: str, hash: int):
+    """
+    Return the subtree rooted at node with the key removed: the same node if the key
+    is not present, None if the subtree becomes empty, or a lone leaf when only one
+    leaf remains below a non-root node (so the parent can hold it directly).
+    """
+    if isinstance(node, _CollisionNode):
+        for index, existing in enumerate(node.leaves):
+            if existing.key == key:
+                leaves = node.leaves[:index] + node.leaves[index + 1:]
+                if len(leaves) == 1:
+                    return leaves[0]
+                return _CollisionNode(node.hash, leaves)
+        return node
+
+    bit = 1 << ((hash >> shift) & LEVEL_MASK)
+    if not node.bitmap & bit:
+        return node
+
+    position = (node.bitmap & (bit - 1)).bit_count()
+    children = node.children
+    child = children[position]
+
+    if isinstance(child, _Leaf):
+        if child.key != key:
+            return node
+        new_child = None
+    else:
+        new_child = _remove(child, shift + BITS_PER_LEVEL, key, hash)
+        if new_child is child:
+            return node
+
+    if new_child is None:
+        bitmap = node.bitmap & ~bit
+        children = children[:position] + children[position + 1:]
+        if shift > 0 and len(children) == 1 and isinstance(children[0], _Leaf):
+            return children[0]
+        if not children:
+            return None
+        return _BitmapNode(bitmap, children)
+
+    if shift > 0 and len(children) == 1 and isinstance(new_child, _Leaf):
+        return new_child
+    return _BitmapNode(node.bitmap, children[:position] + (new_child,) + children[position + 1:])
+
+
+class PersistentHashMap:
+    def __init__(self, function: callable = hash_function_1) -> None:
+        """
+        Initialize a new, empty persistent HashMap
+        """
+        self._hash_function = function
+        self._root = _EMPTY_NODE
+        self._size = 0
+
+    def _new_version(self, root: _BitmapNode, size: int) -> "PersistentHashMap":
+        """
+        Return a new map sharing this map's hash function with the given root and size
+        """
+        version = PersistentHashMap.__new__(PersistentHashMap)
+        version._hash_function = self._hash_function
+        version._root = root
+        version._size = size
+        return version
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        return str(self.get_keys_and_values())
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> "PersistentHashMap":
+        """
+        Returns a new version of the map in which the given key is associated with the
+        given value. This map is not changed; the new version shares all of its nodes
+        except those on the path to the key.
+
+        :param key: The key associated with the value to be inserted or updated.
+        :param value: The value to be associated with the given key.
+
+        :return: The new version of the map.
+
+        :complexity: O(log32 n)
+        """
+        leaf = _Leaf(key, value, _mix(self._hash_function(key)))
+        root, added = _put(self._root, 0, leaf)
+        return self._new_version(root, self._size + 1 if added else self._size)
+
+    def remove(self, key: str) -> "PersistentHashMap":
+        """
+        Returns a new version of the map without the given key. If the key is not in
+        the map, this map itself is returned.
+
+        :param key: The key to be removed.
+
+        :return: The new version of the map.
+
+        :complexity: O(log32 n)
+        """
+        root = _remove(self._root, 0, key, _mix(self._hash_function(key)))
+        if root is self._root:
+            return self
+        if root is None:
+            root = _EMPTY_NODE
+        return self._new_version(root, self._size - 1)
+
+    def _find(self, key: str) -> _Leaf:
+        """
+        Returns the leaf holding the given key, or None if the key is not in the map.
+
+        :complexity: O(log32 n)
+        """
+        hash = _mix(self._hash_function(key))
+        node = self._root
+        shift = 0
+        while True:
+            if isinstance(node, _Leaf):
+                return node if node.key == key else None
+
+            if isinstance(node, _CollisionNode):
+                for leaf in node.leaves:
+                    if leaf.key == key:
+                        return leaf
+                return None
+
+            bit = 1 << ((hash >> shift) & LEVEL_MASK)
+            if not node.bitmap & bit:
+                return None
+            node = node.children[(node.bitmap & (bit - 1)).bit_count()]
+            shift += BITS_PER_LEVEL
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value associated with the given key, or None if the key is not in the map.
+
+        :complexity: O(log32 n)
+        """
+        leaf = self._find(key)
+        return None if leaf is None else leaf.value
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if the given key is in the map, otherwise it returns False.
+
+        :complexity: O(log32 n)
+        """
+        return self._find(key) is not None
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a dynamic array where each index contains a tuple of a key/value pair
+        stored in the map. The order of the keys in the dynamic array does not matter.
+
+        :complexity: O(n)
+        """
+        new_array = DynamicArray()
+        for hash_entry in self:
+            new_array.append((hash_entry.key, hash_entry.value))
+        return new_array
+
+    def __iter__(self):
+        """
+        Iterates over the key/value pairs of this version of the map as HashEntry objects.
+        Later versions created with put() or remove() do not affect the iteration.
+
+        :complexity: O(n) for the whole iteration
+        """
+        stack = DynamicArray()
+        stack.append(self._root)
+        while stack.length() > 0:
+            node = stack.pop()
+            if isinstance(node, _Leaf):
+                yield HashEntry(node.key, node.value)
+            elif isinstance(node, _CollisionNode):
+                for leaf in node.leaves:
+                    yield HashEntry(leaf.key, leaf.value)
+            else:
+                for child in node.children:
+                    stack.append(child)
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput / get example")
+    print("-----------------")
+    m = PersistentHashMap(hash_function_1)
+    for i in range(150):
+        m = m.put('str' + str(i), i * 100)
+    print(m.get_size(), m.get('str42'), m.get('str150'), m.contains_key('str7'))
+
+    print("\nsnapshot example")
+    print("----------------")
+    snapshot = m
+    for i in range(150):
+        m = m.put('str' + str(i), -i)
+    for i in range(0, 150, 2):
+        m = m.remove('str' + str(i))
+    result = True
+    for i in range(150):
+        # the snapshot still sees every original value
+        result &= snapshot.get('str' + str(i)) == i * 100
+        # the current version sees the updates and removals
+        result &= m.get('str' + str(i)) == (None if i % 2 == 0 else -i)
+    print(result, snapshot.get_size(), m.get_size())
+
+    print("\nremove example")
+    print("--------------")
+    m = PersistentHashMap(hash_function_2)
+    for i in range(1000):
+        m = m.put('key' + str(i), i)
+    print(m.remove('missing') is m)
+    for i in range(1000):
+        m = m.remove('key' + str(i))
+    print(m.get_size(), m.get_keys_and_values().length(), m.get('key1'))
+
+    print("\niteration example")
+    print("-----------------")
+    m = PersistentHashMap(hash_function_2)
+    for i in range(5):
+        m = m.put(str(i), str(i * 24))
+    m = m.remove('0').remove('4')
+    for item in sorted((item.key, item.value) for item in m):
+        print('K:', item[0], 'V:', item[1])
@@ -6,43 +6,98 @@
 # to store the hash table and chaining for collision resolution with singly linked lists.
 # The HashMap class includes methods for inserting, resizing, retrieving, checking,
 # and removing key/value pairs, as well as clearing the hash map. The table resizes
-# when the load factor exceeds 1.0 to maintain performance. The class also includes a
-# standalone function, find_mode, which determines the mode(s) and their frequency in a
-# given dynamic array. Pre-written hash functions ensure efficient key indexing, and the
-# implementation can handle between 0 and 1,000,000 elements reliably.
+# when the load factor exceeds 1.0 to maintain performance (the threshold, growth factor
+# and an optional shrink threshold can be set per map, or tuned automatically toward a
+# target average chain length). The class also includes a standalone function,
+# find_mode, which determines the mode(s) and their frequency in a given dynamic array,
+# built on the Counter class (a counting HashMap with most_common(k)). Pre-written hash
+# functions ensure efficient key indexing, and the implementation can handle between 0
+# and 1,000,000 elements reliably.
 
 
-from DynamicArray_and_SinglyLinkedList import (DynamicArray, LinkedList,
+import math
+from array import array
+
+from DynamicArray_and_SinglyLinkedList import (DynamicArray, LinkedList, SLNode,
                         hash_function_1, hash_function_2)
+from bloom_filter import CountingBloomFilter
+from skip_list import SkipList
+
+
+# maps start by storing up to this many entries in a flat array, without hashing
+SMALL_MAP_SIZE = 8
+
+# most nodes freed by removals that a map keeps for reuse by later inserts
+NODE_POOL_SIZE = 1024
+
+# bounds for the max load factor chosen by auto-tuning
+MIN_TUNED_LOAD_FACTOR = 0.5
+MAX_TUNED_LOAD_FACTOR = 4.0
 
 
 class HashMap:
     def __init__(self,
                  capacity: int = 11,
-                 function: callable = hash_function_1) -> None:
+                 function: callable = hash_function_1,
+                 bloom_filter: bool = False,
+                 ordered: bool = False,
+                 max_load_factor: float = 1.0,
+                 growth_factor: float = 2.0,
+                 min_load_factor: float = 0.0,
+                 target_probe_length: float = None,
+                 small_map_size: int = SMALL_MAP_SIZE,
+                 node_pool_size: int = NODE_POOL_SIZE) -> None:
         """
         Initialize new HashMap that uses
-        separate chaining for collision resolution
-        DO NOT CHANGE THIS METHOD IN ANY WAY (pre-written by professor)
+        separate chaining for collision resolution.
+        If bloom_filter is True, a counting Bloom filter answers definite misses.
+        If ordered is True, a skip list of the keys supports sorted and range queries.
+        The table grows by growth_factor when its load factor reaches max_load_factor,
+        and shrinks (never below its initial capacity) when a removal leaves it below
+        min_load_factor. If target_probe_length is given, max_load_factor is retuned
+        at every growth from the measured average chain search length.
+        Up to small_map_size entries are kept in a flat array and found by comparing
+        keys, without hashing; the table is allocated when the map grows past that.
+        Up to node_pool_size nodes freed by removals are kept and reused by inserts.
         """
-        self._buckets = DynamicArray()
+        self._check_load_factors(max_load_factor, growth_factor, min_load_factor)
 
         # capacity must be a prime number
         self._capacity = self._next_prime(capacity)
-        for _ in range(self._capacity):
-            self._buckets.append(LinkedList())
+        self._small_map_size = small_map_size
+        self._allocate_storage()
 
         self._hash_function = function
         self._size = 0
 
+        self._max_load_factor = max_load_factor
+        self._growth_factor = growth_factor
+        self._min_load_factor = min_load_factor
+        self._target_probe_length = target_probe_length
+        self._min_capacity = self._capacity
+
+        # sized for the most entries the table holds before it resizes
+        self._bloom = CountingBloomFilter(self._bloom_capacity()) if bloom_filter else None
+
+        # ordered index of the keys, kept alongside the table
+        self._ordered = SkipList() if ordered else None
+
+        # nodes freed by removals, linked through their next fields
+        self._node_pool_size = node_pool_size
+        self._free_nodes = None
+        self._free_count = 0
+
     def __str__(self) -> str:
         """
         Override string method to provide more readable output
-        DO NOT CHANGE THIS METHOD IN ANY WAY (pre-written by professor)
+        The output format is pre-written by the professor; the body reads the active
+        storage through _table_view(), which shows empty buckets and small maps
+        without allocating them.
         """
+        buckets = self._table_view()
         out = ''
-        for i in range(self._buckets.length()):
-            out += str(i) + ': ' + str(self._buckets[i]) + '\n'
+        for i in range(buckets.length()):
+            out += str(i) + ': ' + str(buckets[i]) + '\n'
         return out
 
     def _next_prime(self, capacity: int) -> int:
@@ -92,6 +147,181 @@ class HashMap:
         """
         return self._capacity
 
+    @staticmethod
+    def _check_load_factors(max_load_factor: float, growth_factor: float, min_load_factor: float) -> None:
+        """
+        Raise ValueError unless the thresholds are usable: a shrink must never leave the
+        table at or above the load factor that triggers the next growth.
+        """
+        if max_load_factor <= 0:
+            raise ValueError('max_load_factor must be positive')
+        if growth_factor <= 1:
+            raise ValueError('growth_factor must be greater than 1')
+        if min_load_factor < 0 or min_load_factor * growth_factor >= max_load_factor:
+            raise ValueError('min_load_factor must be at least 0 and less than max_load_factor / growth_factor')
+
+    def load_factor_settings(self) -> dict:
+        """
+        Return the current max load factor, growth factor and min load factor,
+        and the target probe length if auto-tuning is enabled.
+        """
+        return {'max_load_factor': self._max_load_factor,
+                'growth_factor': self._growth_factor,
+                'min_load_factor': self._min_load_factor,
+                'target_probe_length': self._target_probe_length}
+
+    def _allocate_storage(self) -> None:
+        """
+        Start with an empty flat array of nodes if small maps are enabled,
+        otherwise with an empty table.
+        """
+        if self._small_map_size > 0:
+            self._buckets = None
+            self._stamps = None
+            self._small = DynamicArray()
+        else:
+            self._allocate_table()
+            self._small = None
+
+    def _allocate_table(self) -> None:
+        """
+        Creates an empty table of the map's capacity. No linked list is allocated
+        until a key is inserted into its bucket: an empty bucket is None, or a list
+        stamped with an older generation than the table's (left behind by clear()).
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        self._buckets = DynamicArray.filled(self._capacity, None)
+        self._stamps = array('Q', [0]) * self._capacity
+        self._generation = 0
+        # number of buckets holding at least one node
+        self._occupied = 0
+
+    def _chain(self, index: int) -> LinkedList:
+        """
+        Returns the linked list of the bucket at the given index, or None if the
+        bucket is empty.
+
+        :complexity: O(1)
+        """
+        linked_list = self._buckets.get_unchecked(index)
+        if linked_list is None or self._stamps[index] != self._generation:
+            return None
+        return linked_list
+
+    def _chain_for_insert(self, index: int) -> LinkedList:
+        """
+        Returns the linked list of the bucket at the given index, allocating an
+        empty one (and discarding a list from before the last clear()) if needed.
+
+        :complexity: O(1)
+        """
+        linked_list = self._buckets.get_unchecked(index)
+        if linked_list is None or self._stamps[index] != self._generation:
+            linked_list = LinkedList()
+            self._buckets.set_unchecked(index, linked_list)
+            self._stamps[index] = self._generation
+        return linked_list
+
+    def _table_view(self) -> DynamicArray:
+        """
+        Returns the buckets for printing, with an empty linked list for every empty
+        bucket, without allocating them in the table. A small map is shown as the table
+        it would switch to, grown by the growth factor as put() would grow it, holding
+        copies of its nodes.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        view = DynamicArray()
+        if self._small is None:
+            for index in range(self._capacity):
+                linked_list = self._chain(index)
+                view.append(LinkedList() if linked_list is None else linked_list)
+            return view
+
+        capacity = self._capacity
+        for position in range(self._small.length()):
+            if position / capacity >= self._max_load_factor:
+                capacity = self._next_prime(int(capacity * self._growth_factor))
+
+        for _ in range(capacity):
+            view.append(LinkedList())
+        for position in range(self._small.length()):
+            node = self._small.get_unchecked(position)
+            view.get_unchecked(self._hash_function(node.key) % capacity).insert(node.key, node.value)
+        return view
+
+    def _small_find(self, key: str) -> int:
+        """
+        Returns the position of the key in the flat array of a small map, or -1.
+
+        :complexity: O(n), where n is at most the small map size
+        """
+        small = self._small
+        for position in range(small.length()):
+            if small.get_unchecked(position).key == key:
+                return position
+        return -1
+
+    def _small_insert(self, key: str, value: object) -> None:
+        """
+        Adds a key that is not in the small map, switching to the hashed table
+        first if the flat array is full.
+
+        :complexity: O(1), or O(n) when the map switches to the table
+        """
+        if self._small.length() < self._small_map_size:
+            self._small.append(self._new_node(key, value))
+            self._size += 1
+            if self._ordered is not None:
+                self._ordered.add(key)
+            return
+
+        self._upgrade()
+        hash = self._hash_function(key)
+        self._insert_into(self._bucket_for_insert(hash), key, value, hash)
+
+    def _upgrade(self) -> None:
+        """
+        Switches a small map to the hashed table, hashing every node of the flat array
+        into a table of the map's capacity.
+
+        :complexity: O(n), where n is at most the small map size
+        """
+        small = self._small
+        self._small = None
+        self._allocate_table()
+        self._size = 0
+        for position in range(small.length()):
+            # link the flat array's own nodes into the table
+            node = small.get_unchecked(position)
+            node.hash = self._hash_function(node.key)
+            self._link_node(self._bucket_for_insert(node.hash), node)
+
+    def _nodes(self):
+        """
+        Yields every node of the hash map, from the flat array of a small map or
+        from the chains of the table.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        if self._small is not None:
+            for position in range(self._small.length()):
+                yield self._small.get_unchecked(position)
+            return
+
+        for bucket in range(self._capacity):
+            linked_list = self._chain(bucket)
+            if linked_list is not None:
+                yield from linked_list
+
+    def _bloom_capacity(self) -> int:
+        """
+        Return the number of entries the Bloom filter is sized for: the most the table
+        holds before it resizes.
+        """
+        return int(self._capacity * self._max_load_factor) + 1
+
     # ------------------------------------------------------------------ #
 
     def put(self, key: str, value: object) -> None:
@@ -100,9 +330,10 @@ class HashMap:
         the hash map, its associated value is replaced with the new value. If the given
         key is not in the hash map, a new key/value pair is added.
 
-        If the current load factor of the table is greater than or equal to 1.0 when this
-        method is called, the table is resized to the first prime number greater than or
-        equal to double its current capacity.
+        If the current load factor of the table is greater than or equal to the max load
+        factor (1.0 by default) when this method is called, the table is resized to the first
+        prime number greater than or equal to its current capacity times the growth factor
+        (double its current capacity by default).
 
         :param key: The key associated with the value to be inserted or updated in the hash map.
         :param value: The value to be associated with the given key.
@@ -110,19 +341,21 @@ class HashMap:
         :pre-conditions: DynamicArray class must be implemented.
 
         :post-conditions: The key/value pair is added to the hash map, or the existing key's
-            value is updated. If the load factor is >= 1.0, the hash map's capacity is increased
-            and elements are rehashed.
+            value is updated. If the load factor is >= the max load factor, the hash map's
+            capacity is increased and elements are rehashed.
 
         :complexity: Average case - O(1)
         """
-        # if the load factor is greater than or equal to 1.0, then resize to double the capacity
-        if self.table_load() >= 1.0:
-            self.resize_table(self._capacity * 2)
+        if self._small is not None:
+            position = self._small_find(key)
+            if position == -1:
+                self._small_insert(key, value)
+            else:
+                self._small.get_unchecked(position).value = value
+            return
 
-        # calculate the bucket index using the hashfunction- O(1)
-        bucket_index = self._hash_function(key) % self.get_capacity()
-        # save the linked_list at the hashed index
-        bucket = self._buckets.get_at_index(bucket_index)
+        hash = self._hash_function(key)
+        bucket = self._bucket_for_insert(hash)
 
         # check if the key already exists in the LinkedList- O(1) on average since the load
         # factor is maintained at a reasonable level (less than 1.0) with resizing
@@ -133,20 +366,135 @@ class HashMap:
             node.value = value
         # if the key is not in the LinkedList
         else:
-            bucket.insert(key, value)
-            self._size += 1
+            self._insert_into(bucket, key, value, hash)
+
+    def _bucket_for_insert(self, hash: int) -> LinkedList:
+        """
+        Returns the bucket (linked list) for a key with the given hash value, ready for an
+        insert or update. If the load factor is greater than or equal to the max load factor,
+        the table is first grown by the growth factor.
+
+        :complexity: O(1), or O(n) when the table is resized
+        """
+        # if the load factor has reached the max load factor, then grow the table
+        if self.table_load() >= self._max_load_factor:
+            self._grow()
+
+        # return the linked_list at the hashed index (index is already reduced modulo capacity)
+        return self._chain_for_insert(hash % self._capacity)
+
+    def _grow(self) -> None:
+        """
+        Resizes the table by the growth factor. With auto-tuning enabled, the max load
+        factor is first adjusted from the average chain search length measured at the
+        load factor the table has just reached.
+
+        :complexity: O(n)
+        """
+        if self._target_probe_length is not None and self._size > 0:
+            self._tune_max_load_factor(self.average_probe_length())
+        self.resize_table(int(self._capacity * self._growth_factor))
+
+    def _tune_max_load_factor(self, measured: float) -> None:
+        """
+        Moves the max load factor toward the highest load that meets the target
+        average search length. A successful search examines about 1 + load / 2 nodes,
+        so the load is scaled by (target - 1) / (measured - 1), limited to a 25% change
+        per growth and to the tuning bounds.
+
+        :complexity: O(1)
+        """
+        if measured > 1:
+            ratio = (self._target_probe_length - 1) / (measured - 1)
+        else:
+            ratio = 1.25
+        ratio = min(1.25, max(0.75, ratio))
+        load_factor = min(MAX_TUNED_LOAD_FACTOR, max(MIN_TUNED_LOAD_FACTOR, self._max_load_factor * ratio))
+
+        self._max_load_factor = load_factor
+        # keep shrinking from re-triggering growth
+        self._min_load_factor = min(self._min_load_factor, load_factor / self._growth_factor / 2)
+
+    def _shrink_if_sparse(self) -> None:
+        """
+        Resizes the table down by the growth factor, but not below its initial capacity,
+        when its load factor has fallen below the min load factor.
+
+        :complexity: O(1), or O(n) when the table is resized
+        """
+        if self._size < self._capacity * self._min_load_factor and self._capacity > self._min_capacity:
+            self.resize_table(max(self._min_capacity, int(self._capacity / self._growth_factor)))
+
+    def _insert_into(self, bucket: LinkedList, key: str, value: object, hash: int) -> None:
+        """
+        Adds a new key/value pair to the given bucket, which must not already contain the key,
+        caching the key's hash value in the new node. A node freed by an earlier removal
+        is reused if one is available.
+
+        :complexity: O(1)
+        """
+        self._link_node(bucket, self._new_node(key, value, hash))
+
+    def _new_node(self, key: str, value: object, hash: int = None) -> SLNode:
+        """
+        Returns a node holding the given key/value pair, taken from the pool of freed
+        nodes if it is not empty.
+
+        :complexity: O(1)
+        """
+        node = self._free_nodes
+        if node is None:
+            return SLNode(key, value, None, hash)
+
+        self._free_nodes = node.next
+        self._free_count -= 1
+        node.key = key
+        node.value = value
+        node.next = None
+        node.hash = hash
+        return node
+
+    def _link_node(self, bucket: LinkedList, node: SLNode) -> None:
+        """
+        Links a node whose key is not yet in the hash map into the given bucket.
+
+        :complexity: O(1)
+        """
+        if bucket.length() == 0:
+            self._occupied += 1
+        bucket.insert_node(node)
+        self._size += 1
+        if self._bloom is not None:
+            self._bloom.add(node.key)
+        if self._ordered is not None:
+            self._ordered.add(node.key)
+
+    def _release_node(self, node: SLNode) -> None:
+        """
+        Keeps a node removed from the table for reuse, unless the pool is full.
+        Its key and value are dropped so the pool holds no references to them.
+
+        :complexity: O(1)
+        """
+        if self._free_count < self._node_pool_size:
+            node.key = node.value = None
+            node.next = self._free_nodes
+            self._free_nodes = node
+            self._free_count += 1
 
     def resize_table(self, new_capacity: int) -> None:
         """
         Changes the capacity of the underlying table. All existing key/value pairs
-        are put into the new table (hash table links are rehashed).
+        are put into the new table (hash table links are rehashed): each node is
+        relinked into its new bucket rather than copied.
 
         If the specified new capacity is less than 1, this method does nothing.
         Otherwise, it adjusts the capacity to the next prime number greater
         than or equal to the given new capacity.
 
-        If the load factor of the hash table is greater than 1 when this method is called,
-        it continues to resize the table until the load factor is less than or equal to 1.
+        If the load factor of the hash table is greater than the max load factor when this
+        method is called, it continues to grow the table until the load factor is less than
+        or equal to the max load factor.
 
         :param new_capacity: The desired new capacity for the hash table.
 
@@ -159,6 +507,9 @@ class HashMap:
         if new_capacity < 1:
             return
 
+        if self._small is not None:
+            self._upgrade()
+
         # If new_capacity is 1 or more, make sure it is a prime number.
         # If not, change it to the next highest prime number.
         if self._is_prime(new_capacity) is False:
@@ -167,30 +518,42 @@ class HashMap:
         else:
             self._capacity = new_capacity
 
-        # continuously resize if the load factor is greater than 1
-        while self.table_load() > 1:
-            self._capacity = self._next_prime(self._capacity * 2)
-
-        # create a new array
-        new_array = DynamicArray()
-
-        # each bucket is an empty linked list
-        for index in range(self._capacity):
-            new_array.append(LinkedList())
-
-        # Rehash all key/value pairs into the new table
-        for index in range(self._buckets.length()):
-            linked_list = self._buckets.get_at_index(index)
-            # iterate through the nodes of the linkedlist (if there are any)
+        # continuously resize if the load factor is greater than the max load factor
+        while self.table_load() > self._max_load_factor:
+            self._capacity = self._next_prime(int(self._capacity * self._growth_factor))
+
+        # create a new table; its linked lists are allocated as nodes are hashed into them
+        old_buckets, old_stamps, old_generation = self._buckets, self._stamps, self._generation
+        self._allocate_table()
+
+        # rebuild the Bloom filter for the new capacity alongside the table
+        if self._bloom is not None:
+            self._bloom = CountingBloomFilter(self._bloom_capacity())
+
+        # Rehash all key/value pairs into the new table. Every bucket of the new table
+        # has the current stamp, so an empty one is simply None
+        capacity = self._capacity
+        new_array = self._buckets
+        bloom = self._bloom
+        for linked_list, stamp in zip(old_buckets.to_list(), old_stamps):
+            # skip empty buckets, including lists left behind by clear()
+            if linked_list is None or stamp != old_generation:
+                continue
+            # iterate through the nodes of the linkedlist;
+            # the iterator has already moved past a node when it is relinked
             for node in linked_list:
                 # calculate the new index of the node (based on new capacity)
-                new_index = self._hash_function(node.key) % self._capacity
-                new_bucket = new_array.get_at_index(new_index)      # the new linked_list
-                # hash the node into the correct linkedlist in the new array
-                new_bucket.insert(node.key, node.value)
-
-        # reassign the HashMap to the newly created DynamicArray
-        self._buckets = new_array
+                # from its cached hash value rather than rehashing the key
+                new_index = node.hash % capacity
+                new_bucket = new_array.get_unchecked(new_index)      # the new linked_list
+                if new_bucket is None:
+                    new_bucket = LinkedList()
+                    new_array.set_unchecked(new_index, new_bucket)
+                    self._occupied += 1
+                # relink the existing node into the correct linkedlist in the new array
+                new_bucket.insert_node(node)
+                if bloom is not None:
+                    bloom.add(node.key)
 
     def table_load(self) -> float:
         """
@@ -213,16 +576,17 @@ class HashMap:
 
         :return: The number of empty buckets in the hash table.
 
-        :complexity: O(n)
+        :complexity: O(1), or O(n) for a small map, where n is at most the small map size
         """
-        # iterate through each bucket and count how many contain no active key-value pairs
-        empty = 0
-        for bucket in range(self._capacity):
-            linked_list = self._buckets.get_at_index(bucket)
-            if linked_list.length() == 0:
-                empty += 1
+        # a small map's table will have a bucket for every distinct hash index of its keys
+        if self._small is not None:
+            used = set()
+            for position in range(self._small.length()):
+                used.add(self._hash_function(self._small.get_unchecked(position).key) % self._capacity)
+            return self._capacity - len(used)
 
-        return empty
+        # the table counts its non-empty buckets as nodes are inserted and removed
+        return self._capacity - self._occupied
 
     def get(self, key: str):
         """
@@ -235,18 +599,28 @@ class HashMap:
 
         :complexity: Average case - O(1)
         """
+        if self._small is not None:
+            position = self._small_find(key)
+            return None if position == -1 else self._small.get_unchecked(position).value
+
+        # a definite miss in the Bloom filter means the chain need not be walked
+        if self._bloom is not None and not self._bloom.might_contain(key):
+            return None
+
         # calculate the bucket index using the hash function
         index = self._hash_function(key) % self._capacity
 
         # retrieve the linked list at the computed index
-        linked_list = self._buckets.get_at_index(index)
+        linked_list = self._chain(index)
 
         # search for the key in the linked list - O(n) where n is the length of linked list
         # this should be efficient on average due to the load factor management
-        node = linked_list.contains(key)
+        node = None if linked_list is None else linked_list.contains(key)
 
         # if the key is not found
         if node is None:
+            if self._bloom is not None:
+                self._bloom.record_false_positive()
             return None
 
         # if the key is found, return the associated value
@@ -262,13 +636,21 @@ class HashMap:
 
         :complexity: Average case - O(1)
         """
+        if self._small is not None:
+            return self._small_find(key) != -1
+
+        if self._bloom is not None and not self._bloom.might_contain(key):
+            return False
+
         index = self._hash_function(key) % self._capacity
 
-        linked_list = self._buckets.get_at_index(index)
+        linked_list = self._chain(index)
 
-        node = linked_list.contains(key)
+        node = None if linked_list is None else linked_list.contains(key)
 
         if node is None:
+            if self._bloom is not None:
+                self._bloom.record_false_positive()
             return False
 
         return True
@@ -285,14 +667,254 @@ class HashMap:
 
         :complexity: Average case - O(1)
         """
+        self.pop(key)
+
+    def increment(self, key: str, delta: object = 1) -> object:
+        """
+        Adds delta to the value associated with the given key, hashing the key once.
+        If the key is not in the hash map, it is added with delta as its value.
+
+        :param key: The key whose value is to be incremented.
+        :param delta: The amount to add to the value.
+
+        :return: The new value associated with the key.
+
+        :complexity: Average case - O(1)
+        """
+        if self._small is not None:
+            position = self._small_find(key)
+            if position == -1:
+                self._small_insert(key, delta)
+                return delta
+            node = self._small.get_unchecked(position)
+            node.value += delta
+            return node.value
+
+        hash = self._hash_function(key)
+        bucket = self._bucket_for_insert(hash)
+        node = bucket.contains(key)
+        if node is None:
+            self._insert_into(bucket, key, delta, hash)
+            return delta
+
+        node.value += delta
+        return node.value
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Returns the value associated with the given key, hashing the key once. If the
+        key is not in the hash map, it is added with default as its value.
+
+        :param key: The key whose value is to be returned.
+        :param default: The value to add if the key is not in the hash map.
+
+        :return: The value associated with the key after the call.
+
+        :complexity: Average case - O(1)
+        """
+        if self._small is not None:
+            position = self._small_find(key)
+            if position == -1:
+                self._small_insert(key, default)
+                return default
+            return self._small.get_unchecked(position).value
+
+        hash = self._hash_function(key)
+        bucket = self._bucket_for_insert(hash)
+        node = bucket.contains(key)
+        if node is None:
+            self._insert_into(bucket, key, default, hash)
+            return default
+
+        return node.value
+
+    def update(self, key: str, function: callable, default: object = None) -> object:
+        """
+        Replaces the value associated with the given key by function(value), hashing the
+        key once. If the key is not in the hash map, it is added with function(default)
+        as its value.
+
+        :param key: The key whose value is to be updated.
+        :param function: A function computing the new value from the current one.
+        :param default: The current value to assume if the key is not in the hash map.
+
+        :return: The new value associated with the key.
+
+        :complexity: Average case - O(1), plus the cost of function
+        """
+        if self._small is not None:
+            position = self._small_find(key)
+            if position == -1:
+                value = function(default)
+                self._small_insert(key, value)
+                return value
+            node = self._small.get_unchecked(position)
+            node.value = function(node.value)
+            return node.value
+
+        hash = self._hash_function(key)
+        bucket = self._bucket_for_insert(hash)
+        node = bucket.contains(key)
+        if node is None:
+            value = function(default)
+            self._insert_into(bucket, key, value, hash)
+            return value
+
+        node.value = function(node.value)
+        return node.value
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes the given key from the hash map and returns its associated value.
+
+        :param key: The key for the key/value pair to be removed from the hash map.
+        :param default: The value to return if the key is not in the hash map.
+
+        :return: The value that was associated with the key, or default if the key
+                 is not in the hash map.
+
+        :complexity: Average case - O(1)
+        """
+        if self._small is not None:
+            position = self._small_find(key)
+            if position == -1:
+                return default
+            # move the last node into the removed node's place
+            node = self._small.get_unchecked(position)
+            last = self._small.pop()
+            if position < self._small.length():
+                self._small.set_unchecked(position, last)
+            self._size -= 1
+            if self._ordered is not None:
+                self._ordered.remove(key)
+            value = node.value
+            self._release_node(node)
+            return value
+
         index = self._hash_function(key) % self._capacity
 
-        linked_list = self._buckets.get_at_index(index)
+        linked_list = self._chain(index)
+        if linked_list is None:
+            return default
 
         # attempt to remove the key from the linked list
-        # if the key is found and removed, the remove method returns True
-        if linked_list.remove(key) is True:
-            self._size -= 1
+        # if the key is found and removed, the removed node is returned
+        node = linked_list.remove_node(key)
+        if node is None:
+            return default
+
+        # release the list of a bucket that is now empty
+        if linked_list.length() == 0:
+            self._buckets.set_unchecked(index, None)
+            self._occupied -= 1
+        self._size -= 1
+        if self._bloom is not None:
+            self._bloom.remove(key)
+        if self._ordered is not None:
+            self._ordered.remove(key)
+        value = node.value
+        self._release_node(node)
+        if self._min_load_factor:
+            self._shrink_if_sparse()
+        return value
+
+    def probe_length(self, key: str) -> int:
+        """
+        Returns the number of chain nodes a lookup of the given key examines, whether
+        or not the key is in the hash map. Used for sampling chain lengths.
+
+        :complexity: Average case - O(1)
+        """
+        if self._small is not None:
+            position = self._small_find(key)
+            return self._small.length() if position == -1 else position + 1
+
+        linked_list = self._chain(self._hash_function(key) % self._capacity)
+        if linked_list is None:
+            return 0
+
+        probes = 0
+        for node in linked_list:
+            probes += 1
+            if node.key == key:
+                break
+        return probes
+
+    def average_probe_length(self) -> float:
+        """
+        Returns the average number of chain nodes examined by a successful lookup,
+        taken over every key in the hash map.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        if self._size == 0:
+            return 0.0
+
+        # the key at position i of a small map's flat array is found after i + 1 comparisons
+        if self._small is not None:
+            return (self._size + 1) / 2
+
+        total = 0
+        for bucket in range(self._capacity):
+            linked_list = self._chain(bucket)
+            if linked_list is None:
+                continue
+            # finding each of the chain's keys costs 1, 2, ..., length comparisons
+            length = linked_list.length()
+            total += length * (length + 1) // 2
+        return total / self._size
+
+    def merge(self, other, combine: callable = None) -> None:
+        """
+        Adds every key/value pair of another map into this hash map. For a key found in
+        both maps, the new value is combine(this map's value, other's value), or other's
+        value if no combine function is given (last writer wins).
+
+        The table is resized once up front for the combined size rather than repeatedly
+        while merging, and if other is a separate chaining HashMap with the same hash
+        function, its cached hash values are reused instead of rehashing every key.
+
+        :param other: The map to merge into this one. It is not modified.
+        :param combine: A function of (existing value, incoming value) returning the merged value.
+
+        :post-conditions: This hash map contains every key of both maps.
+
+        :complexity: O(n + m), where n and m are the sizes of the two maps
+        """
+        if self._small is not None:
+            self._upgrade()
+
+        # presize so that no insert made by the merge triggers a resize
+        combined = self._size + other.get_size()
+        if combined > self._capacity * self._max_load_factor:
+            self.resize_table(math.ceil(combined / self._max_load_factor))
+
+        if not isinstance(other, HashMap) or other._small is not None:
+            pairs = other.get_keys_and_values()
+            for index in range(pairs.length()):
+                key, value = pairs.get_unchecked(index)
+                self._merge_one(key, value, self._hash_function(key), combine)
+            return
+
+        same_function = other._hash_function is self._hash_function
+        for node in other._nodes():
+            hash = node.hash if same_function else self._hash_function(node.key)
+            self._merge_one(node.key, node.value, hash, combine)
+
+    def _merge_one(self, key: str, value: object, hash: int, combine: callable) -> None:
+        """
+        Inserts or combines a single key/value pair for merge().
+
+        :complexity: Average case - O(1)
+        """
+        bucket = self._bucket_for_insert(hash)
+        node = bucket.contains(key)
+        if node is None:
+            self._insert_into(bucket, key, value, hash)
+        elif combine is None:
+            node.value = value
+        else:
+            node.value = combine(node.value, value)
 
     def get_keys_and_values(self) -> DynamicArray:
         """
@@ -308,10 +930,18 @@ class HashMap:
         """
         new_array = DynamicArray()
 
+        if self._small is not None:
+            for position in range(self._small.length()):
+                node = self._small.get_unchecked(position)
+                new_array.append((node.key, node.value))
+            return new_array
+
         # iterate through the hash table searching for valid key/value pairs
         # the for loops are working *together* to iterate over the n elements in HashMap
         for bucket in range(self._capacity):
-            linked_list = self._buckets.get_at_index(bucket)
+            linked_list = self._chain(bucket)
+            if linked_list is None:
+                continue
             for node in linked_list:
                 key_value_pair = (node.key, node.value)
                 new_array.append(key_value_pair)
@@ -325,16 +955,239 @@ class HashMap:
         :post-conditions: All key/value pairs in the hash map are removed.
                           The size of the hash map is set to 0.
 
+        With small maps enabled, the table is dropped and the map returns to small mode,
+        as the open addressing HashMap does. With small_map_size=0, the table is kept
+        and invalidated by advancing its generation rather than by replacing every
+        bucket: linked lists stamped with an older generation count as empty, and are
+        discarded when a key is next inserted into their bucket or the table is resized.
+        Until then, the cleared lists and their nodes stay reachable, so clear() does
+        not release the memory they hold.
+
+        :complexity: O(1), plus O(m) to clear a Bloom filter of m counters
+        """
+        if self._small_map_size > 0:
+            self._allocate_storage()
+        else:
+            self._generation += 1
+            self._occupied = 0
+        self._size = 0
+        if self._bloom is not None:
+            self._bloom.clear()
+        if self._ordered is not None:
+            self._ordered.clear()
+
+    def bloom_stats(self) -> dict:
+        """
+        Returns the statistics of the Bloom filter in front of the table, including its
+        estimated and observed false positive rates, or None if the map has no filter.
+
+        :complexity: O(m), where m is the number of counters in the filter.
+        """
+        if self._bloom is None:
+            return None
+        return self._bloom.stats()
+
+    def _require_index(self) -> SkipList:
+        """Return the ordered index, raising ValueError if the map was built without one."""
+        if self._ordered is None:
+            raise ValueError('ordered queries need a HashMap created with ordered=True')
+        return self._ordered
+
+    def min_key(self) -> str:
+        """
+        Returns the smallest key in the hash map, or None if the map is empty.
+        Requires the ordered index.
+
+        :complexity: O(1)
+        """
+        return self._require_index().first()
+
+    def max_key(self) -> str:
+        """
+        Returns the largest key in the hash map, or None if the map is empty.
+        Requires the ordered index.
+
+        :complexity: O(log n) expected
+        """
+        return self._require_index().last()
+
+    def range(self, lo: str = None, hi: str = None) -> DynamicArray:
+        """
+        Returns a dynamic array of the (key, value) pairs with lo <= key < hi, in
+        ascending key order. A bound of None leaves that end of the range open, so
+        range() returns every pair in sorted order. Requires the ordered index.
+
+        :complexity: O(log n + k) expected, where k is the number of pairs returned
+        """
+        new_array = DynamicArray()
+        for key in self._require_index().keys_from(lo):
+            if hi is not None and key >= hi:
+                break
+            new_array.append((key, self.get(key)))
+        return new_array
+
+    def get_sorted_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a dynamic array of every key/value pair in ascending key order, read
+        from the ordered index instead of sorting. Requires the ordered index.
+
         :complexity: O(n)
         """
-        empty_array = DynamicArray()
+        return self.range()
 
-        # each bucket is an empty linked list
-        for index in range(self._capacity):
-            empty_array.append(LinkedList())
 
-        self._buckets = empty_array
-        self._size = 0
+def merge_maps(first: HashMap, second: HashMap, combine: callable = None) -> HashMap:
+    """
+    Merges two hash maps by iterating the smaller one into the larger one, and returns
+    the larger map, which then holds every key. For a key found in both maps, the merged
+    value is combine(first's value, second's value), or second's value if no combine
+    function is given. Useful for reducing per-worker maps into one.
+
+    :return: Whichever of first and second was larger, updated in place.
+
+    :complexity: O(min(n, m)) inserts, where n and m are the sizes of the two maps
+    """
+    if first.get_size() >= second.get_size():
+        first.merge(second, combine)
+        return first
+
+    # the values being merged in come from first, so keep the argument order of combine
+    if combine is None:
+        second.merge(first, lambda existing, incoming: existing)
+    else:
+        second.merge(first, lambda existing, incoming: combine(incoming, existing))
+    return second
+
+
+class Counter(HashMap):
+    """
+    Counting map (multiset) built on the separate chaining HashMap.
+    Each key maps to the number of times it has been added.
+    """
+
+    def add(self, key: str, count: int = 1) -> int:
+        """
+        Adds count occurrences of the given key and returns its new count.
+
+        :complexity: Average case - O(1)
+        """
+        return self.increment(key, count)
+
+    def add_many(self, values) -> None:
+        """
+        Adds one occurrence of every value in the given DynamicArray or iterable.
+
+        :complexity: O(n), where n is the number of values
+        """
+        # DynamicArray deliberately does not support iteration, so index through it
+        if isinstance(values, DynamicArray):
+            for index in range(values.length()):
+                self.increment(values.get_unchecked(index))
+        else:
+            for value in values:
+                self.increment(value)
+
+    def count(self, key: str) -> int:
+        """
+        Returns the number of occurrences of the given key (0 if it was never added).
+
+        :complexity: Average case - O(1)
+        """
+        count = self.get(key)
+        return 0 if count is None else count
+
+    def most_common(self, k: int = None) -> DynamicArray:
+        """
+        Returns a dynamic array of the k (key, count) pairs with the highest counts,
+        ordered from most to least common. Keys with equal counts are ordered by key.
+        If k is None, every key is returned.
+
+        A min-heap holding the k best pairs seen so far is kept while scanning the
+        table, so only O(log k) work is done per key instead of sorting every key.
+
+        :complexity: O(n log k)
+        """
+        if k is None:
+            k = self._size
+
+        # heap entries are (count, key) pairs; the root is the weakest pair kept so far
+        heap = DynamicArray()
+        if k > 0:
+            for node in self._nodes():
+                if heap.length() < k:
+                    heap.append((node.value, node.key))
+                    _sift_up(heap, heap.length() - 1)
+                elif _outranks((node.value, node.key), heap.get_unchecked(0)):
+                    heap.set_unchecked(0, (node.value, node.key))
+                    _sift_down(heap, 0, heap.length())
+
+        # repeatedly move the weakest pair to the end to order the result
+        for end in range(heap.length() - 1, 0, -1):
+            heap.swap(0, end)
+            _sift_down(heap, 0, end)
+
+        result = DynamicArray()
+        for index in range(heap.length()):
+            count, key = heap.get_unchecked(index)
+            result.append((key, count))
+        return result
+
+    def mode(self) -> tuple[DynamicArray, int]:
+        """
+        Returns a tuple of a dynamic array of the most common key(s) and their count.
+        If there is more than one key with the highest count, all of them are included.
+
+        :complexity: O(n)
+        """
+        mode_values = DynamicArray()
+        highest_frequency = 1        # assume there will be at least one element
+
+        # iterate through the nodes to find the mode(s)- O(n)
+        for node in self._nodes():
+            # if the current value has the highest frequency so far
+            if node.value > highest_frequency:
+                # clear the array and add the new mode
+                mode_values = DynamicArray()
+                mode_values.append(node.key)
+                highest_frequency = node.value
+            # if the current value frequency matches the highest frequency
+            elif node.value == highest_frequency:
+                mode_values.append(node.key)
+
+        return mode_values, highest_frequency
+
+
+def _outranks(first: tuple, second: tuple) -> bool:
+    """
+    Return True if the (count, key) pair first belongs ahead of second in
+    most_common(): a higher count wins, and equal counts go to the smaller key.
+    """
+    if first[0] != second[0]:
+        return first[0] > second[0]
+    return first[1] < second[1]
+
+
+def _sift_up(heap: DynamicArray, index: int) -> None:
+    """Move the pair at index up the min-heap (weakest pair at the root) until it is in order."""
+    while index > 0:
+        parent = (index - 1) // 2
+        if not _outranks(heap.get_unchecked(parent), heap.get_unchecked(index)):
+            return
+        heap.swap(parent, index)
+        index = parent
+
+
+def _sift_down(heap: DynamicArray, index: int, end: int) -> None:
+    """Move the pair at index down the min-heap, considering only indices before end."""
+    while True:
+        weakest = index
+        for child in (2 * index + 1, 2 * index + 2):
+            if child < end and _outranks(heap.get_unchecked(weakest), heap.get_unchecked(child)):
+                weakest = child
+        if weakest == index:
+            return
+        heap.swap(index, weakest)
+        index = weakest
 
 
 def find_mode(da: DynamicArray) -> tuple[DynamicArray, int]:
@@ -353,44 +1206,12 @@ def find_mode(da: DynamicArray) -> tuple[DynamicArray, int]:
 
     :complexity: O(n)
     """
-    # initialize a new hash map to store frequency counts- O(1)
-    map = HashMap(da.length())
+    # build a frequency table with the values from the dynamic array- O(n)
+    counter = Counter(da.length())
+    counter.add_many(da)
 
-    # create a frequency table with the values from the dynamic array- O(n)
-    for index in range(da.length()):
-        value = da[index]                    # O(1)
-        if map.contains_key(value):          # O(1) average
-            count = map.get(value) + 1       # O(1) average
-            map.put(str(value), count)       # O(1) average
-
-        else:
-            map.put(str(value), 1)
-
-    # find mode(s)
-    mode_values = DynamicArray()
-    highest_frequency = 1        # assume there will be at least one element
-
-    # call get_keys_and_values to generate list of key/value pairs- O(n)
-    key_value_pairs = map.get_keys_and_values()
-
-    # iterate through key/value pairs to find the mode(s)- O(n)
-    for index in range(key_value_pairs.length()):
-        current_frequency = key_value_pairs[index][1]
-        # if the current value has the highest frequency so far
-        if current_frequency > highest_frequency:
-            # clear the array and add the new mode
-            mode_values = DynamicArray()
-            current_key = key_value_pairs[index][0]
-            mode_values.append(current_key)
-            # update highest frequency
-            highest_frequency = current_frequency
-        # if the current value frequency matches the highest frequency
-        elif current_frequency == highest_frequency:
-            current_key = key_value_pairs[index][0]
-            # add it to the list of modes
-            mode_values.append(current_key)
-
-    return mode_values, highest_frequency
+    # find mode(s)- O(n)
+    return counter.mode()
 
 
 # ------------------- BASIC TESTING ---------------------------------------- #
@@ -663,3 +1484,22 @@ if __name__ == "__main__":
         da = DynamicArray(case)
         mode, frequency = find_mode(da)
         print(f"Input: {da}\nMode : {mode}, Frequency: {frequency}\n")
+
+
+# Examples of the features added after the assignment (not part of the testing segment above).
+
+if __name__ == "__main__":
+
+    print("\nCounter most_common example")
+    print("-----------------------------")
+    counter = Counter()
+    counter.add_many(DynamicArray(["2", "4", "2", "6", "8", "4", "1", "3", "4", "5", "7", "3", "3", "2"]))
+    print(counter.most_common(3), counter.count("4"), counter.count("9"))
+
+    print("\nordered index example")
+    print("---------------------")
+    m = HashMap(11, hash_function_2, ordered=True)
+    for word in ["pear", "apple", "fig", "kiwi", "banana", "cherry", "grape"]:
+        m.put(word, len(word))
+    m.remove("kiwi")
+    print(m.min_key(), m.max_key(), m.range("b", "g"))
@@ -0,0 +1,426 @@
+# Description: Implementation of a separate chaining HashMap that stores its string
+# keys packed in a single byte arena (key_arena.py) instead of as separate str objects
+# held by SLNode objects. Entries live in parallel typed arrays (the next entry in the
+# chain, the key's cached hash, arena offset and encoded length) and each bucket holds
+# the index of the first entry of its chain, so chains are linked by array indexes
+# rather than node objects; only the values remain Python object references. Removed
+# entries are reused through a free list. Lookups compare the cached hash first and
+# then the key's bytes in place in the arena. The public interface and the resizing
+# rule match the separate chaining HashMap in hash_map_sc.py; resizing relinks the
+# existing entries into the new buckets without rehashing or copying any key.
+
+
+from array import array
+
+from DynamicArray_and_SinglyLinkedList import DynamicArray, HashEntry, hash_function_1, hash_function_2
+from key_arena import KeyArena
+
+
+# end of a chain (or of the free list)
+NO_ENTRY = -1
+
+HASH_MASK = 0xFFFFFFFFFFFFFFFF
+
+# removed keys' bytes are reclaimed once they exceed half of the arena and this size
+MIN_GARBAGE = 4096
+
+
+class HashMap:
+    def __init__(self,
+                 capacity: int = 11,
+                 function: callable = hash_function_1) -> None:
+        """
+        Initialize new HashMap with packed keys that uses
+        separate chaining for collision resolution
+        """
+        self._hash_function = function
+        self._capacity = self._next_prime(capacity)
+        self._clear_entries()
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._capacity):
+            pairs = []
+            entry = self._heads[i]
+            while entry != NO_ENTRY:
+                pairs.append('(' + self._key_at(entry) + ': ' + str(self._values.get_unchecked(entry)) + ')')
+                entry = self._next[entry]
+            out += str(i) + ': SLL [' + ' -> '.join(pairs) + ']\n'
+        return out
+
+    def _clear_entries(self) -> None:
+        """
+        Replace the buckets and entries with empty ones at the current capacity.
+        """
+        self._heads = array('q', [NO_ENTRY]) * self._capacity
+        self._next = array('q')
+        self._hashes = array('Q')
+        self._offsets = array('Q')
+        self._lengths = array('I')
+        self._values = DynamicArray()
+        self._free = NO_ENTRY
+        self._arena = KeyArena()
+        self._size = 0
+
+    def _next_prime(self, capacity: int) -> int:
+        """
+        Increment from given number and the find the closest prime number
+        """
+        if capacity % 2 == 0:
+            capacity += 1
+
+        while not self._is_prime(capacity):
+            capacity += 2
+
+        return capacity
+
+    @staticmethod
+    def _is_prime(capacity: int) -> bool:
+        """
+        Determine if given integer is a prime number and return boolean
+        """
+        if capacity == 2 or capacity == 3:
+            return True
+
+        if capacity == 1 or capacity % 2 == 0:
+            return False
+
+        factor = 3
+        while factor ** 2 <= capacity:
+            if capacity % factor == 0:
+                return False
+            factor += 2
+
+        return True
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    def _key_at(self, entry: int) -> str:
+        """Decode the key of the given entry."""
+        return self._arena.decode(self._offsets[entry], self._lengths[entry])
+
+    # ------------------------------------------------------------------ #
+
+    def _find_entry(self, encoded: bytes, hash: int) -> int:
+        """
+        Walks the chain for an encoded key, comparing the arena bytes only when the
+        cached hashes match.
+
+        :return: The index of the key's entry, or NO_ENTRY if the key is not in the hash map.
+
+        :complexity: Average case - O(1)
+        """
+        hashes = self._hashes
+        entry = self._heads[hash % self._capacity]
+        while entry != NO_ENTRY:
+            if hashes[entry] == hash and self._arena.equals(self._offsets[entry], self._lengths[entry], encoded):
+                return entry
+            entry = self._next[entry]
+        return NO_ENTRY
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates the key/value pair in the hash map. If the given key already exists in
+        the hash map, its associated value is replaced with the new value. If the given
+        key is not in the hash map, a new key/value pair is added and the key's bytes
+        are appended to the arena.
+
+        If the current load factor of the table is greater than or equal to 1.0 when this
+        method is called, the table is resized to the first prime number greater than or
+        equal to double its current capacity.
+
+        :param key: The key associated with the value to be inserted or updated in the hash map.
+        :param value: The value to be associated with the given key.
+
+        :post-conditions: The key/value pair is added to the hash map, or the existing key's
+            value is updated.
+
+        :complexity: Average case - O(1)
+        """
+        if self.table_load() >= 1.0:
+            self.resize_table(self._capacity * 2)
+
+        encoded = key.encode('utf-8')
+        hash = self._hash_function(key) & HASH_MASK
+        entry = self._find_entry(encoded, hash)
+        if entry != NO_ENTRY:
+            self._values.set_unchecked(entry, value)
+            return
+
+        offset = self._arena.store(encoded)
+        bucket = hash % self._capacity
+
+        # reuse a removed entry if there is one, otherwise add a new one
+        if self._free != NO_ENTRY:
+            entry = self._free
+            self._free = self._next[entry]
+            self._next[entry] = self._heads[bucket]
+            self._hashes[entry] = hash
+            self._offsets[entry] = offset
+            self._lengths[entry] = len(encoded)
+            self._values.set_unchecked(entry, value)
+        else:
+            entry = len(self._next)
+            self._next.append(self._heads[bucket])
+            self._hashes.append(hash)
+            self._offsets.append(offset)
+            self._lengths.append(len(encoded))
+            self._values.append(value)
+
+        self._heads[bucket] = entry
+        self._size += 1
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the underlying table. Every entry is relinked into the
+        bucket given by its cached hash; no key is rehashed or copied.
+
+        If the specified new capacity is less than 1, this method does nothing.
+        Otherwise, it adjusts the capacity to the next prime number greater
+        than or equal to the given new capacity, and keeps doubling it while the
+        load factor would be greater than 1.
+
+        :param new_capacity: The desired new capacity for the hash table.
+
+        :complexity: O(n)
+        """
+        if new_capacity < 1:
+            return
+
+        capacity = self._next_prime(new_capacity)
+        while self._size / capacity > 1:
+            capacity = self._next_prime(capacity * 2)
+
+        old_heads = self._heads
+        heads = array('q', [NO_ENTRY]) * capacity
+        next_entries = self._next
+        hashes = self._hashes
+
+        for bucket in range(self._capacity):
+            entry = old_heads[bucket]
+            while entry != NO_ENTRY:
+                following = next_entries[entry]
+                new_bucket = hashes[entry] % capacity
+                next_entries[entry] = heads[new_bucket]
+                heads[new_bucket] = entry
+                entry = following
+
+        self._capacity = capacity
+        self._heads = heads
+
+    def _compact_arena(self) -> None:
+        """
+        Copies the keys of every entry into a new arena, dropping the bytes of removed keys.
+
+        :complexity: O(n)
+        """
+        old_arena = self._arena
+        self._arena = KeyArena(old_arena.used() - old_arena.garbage())
+        for bucket in range(self._capacity):
+            entry = self._heads[bucket]
+            while entry != NO_ENTRY:
+                self._offsets[entry] = self._arena.store(old_arena.view(self._offsets[entry], self._lengths[entry]))
+                entry = self._next[entry]
+
+    def table_load(self) -> float:
+        """
+        Computes and returns the current load factor of the hash table.
+
+        :return: The current load factor (float value) of the hash table.
+
+        :complexity: O(1)
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Counts and returns the number of empty buckets in the hash table.
+
+        :return: The number of empty buckets in the hash table.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        empty = 0
+        for bucket in range(self._capacity):
+            if self._heads[bucket] == NO_ENTRY:
+                empty += 1
+        return empty
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value associated with the given key. If the key is not in the hash
+        map, the method returns None.
+
+        :param key: The key whose associated value is to be returned.
+
+        :return: The value associated with the given key, or None if the
+        key is not in the hash map.
+
+        :complexity: Average case - O(1)
+        """
+        entry = self._find_entry(key.encode('utf-8'), self._hash_function(key) & HASH_MASK)
+        if entry == NO_ENTRY:
+            return None
+        return self._values.get_unchecked(entry)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if the given key is in the hash map, otherwise it returns False.
+
+        :param key: The key to check to see if it's in the hash map.
+
+        :return: True if the key is in the hash map, False otherwise.
+
+        :complexity: Average case - O(1)
+        """
+        return self._find_entry(key.encode('utf-8'), self._hash_function(key) & HASH_MASK) != NO_ENTRY
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the given key and its associated value from the hash map.
+        If the key is not in the hash map, the method does nothing. The entry is put
+        on the free list, and once the bytes of removed keys make up more than half of
+        the arena, the remaining keys are copied into a new arena.
+
+        :param key: The key to be removed from the hash map.
+
+        :post-conditions: If the key is found and removed, the size of the hash map is
+        decremented. Otherwise, if the key is not found, the hash map remains unchanged.
+
+        :complexity: Average case - O(1)
+        """
+        encoded = key.encode('utf-8')
+        hash = self._hash_function(key) & HASH_MASK
+        bucket = hash % self._capacity
+
+        previous = NO_ENTRY
+        entry = self._heads[bucket]
+        while entry != NO_ENTRY:
+            if self._hashes[entry] == hash and self._arena.equals(self._offsets[entry], self._lengths[entry], encoded):
+                break
+            previous, entry = entry, self._next[entry]
+        if entry == NO_ENTRY:
+            return
+
+        # unlink the entry from its chain and push it onto the free list
+        if previous == NO_ENTRY:
+            self._heads[bucket] = self._next[entry]
+        else:
+            self._next[previous] = self._next[entry]
+        self._next[entry] = self._free
+        self._free = entry
+        self._values.set_unchecked(entry, None)
+        self._arena.discard(self._lengths[entry])
+        self._size -= 1
+
+        garbage = self._arena.garbage()
+        if garbage > MIN_GARBAGE and garbage > self._arena.used() // 2:
+            self._compact_arena()
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a dynamic array where each index contains a tuple of a
+        key/value pair stored in the hash map.
+
+        :return: DynamicArray containing tuples of key/value pairs from the hash map.
+
+        :complexity: O(n)
+        """
+        new_array = DynamicArray()
+        for bucket in range(self._capacity):
+            entry = self._heads[bucket]
+            while entry != NO_ENTRY:
+                new_array.append((self._key_at(entry), self._values.get_unchecked(entry)))
+                entry = self._next[entry]
+        return new_array
+
+    def clear(self) -> None:
+        """
+        Clears the contents of the hash map. It does not change the underlying hash table capacity.
+
+        :post-conditions: All key/value pairs in the hash map are removed.
+                          The size of the hash map is set to 0.
+
+        :complexity: O(n)
+        """
+        self._clear_entries()
+
+    def __iter__(self):
+        """
+        Iterates over the key/value pairs of the hash map as HashEntry objects.
+
+        :complexity: O(n) for the whole iteration
+        """
+        for bucket in range(self._capacity):
+            entry = self._heads[bucket]
+            while entry != NO_ENTRY:
+                yield HashEntry(self._key_at(entry), self._values.get_unchecked(entry))
+                entry = self._next[entry]
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    import tracemalloc
+
+    import hash_map_sc
+
+    print("\nput / get / remove example")
+    print("--------------------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+    m.put('str7', -7)
+    m.put('ключ', 'unicode')
+    for i in range(0, 150, 2):
+        m.remove('str' + str(i))
+    print(m.get('str7'), m.get('str8'), m.get('ключ'), m.contains_key('str9'), m.get_size())
+
+    print("\nfree list and arena compaction example")
+    print("--------------------------------------")
+    m = HashMap(11, hash_function_2)
+    for round_number in range(5):
+        for i in range(2000):
+            m.put('round' + str(round_number) + '-' + str(i), i)
+        for i in range(2000):
+            m.remove('round' + str(round_number) + '-' + str(i))
+    m.put('survivor', 1)
+    print(m.get_size(), m.get('survivor'), len(m._next), m._arena.used() < 20000)
+
+    print("\nmemory example")
+    print("--------------")
+    keys = ['user' + str(i) for i in range(50000)]
+    for module in (hash_map_sc, None):
+        tracemalloc.start()
+        m = hash_map_sc.HashMap(11, hash_function_2) if module else HashMap(11, hash_function_2)
+        for key in keys:
+            m.put(key, None)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print('SLNode objects' if module else 'packed keys', memory // len(keys) // 10 * 10, 'bytes per key (approx.)')
+
+    print("\n__iter__() example")
+    print("------------------")
+    m = HashMap(10, hash_function_2)
+    for i in range(5):
+        m.put(str(i), str(i * 24))
+    m.remove('0')
+    m.remove('4')
+    for item in sorted((item.key, item.value) for item in m):
+        print('K:', item[0], 'V:', item[1])
@@ -0,0 +1,356 @@
+# Description: Implementation of a read-only open addressing HashMap stored in a
+# multiprocessing.shared_memory segment, so that many worker processes can look keys
+# up in one copy of a large table instead of each holding a private HashMap. A builder
+# process lays out the whole table from an existing map with SharedHashMap.build();
+# workers open it by name with SharedHashMap.attach() and run get()/contains_key()
+# directly on the shared buffer: the slot array and the key bytes are read in place,
+# and only the value of a matching key is decoded.
+#
+# Segment layout (all integers little-endian):
+#   header   magic b'HMSHM001', capacity (8 bytes), size (8 bytes)
+#   slots    capacity x (64-bit hash, offset of the record in the segment; 0 = empty)
+#   records  key length (4 bytes), value tag (1 byte), value length (4 bytes),
+#            UTF-8 key bytes, value bytes
+# Collisions are resolved with linear probing, and the table is built at a load
+# factor of at most 0.5, as in hash_map_oa.py. The hash function must give the same
+# result in every process, so Python's randomized hash() cannot be used.
+
+
+import struct
+from multiprocessing import shared_memory
+
+from DynamicArray_and_SinglyLinkedList import DynamicArray, hash_function_1, hash_function_2
+
+
+MAGIC = b'HMSHM001'
+HEADER = struct.Struct('<8sQQ')
+SLOT = struct.Struct('<QQ')
+RECORD = struct.Struct('<IBI')
+
+HASH_MASK = 0xFFFFFFFFFFFFFFFF
+
+# value tags: values are stored as their raw bytes with one of these type tags
+NONE_VALUE = 0
+STR_VALUE = 1
+BYTES_VALUE = 2
+INT_VALUE = 3
+FLOAT_VALUE = 4
+BOOL_VALUE = 5
+
+INT = struct.Struct('<q')
+FLOAT = struct.Struct('<d')
+
+
+def _encode_value(value: object) -> tuple[int, bytes]:
+    """
+    Return the (tag, bytes) stored for a value.
+
+    :raises TypeError: If the value is not None, a bool, int, float, str or bytes.
+    :raises OverflowError: If an int value does not fit in a signed 64-bit integer.
+    """
+    if value is None:
+        return NONE_VALUE, b''
+    if isinstance(value, bool):
+        return BOOL_VALUE, b'\x01' if value else b'\x00'
+    if isinstance(value, int):
+        if not -2 ** 63 <= value < 2 ** 63:
+            raise OverflowError(f'SharedHashMap cannot store the int {value}: it does not fit in 64 bits')
+        return INT_VALUE, INT.pack(value)
+    if isinstance(value, float):
+        return FLOAT_VALUE, FLOAT.pack(value)
+    if isinstance(value, str):
+        return STR_VALUE, value.encode('utf-8')
+    if isinstance(value, (bytes, bytearray)):
+        return BYTES_VALUE, bytes(value)
+    raise TypeError(f'SharedHashMap cannot store values of type {type(value).__name__}')
+
+
+def _decode_value(tag: int, data: memoryview) -> object:
+    """Return the value stored as the given tag and bytes."""
+    if tag == STR_VALUE:
+        return str(data, 'utf-8')
+    if tag == INT_VALUE:
+        return INT.unpack(data)[0]
+    if tag == FLOAT_VALUE:
+        return FLOAT.unpack(data)[0]
+    if tag == BYTES_VALUE:
+        return bytes(data)
+    if tag == BOOL_VALUE:
+        return data[0] == 1
+    return None
+
+
+def _next_prime(capacity: int) -> int:
+    """
+    Increment from given number to find the closest prime number
+    """
+    if capacity % 2 == 0:
+        capacity += 1
+
+    while not _is_prime(capacity):
+        capacity += 2
+
+    return capacity
+
+
+def _is_prime(capacity: int) -> bool:
+    """
+    Determine if given integer is a prime number and return boolean
+    """
+    if capacity == 2 or capacity == 3:
+        return True
+
+    if capacity == 1 or capacity % 2 == 0:
+        return False
+
+    factor = 3
+    while factor ** 2 <= capacity:
+        if capacity % factor == 0:
+            return False
+        factor += 2
+
+    return True
+
+
+class SharedHashMap:
+    """
+    Read-only HashMap in a shared memory segment
+    Supported methods are: build, attach, get, contains_key, get_size, get_capacity,
+    get_keys_and_values, close, unlink
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, function: callable) -> None:
+        """
+        Initialize a map over an existing segment. Use build() or attach() instead.
+        """
+        self._segment = segment
+        self._buffer = segment.buf
+        self._hash_function = function
+
+        magic, self._capacity, self._size = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"shared memory segment '{segment.name}' does not hold a SharedHashMap")
+
+    @classmethod
+    def build(cls, source, function: callable = hash_function_1, name: str = None) -> "SharedHashMap":
+        """
+        Creates a new shared memory segment holding every key/value pair of the source
+        map (any map with get_keys_and_values()) and returns the map over it. The builder
+        owns the segment and should unlink() it once no worker needs it.
+
+        :param source: The map whose key/value pairs are copied.
+        :param function: The hash function workers will use; it must be deterministic across processes.
+        :param name: The segment name, or None to have one generated.
+
+        :raises TypeError: If a value is not None, a bool, int, float, str or bytes.
+        :raises OverflowError: If an int value does not fit in a signed 64-bit integer.
+
+        :complexity: O(n)
+        """
+        pairs = source.get_keys_and_values()
+        count = pairs.length()
+        capacity = _next_prime(max(3, 2 * count + 1))
+
+        # encode every record first, so the segment can be created at its exact size
+        records = DynamicArray()
+        data_size = 0
+        for index in range(count):
+            key, value = pairs.get_unchecked(index)
+            encoded_key = key.encode('utf-8')
+            tag, encoded_value = _encode_value(value)
+            records.append((function(key) & HASH_MASK, encoded_key, tag, encoded_value))
+            data_size += RECORD.size + len(encoded_key) + len(encoded_value)
+
+        slots_start = HEADER.size
+        offset = slots_start + capacity * SLOT.size
+        segment = shared_memory.SharedMemory(name=name, create=True, size=offset + data_size)
+        buffer = segment.buf
+        buffer[:offset] = bytes(offset)
+        HEADER.pack_into(buffer, 0, MAGIC, capacity, count)
+
+        for index in range(count):
+            hash, encoded_key, tag, encoded_value = records.get_unchecked(index)
+
+            # linear probing for an empty slot; the keys are distinct
+            slot = hash % capacity
+            while SLOT.unpack_from(buffer, slots_start + slot * SLOT.size)[1] != 0:
+                slot += 1
+                if slot == capacity:
+                    slot = 0
+            SLOT.pack_into(buffer, slots_start + slot * SLOT.size, hash, offset)
+
+            RECORD.pack_into(buffer, offset, len(encoded_key), tag, len(encoded_value))
+            offset += RECORD.size
+            buffer[offset:offset + len(encoded_key)] = encoded_key
+            offset += len(encoded_key)
+            buffer[offset:offset + len(encoded_value)] = encoded_value
+            offset += len(encoded_value)
+
+        return cls(segment, function)
+
+    @classmethod
+    def attach(cls, name: str, function: callable = hash_function_1) -> "SharedHashMap":
+        """
+        Opens the map built under the given segment name, using the same hash function
+        as the builder. On Python versions before 3.13, attach from processes started
+        by the builder (such as forked or multiprocessing workers) so that they share
+        its resource tracker, which would otherwise remove the segment when they exit.
+
+        :complexity: O(1)
+        """
+        try:
+            segment = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            segment = shared_memory.SharedMemory(name=name)
+        return cls(segment, function)
+
+    @property
+    def name(self) -> str:
+        """The name workers pass to attach()."""
+        return self._segment.name
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _find_record(self, key: str) -> int:
+        """
+        Follows the linear probe sequence for the given key, comparing stored hashes
+        first and key bytes in place only when the hashes match.
+
+        :return: The offset of the key's record, or 0 if the key is not in the map.
+
+        :complexity: Average case - O(1)
+        """
+        buffer = self._buffer
+        capacity = self._capacity
+        hash = self._hash_function(key) & HASH_MASK
+        encoded_key = key.encode('utf-8')
+        slot = hash % capacity
+
+        for _ in range(capacity):
+            stored_hash, offset = SLOT.unpack_from(buffer, HEADER.size + slot * SLOT.size)
+            if offset == 0:
+                return 0
+            if stored_hash == hash:
+                key_length = RECORD.unpack_from(buffer, offset)[0]
+                start = offset + RECORD.size
+                if key_length == len(encoded_key) and buffer[start:start + key_length] == encoded_key:
+                    return offset
+            slot += 1
+            if slot == capacity:
+                slot = 0
+
+        return 0
+
+    def _value_at(self, offset: int) -> object:
+        """Decode the value of the record at the given offset."""
+        key_length, tag, value_length = RECORD.unpack_from(self._buffer, offset)
+        start = offset + RECORD.size + key_length
+        return _decode_value(tag, self._buffer[start:start + value_length])
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value associated with the given key, or None if the key is not in the map.
+
+        :complexity: Average case - O(1)
+        """
+        offset = self._find_record(key)
+        if offset == 0:
+            return None
+        return self._value_at(offset)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if the given key is in the map, otherwise it returns False.
+
+        :complexity: Average case - O(1)
+        """
+        return self._find_record(key) != 0
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a dynamic array where each index contains a tuple of a key/value pair
+        stored in the map. The order of the keys in the dynamic array does not matter.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        new_array = DynamicArray()
+        buffer = self._buffer
+        for slot in range(self._capacity):
+            offset = SLOT.unpack_from(buffer, HEADER.size + slot * SLOT.size)[1]
+            if offset != 0:
+                key_length = RECORD.unpack_from(buffer, offset)[0]
+                start = offset + RECORD.size
+                new_array.append((str(buffer[start:start + key_length], 'utf-8'), self._value_at(offset)))
+        return new_array
+
+    def close(self) -> None:
+        """
+        Detaches this process from the segment. The map cannot be used afterwards.
+        """
+        self._buffer.release()
+        self._buffer = None
+        self._segment.close()
+
+    def unlink(self) -> None:
+        """
+        Destroys the segment once every process has closed it. Called by the builder.
+        """
+        self._segment.unlink()
+
+
+def _worker_lookups(name: str, keys: list) -> list:
+    """Attach to a map by name in a worker process and look up the given keys."""
+    shared = SharedHashMap.attach(name, hash_function_2)
+    try:
+        return [shared.get(key) for key in keys]
+    finally:
+        shared.close()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    from multiprocessing import Pool
+
+    import hash_map_oa
+
+    print("\nbuild / get example")
+    print("-------------------")
+    m = hash_map_oa.HashMap(11, hash_function_2)
+    for i in range(1000):
+        m.put('key' + str(i), i * 10)
+    m.put('name', 'shared')
+    m.put('ratio', 0.25)
+    m.put('blob', b'\x00\x01')
+    m.put('flag', True)
+    m.put('nothing', None)
+
+    shared = SharedHashMap.build(m, hash_function_2)
+    print(shared.get_size(), shared.get_capacity() > 2 * shared.get_size())
+    print(shared.get('key42'), shared.get('name'), shared.get('ratio'), shared.get('blob'),
+          shared.get('flag'), shared.get('nothing'), shared.get('missing'))
+    print(shared.contains_key('key999'), shared.contains_key('key1000'), shared.contains_key('nothing'))
+    print(shared.get_keys_and_values().length())
+
+    print("\nworker processes example")
+    print("------------------------")
+    with Pool(2) as pool:
+        results = pool.starmap(_worker_lookups, [(shared.name, ['key1', 'key2', 'missing']),
+                                                 (shared.name, ['name', 'key999'])])
+    print(results)
+
+    shared.close()
+    shared.unlink()
@@ -0,0 +1,460 @@
+# Description: Implementation of an open addressing HashMap class in the style of a
+# "Swiss table". Alongside the dynamic arrays of keys and values, the table keeps one
+# control byte per bucket that records whether the bucket is empty, deleted, or full,
+# and for full buckets a 7-bit fingerprint of the key's hash. Buckets are probed in
+# groups of 16: the whole group's control bytes are matched against the fingerprint
+# at once (with NumPy when it is installed), and real keys are only compared for the
+# buckets whose fingerprint matches. This keeps key comparisons rare enough for the
+# table to run at a load factor of 7/8. The public interface matches the open
+# addressing HashMap in hash_map_oa.py.
+
+
+from DynamicArray_and_SinglyLinkedList import (DynamicArray, HashEntry,
+                        hash_function_1, hash_function_2)
+
+try:
+    import numpy as np
+except ImportError:     # NumPy is optional; fall back to scanning the control bytes
+    np = None
+
+
+# number of buckets whose control bytes are matched together
+GROUP_SIZE = 16
+
+# control byte values; a full bucket stores its 7-bit fingerprint (0 - 127) instead
+EMPTY = 0x80
+DELETED = 0xFE
+
+# the table is resized once this fraction of the buckets is full or deleted
+MAX_LOAD_FACTOR = 7 / 8
+
+
+if np is not None:
+    def _match_group(control: bytearray, fingerprint: int, start: int):
+        """Return the buckets in the group starting at start whose control byte equals fingerprint."""
+        group = np.frombuffer(control, dtype=np.uint8, count=GROUP_SIZE, offset=start)
+        return (np.flatnonzero(group == fingerprint) + start).tolist()
+
+    def _first_available(control: bytearray, start: int) -> int:
+        """Return the first empty or deleted bucket in the group starting at start, or -1."""
+        group = np.frombuffer(control, dtype=np.uint8, count=GROUP_SIZE, offset=start)
+        available = np.flatnonzero(group & 0x80)
+        return int(available[0]) + start if available.size else -1
+
+else:
+    def _match_group(control: bytearray, fingerprint: int, start: int):
+        """Return the buckets in the group starting at start whose control byte equals fingerprint."""
+        matches = []
+        end = start + GROUP_SIZE
+        index = control.find(fingerprint, start, end)
+        while index != -1:
+            matches.append(index)
+            index = control.find(fingerprint, index + 1, end)
+        return matches
+
+    def _first_available(control: bytearray, start: int) -> int:
+        """Return the first empty or deleted bucket in the group starting at start, or -1."""
+        end = start + GROUP_SIZE
+        empty = control.find(EMPTY, start, end)
+        deleted = control.find(DELETED, start, end)
+        if empty == -1 or (deleted != -1 and deleted < empty):
+            return deleted
+        return empty
+
+
+def _mix(hash: int) -> int:
+    """
+    Scramble a hash value so that its low 7 bits (the fingerprint) and its
+    remaining bits (the starting group) are both well distributed.
+    """
+    hash = (hash * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    return hash ^ (hash >> 29)
+
+
+class HashMap:
+    def __init__(self, capacity: int, function: callable = hash_function_1) -> None:
+        """
+        Initialize new HashMap that uses group probing
+        over control bytes for collision resolution
+        """
+        self._hash_function = function
+        self._allocate(capacity)
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._capacity):
+            if self._control[i] & 0x80:
+                out += str(i) + ': None\n'
+            else:
+                out += str(i) + ': ' + str(self._keys[i]) + ': ' + str(self._values[i]) + '\n'
+        return out
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replace the table with an empty one holding at least the given number of
+        buckets. The number of groups is a power of two so that triangular probing
+        over the groups visits every group.
+        """
+        groups = 1
+        while groups * GROUP_SIZE < capacity:
+            groups *= 2
+
+        self._group_mask = groups - 1
+        self._capacity = groups * GROUP_SIZE
+        self._control = bytearray([EMPTY]) * self._capacity
+        self._keys = DynamicArray.filled(self._capacity, None)
+        self._values = DynamicArray.filled(self._capacity, None)
+        self._size = 0
+        self._deleted = 0
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _find(self, key: str, hash: int) -> int:
+        """
+        Returns the bucket holding the given key, or -1 if the key is not in the table.
+
+        :param key: The key to look for.
+        :param hash: The mixed hash of the key.
+
+        :complexity: Average case - O(1)
+        """
+        control = self._control
+        keys = self._keys
+        fingerprint = hash & 0x7F
+        group = (hash >> 7) & self._group_mask
+
+        for step in range(1, self._group_mask + 2):
+            start = group * GROUP_SIZE
+            # only compare keys whose fingerprint matches
+            for index in _match_group(control, fingerprint, start):
+                if keys.get_unchecked(index) == key:
+                    return index
+
+            # a lookup never continues past a group with an empty bucket
+            if control.find(EMPTY, start, start + GROUP_SIZE) != -1:
+                return -1
+
+            group = (group + step) & self._group_mask
+
+        return -1
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates the key/value pair in the hash map. If the given key already exists in
+        the hash map, its associated value is replaced with the new value. If the given
+        key is not in the hash map, a new key/value pair is added.
+
+        When method is called, if the full and deleted buckets make up 7/8 or more of the
+        table, the table is rehashed: at the same capacity if deleted buckets can be
+        reclaimed, otherwise at double the capacity.
+
+        :param key: The key associated with the value to be inserted or updated in the hash map.
+        :param value: The value to be associated with the given key.
+
+        :post-conditions: The key/value pair is added to the hash map, or the existing key's
+            value is updated.
+
+        :complexity: Average case - O(1)
+        """
+        if self._size + self._deleted + 1 > self._capacity * MAX_LOAD_FACTOR:
+            if self._deleted > self._capacity // 4:
+                self.resize_table(self._capacity)
+            else:
+                self.resize_table(self._capacity * 2)
+
+        hash = _mix(self._hash_function(key))
+        control = self._control
+        fingerprint = hash & 0x7F
+        group = (hash >> 7) & self._group_mask
+        available = -1
+
+        for step in range(1, self._group_mask + 2):
+            start = group * GROUP_SIZE
+            for index in _match_group(control, fingerprint, start):
+                if self._keys.get_unchecked(index) == key:
+                    self._values.set_unchecked(index, value)
+                    return
+
+            # remember the first reusable bucket along the probe sequence
+            if available == -1:
+                available = _first_available(control, start)
+
+            if control.find(EMPTY, start, start + GROUP_SIZE) != -1:
+                break
+
+            group = (group + step) & self._group_mask
+
+        if control[available] == DELETED:
+            self._deleted -= 1
+        control[available] = fingerprint
+        self._keys.set_unchecked(available, key)
+        self._values.set_unchecked(available, value)
+        self._size += 1
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the underlying table. All key/value pairs are put into
+        the new table and deleted buckets are reclaimed. The capacity is rounded up to
+        a whole number of groups, with a power-of-two group count.
+
+        :validation: Checks that new_capacity is not less than the current number of elements
+                     in the hash map; if so, the method does nothing.
+
+        :param new_capacity: The new capacity for the hash table.
+
+        :post-condition: All existing key/value pairs are rehashed into the new table.
+
+        :complexity: O(n)
+        """
+        if new_capacity < 1 or new_capacity < self._size:
+            return
+
+        # keep the table below its maximum load once every entry is back in
+        while new_capacity * MAX_LOAD_FACTOR < self._size + 1:
+            new_capacity *= 2
+
+        old_capacity = self._capacity
+        old_control = self._control
+        old_keys = self._keys
+        old_values = self._values
+
+        self._allocate(new_capacity)
+        control = self._control
+
+        for index in range(old_capacity):
+            if old_control[index] & 0x80:
+                continue
+
+            # the keys are known to be distinct, so only a free bucket is needed
+            key = old_keys.get_unchecked(index)
+            hash = _mix(self._hash_function(key))
+            group = (hash >> 7) & self._group_mask
+            step = 1
+            slot = _first_available(control, group * GROUP_SIZE)
+            while slot == -1:
+                group = (group + step) & self._group_mask
+                step += 1
+                slot = _first_available(control, group * GROUP_SIZE)
+
+            control[slot] = hash & 0x7F
+            self._keys.set_unchecked(slot, key)
+            self._values.set_unchecked(slot, old_values.get_unchecked(index))
+            self._size += 1
+
+    def table_load(self) -> float:
+        """
+        Returns the current hash table load factor, which is the ratio
+        of the number of elements in the hash table to the current
+        capacity of the hash table.
+
+        :return: the load factor (float value) of the current hash table.
+
+        :complexity: O(1)
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets (including deleted buckets) in the hash table.
+
+        :return: The number of empty buckets (as an integer) in the hash table.
+
+        :complexity: O(1)
+        """
+        return self._capacity - self._size
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value associated with the given key. If the key is not in the hash
+        map, the method returns None.
+
+        :param key: The key whose associated value is to be returned.
+
+        :return: The value associated with the given key, or None if the
+        key is not in the hash map.
+
+        :complexity: Average case - O(1)
+        """
+        index = self._find(key, _mix(self._hash_function(key)))
+        if index == -1:
+            return None
+        return self._values.get_unchecked(index)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if the given key is in the hash map, otherwise it returns False.
+        An empty hash map does not contain any keys.
+
+        :param key: The key to check to see if it's in the hash map.
+
+        :return: True if the key is in the hash map, False otherwise.
+
+        :complexity: Average case - O(1)
+        """
+        return self._find(key, _mix(self._hash_function(key))) != -1
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the given key and its associated value from the hash map.
+        If the key is not in the hash map, the method does nothing.
+
+        If the key's group still has an empty bucket, no lookup can have probed
+        past the group, so the bucket is marked empty rather than deleted.
+
+        :param key: The key for the key/value pair to be removed from the hash map.
+
+        :post-conditions: The key, given it is actually in the hash map, and its associated
+        value are removed from the hash table. If key is not in hash table, there is no change.
+
+        :complexity: Average case - O(1)
+        """
+        index = self._find(key, _mix(self._hash_function(key)))
+        if index == -1:
+            return
+
+        start = index - index % GROUP_SIZE
+        if self._control.find(EMPTY, start, start + GROUP_SIZE) != -1:
+            self._control[index] = EMPTY
+        else:
+            self._control[index] = DELETED
+            self._deleted += 1
+
+        self._keys.set_unchecked(index, None)
+        self._values.set_unchecked(index, None)
+        self._size -= 1
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a dynamic array where each index contains a tuple of a key/value pair
+        stored in the hash map. The order of the keys in the dynamic array does not matter.
+
+        :return: A DynamicArray containing tuples of key/value pairs from the hash map.
+
+        :complexity: O(n), where n is the capacity of the hash table.
+        """
+        new_array = DynamicArray()
+        for index in range(self._capacity):
+            if not self._control[index] & 0x80:
+                new_array.append((self._keys.get_unchecked(index), self._values.get_unchecked(index)))
+        return new_array
+
+    def clear(self) -> None:
+        """
+        Clears the contents of the hash map.
+
+        :post-conditions: All key/value pairs are removed form the hash map.
+        The underlying hash table capacity remains unchanged.
+
+        :complexity: O(n)
+        """
+        self._allocate(self._capacity)
+
+    def __iter__(self):
+        """
+        This method enables the hash map to iterate across itself.
+
+        :return: The hash map itself as an iterator.
+
+        :complexity: O(1)
+        """
+        self._index = 0
+        return self
+
+    def __next__(self):
+        """
+        Returns the next key/value pair in the hash map during iteration, as a HashEntry.
+        If there are no more elements to iterate over, it raises StopIteration.
+
+        :return: A HashEntry holding the next key/value pair in the hash map.
+
+        :raises StopIteration: If there are no more elements to iterate over.
+        """
+        while self._index < self._capacity:
+            index = self._index
+            self._index += 1
+            if not self._control[index] & 0x80:
+                return HashEntry(self._keys.get_unchecked(index), self._values.get_unchecked(index))
+
+        raise StopIteration
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput example 1")
+    print("-------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nput example 2")
+    print("-------------")
+    m = HashMap(41, hash_function_2)
+    for i in range(50):
+        m.put('str' + str(i // 3), i * 100)
+        if i % 10 == 9:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nresize example")
+    print("--------------")
+    m = HashMap(75, hash_function_2)
+    keys = [i for i in range(25, 1000, 13)]
+    for key in keys:
+        m.put(str(key), key * 42)
+    print(m.get_size(), m.get_capacity())
+
+    for capacity in range(111, 1000, 117):
+        m.resize_table(capacity)
+
+        m.put('some key', 'some value')
+        result = m.contains_key('some key')
+        m.remove('some key')
+
+        for key in keys:
+            # all inserted keys must be present
+            result &= m.contains_key(str(key))
+            # NOT inserted keys must be absent
+            result &= not m.contains_key(str(key + 1))
+        print(capacity, result, m.get_size(), m.get_capacity(), round(m.table_load(), 2))
+
+    print("\nremove / reinsert example")
+    print("-------------------------")
+    m = HashMap(16, hash_function_2)
+    result = True
+    for round_number in range(5):
+        for i in range(2000):
+            m.put('key' + str(i), i + round_number)
+        for i in range(0, 2000, 3):
+            m.remove('key' + str(i))
+        for i in range(2000):
+            expected = None if i % 3 == 0 else i + round_number
+            result &= m.get('key' + str(i)) == expected
+    print(result, m.get_size(), m.get_capacity(), round(m.table_load(), 2))
+
+    print("\n__iter__(), __next__() example")
+    print("------------------------------")
+    m = HashMap(10, hash_function_2)
+    for i in range(5):
+        m.put(str(i), str(i * 24))
+    m.remove('0')
+    m.remove('4')
+    for item in m:
+        print('K:', item.key, 'V:', item.value)
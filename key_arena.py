@@ -0,0 +1,78 @@
+# Description: A growable byte arena for the packed-key HashMaps. Keys are encoded
+# as UTF-8 and appended to one bytearray; the maps keep only each key's offset and
+# length in typed arrays, so a key costs its encoded bytes instead of a separate str
+# object. Keys are compared in place through a memoryview of the arena, and decoded
+# back to str only when they are returned to the caller. The arena never moves or
+# reuses a key's bytes; the maps track how many bytes belong to removed keys and
+# rebuild the arena when that garbage grows large.
+
+
+# initial arena size in bytes
+INITIAL_SIZE = 1024
+
+
+class KeyArena:
+    """
+    Append-only storage for encoded keys
+    Supported methods are: store, equals, view, decode, discard, used, garbage
+    """
+
+    def __init__(self, size: int = INITIAL_SIZE) -> None:
+        """Initialize an empty arena with room for size bytes before it grows."""
+        self._data = bytearray(max(size, 16))
+        self._view = memoryview(self._data)
+        self._used = 0
+        self._garbage = 0
+
+    def store(self, encoded: bytes) -> int:
+        """
+        Copies an encoded key into the arena and returns its offset.
+
+        :complexity: Amortized O(length of the key)
+        """
+        offset = self._used
+        end = offset + len(encoded)
+        if end > len(self._data):
+            # the buffer cannot be resized while a view of it exists
+            self._view.release()
+            self._data.extend(bytes(max(len(self._data), end - len(self._data))))
+            self._view = memoryview(self._data)
+        self._view[offset:end] = encoded
+        self._used = end
+        return offset
+
+    def equals(self, offset: int, length: int, encoded: bytes) -> bool:
+        """
+        Returns True if the key stored at offset is the given encoded key, comparing
+        the arena bytes in place.
+
+        :complexity: O(length of the key)
+        """
+        return length == len(encoded) and self._view[offset:offset + length] == encoded
+
+    def view(self, offset: int, length: int) -> memoryview:
+        """
+        Returns a memoryview of the key stored at offset, without copying it.
+        The view must not be kept while keys are being stored.
+        """
+        return self._view[offset:offset + length]
+
+    def decode(self, offset: int, length: int) -> str:
+        """
+        Returns the key stored at offset as a str.
+
+        :complexity: O(length of the key)
+        """
+        return str(self._view[offset:offset + length], 'utf-8')
+
+    def discard(self, length: int) -> None:
+        """Records that length bytes belong to a key that was removed."""
+        self._garbage += length
+
+    def used(self) -> int:
+        """Return the number of bytes written to the arena, including garbage."""
+        return self._used
+
+    def garbage(self) -> int:
+        """Return the number of bytes belonging to removed keys."""
+        return self._garbage
@@ -0,0 +1,359 @@
+# Description: Asyncio TCP key-value server that serves one or more HashMap instances,
+# and a matching client with connection pooling. Requests and replies use a RESP-like
+# protocol: a request is an array of bulk strings
+#     *<count>\r\n$<length>\r\n<bytes>\r\n ...
+# and a reply is a simple string (+OK), an error (-ERR message), an integer (:n), a
+# bulk string ($<length> followed by the bytes, or $-1 for a missing value) or an
+# array of bulk strings. Clients may pipeline: the server parses every complete
+# request it has received, and writes all of their replies back in a single write.
+#
+# Commands (every key and value is a UTF-8 string):
+#     PING                                  +PONG
+#     GET  map key [key ...]                array of values, $-1 for missing keys
+#     PUT  map key value [key value ...]    :number of keys added
+#     DEL  map key [key ...]                :number of keys removed
+#     SIZE map                              :number of keys in the map
+# A multi-key PUT resizes the table once for the whole batch before inserting.
+#
+# Usage: python map_server.py [--host H] [--port P] [--map NAME[:sc|oa] ...]
+
+
+import argparse
+import asyncio
+
+from DynamicArray_and_SinglyLinkedList import hash_function_1
+import hash_map_oa
+import hash_map_sc
+
+
+MAX_READ = 65536
+
+
+class ProtocolError(Exception):
+    """A request or reply that does not follow the protocol."""
+    pass
+
+
+def encode_command(*args) -> bytes:
+    """Return the request bytes for a command and its arguments."""
+    parts = [b'*%d\r\n' % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode('utf-8')
+        parts.append(b'$%d\r\n%s\r\n' % (len(data), data))
+    return b''.join(parts)
+
+
+def parse_command(buffer: bytearray, position: int) -> tuple:
+    """
+    Parse one request from the buffer, starting at position.
+
+    :return: (list of argument strings, position after the request), or None if the
+             buffer does not yet hold the complete request.
+
+    :raises ProtocolError: If the request is malformed.
+    """
+    end = buffer.find(b'\r\n', position)
+    if end == -1:
+        return None
+    if buffer[position:position + 1] != b'*':
+        raise ProtocolError('expected an array of bulk strings')
+    count = int(buffer[position + 1:end])
+    position = end + 2
+
+    args = []
+    for _ in range(count):
+        end = buffer.find(b'\r\n', position)
+        if end == -1:
+            return None
+        if buffer[position:position + 1] != b'$':
+            raise ProtocolError('expected a bulk string')
+        length = int(buffer[position + 1:end])
+        start = end + 2
+        if len(buffer) < start + length + 2:
+            return None
+        args.append(buffer[start:start + length].decode('utf-8'))
+        position = start + length + 2
+
+    return args, position
+
+
+def _encode_bulk(value: object) -> bytes:
+    """Return the bulk string reply for a value (None is a missing value)."""
+    if value is None:
+        return b'$-1\r\n'
+    data = str(value).encode('utf-8')
+    return b'$%d\r\n%s\r\n' % (len(data), data)
+
+
+class MapServer:
+    """
+    Serves named HashMap instances over TCP
+    Supported methods are: start, execute
+    """
+
+    def __init__(self, maps: dict) -> None:
+        """
+        Initialize a server for the given dictionary of map name -> HashMap.
+        """
+        self._maps = maps
+
+    async def start(self, host: str = '127.0.0.1', port: int = 6380) -> asyncio.AbstractServer:
+        """Start listening and return the asyncio server (port 0 picks a free port)."""
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Read pipelined requests until the client disconnects, replying to each batch at once."""
+        buffer = bytearray()
+        try:
+            while True:
+                data = await reader.read(MAX_READ)
+                if not data:
+                    break
+                buffer += data
+
+                replies = []
+                position = 0
+                while True:
+                    try:
+                        parsed = parse_command(buffer, position)
+                    except (ProtocolError, ValueError) as error:
+                        # the rest of the stream cannot be framed, so give up on the connection
+                        writer.write(b'-ERR protocol error: %s\r\n' % str(error).encode('utf-8'))
+                        return
+                    if parsed is None:
+                        break
+                    args, position = parsed
+                    replies.append(self.execute(args))
+
+                del buffer[:position]
+                if replies:
+                    writer.write(b''.join(replies))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def execute(self, args: list) -> bytes:
+        """Run one command and return its encoded reply."""
+        if not args:
+            return b'-ERR empty command\r\n'
+        command = args[0].upper()
+        if command == 'PING':
+            return b'+PONG\r\n'
+        if command not in ('GET', 'PUT', 'DEL', 'SIZE'):
+            return b'-ERR unknown command %s\r\n' % args[0].encode('utf-8')
+        if len(args) < 2 or args[1] not in self._maps:
+            return b'-ERR unknown map\r\n'
+        hash_map = self._maps[args[1]]
+
+        if command == 'SIZE':
+            return b':%d\r\n' % hash_map.get_size()
+        if len(args) < 3:
+            return b'-ERR wrong number of arguments\r\n'
+
+        if command == 'GET':
+            keys = args[2:]
+            return b'*%d\r\n' % len(keys) + b''.join(_encode_bulk(hash_map.get(key)) for key in keys)
+
+        if command == 'DEL':
+            removed = 0
+            missing = object()
+            for key in args[2:]:
+                if hash_map.pop(key, missing) is not missing:
+                    removed += 1
+            return b':%d\r\n' % removed
+
+        # PUT
+        if len(args) % 2:
+            return b'-ERR PUT needs key/value pairs\r\n'
+        return b':%d\r\n' % self._put_batch(hash_map, args)
+
+    @staticmethod
+    def _put_batch(hash_map, args: list) -> int:
+        """
+        Insert the key/value pairs of a PUT command and return the number of keys added.
+        The table is resized once for the whole batch, so that no insert in the batch
+        triggers a resize.
+        """
+        pairs = (len(args) - 2) // 2
+        if pairs > 1 and hasattr(hash_map, 'load_factor_settings'):
+            max_load_factor = hash_map.load_factor_settings()['max_load_factor']
+            needed = hash_map.get_size() + pairs
+            if needed >= hash_map.get_capacity() * max_load_factor:
+                hash_map.resize_table(int(needed / max_load_factor) + 1)
+
+        before = hash_map.get_size()
+        for index in range(2, len(args), 2):
+            hash_map.put(args[index], args[index + 1])
+        return hash_map.get_size() - before
+
+
+# ------------------------------------------------------------------ #
+
+class _Connection:
+    """One client connection, reading RESP-like replies from the server."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    async def read_reply(self) -> object:
+        """Read and return one reply; errors are raised as ProtocolError."""
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError('server closed the connection')
+        kind, body = line[:1], line[1:-2]
+        if kind == b'+':
+            return body.decode('utf-8')
+        if kind == b'-':
+            raise ProtocolError(body.decode('utf-8'))
+        if kind == b':':
+            return int(body)
+        if kind == b'$':
+            length = int(body)
+            if length == -1:
+                return None
+            data = await self.reader.readexactly(length + 2)
+            return data[:-2].decode('utf-8')
+        if kind == b'*':
+            return [await self.read_reply() for _ in range(int(body))]
+        raise ProtocolError(f'unexpected reply {line!r}')
+
+
+class MapClient:
+    """
+    Asyncio client for MapServer with a pool of connections
+    Supported methods are: connect, close, ping, get, put, delete, size, pipeline
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 6380, pool_size: int = 4) -> None:
+        """Initialize a client; connections are opened by connect()."""
+        self._host = host
+        self._port = port
+        self._pool_size = pool_size
+        self._pool = None
+        self._connections = []
+
+    async def connect(self) -> None:
+        """Open the pool of connections."""
+        self._pool = asyncio.Queue()
+        for _ in range(self._pool_size):
+            self._pool.put_nowait(await self._open_connection())
+
+    async def _open_connection(self) -> _Connection:
+        """Open a new connection to the server."""
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+        connection = _Connection(reader, writer)
+        self._connections.append(connection)
+        return connection
+
+    def _discard(self, connection: _Connection) -> None:
+        """Close a connection that may still have unread replies."""
+        connection.writer.close()
+        self._connections.remove(connection)
+
+    async def close(self) -> None:
+        """Close every connection in the pool."""
+        for connection in self._connections:
+            connection.writer.close()
+            await connection.writer.wait_closed()
+        self._connections = []
+
+    async def pipeline(self, commands: list) -> list:
+        """
+        Send several commands, each a tuple of arguments, in one write on one pooled
+        connection and return their replies in order. Error replies are returned as
+        ProtocolError instances rather than raised.
+
+        A connection is returned to the pool only once every reply has been read. If
+        sending or reading fails or the task is cancelled, the connection is closed and
+        a new one is opened in its place by the next caller.
+        """
+        connection = await self._pool.get()
+        try:
+            if connection is None:
+                connection = await self._open_connection()
+            connection.writer.write(b''.join(encode_command(*command) for command in commands))
+            await connection.writer.drain()
+            replies = []
+            for _ in commands:
+                try:
+                    replies.append(await connection.read_reply())
+                except ProtocolError as error:
+                    replies.append(error)
+        except BaseException:
+            if connection is not None:
+                self._discard(connection)
+            self._pool.put_nowait(None)
+            raise
+
+        self._pool.put_nowait(connection)
+        return replies
+
+    async def _call(self, *args) -> object:
+        """Send one command and return its reply, raising ProtocolError on an error reply."""
+        reply = (await self.pipeline([args]))[0]
+        if isinstance(reply, ProtocolError):
+            raise reply
+        return reply
+
+    async def ping(self) -> str:
+        return await self._call('PING')
+
+    async def get(self, map_name: str, *keys: str) -> list:
+        """Return the values of the keys, with None for missing keys."""
+        return await self._call('GET', map_name, *keys)
+
+    async def put(self, map_name: str, pairs) -> int:
+        """Store the (key, value) pairs (or a dict) and return the number of keys added."""
+        if isinstance(pairs, dict):
+            pairs = pairs.items()
+        args = []
+        for key, value in pairs:
+            args.append(key)
+            args.append(value)
+        return await self._call('PUT', map_name, *args)
+
+    async def delete(self, map_name: str, *keys: str) -> int:
+        """Remove the keys and return the number that were present."""
+        return await self._call('DEL', map_name, *keys)
+
+    async def size(self, map_name: str) -> int:
+        return await self._call('SIZE', map_name)
+
+
+def make_map(spec: str) -> tuple:
+    """Return (name, new HashMap) for a 'NAME[:sc|oa]' specification."""
+    name, _, kind = spec.partition(':')
+    if kind in ('', 'sc'):
+        return name, hash_map_sc.HashMap(11, hash_function_1)
+    if kind == 'oa':
+        return name, hash_map_oa.HashMap(11, hash_function_1)
+    raise argparse.ArgumentTypeError(f"map type must be sc or oa, got '{kind}'")
+
+
+async def _serve(host: str, port: int, maps: dict) -> None:
+    server = await MapServer(maps).start(host, port)
+    print(f"serving {', '.join(maps)} on {host}:{server.sockets[0].getsockname()[1]}")
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Serve HashMaps over TCP.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=6380)
+    parser.add_argument('--map', type=make_map, action='append',
+                        help="map to serve, as NAME or NAME:sc or NAME:oa (repeatable; default: 'default')")
+    args = parser.parse_args()
+
+    maps = dict(args.map or [make_map('default')])
+    try:
+        asyncio.run(_serve(args.host, args.port, maps))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
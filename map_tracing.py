@@ -0,0 +1,237 @@
+# Description: Opt-in operation tracing and latency profiling for the HashMap classes.
+# An OperationTracer attached to a map replaces the map's public operations, its
+# resize_table() method and its hash function with instrumented wrappers stored as
+# instance attributes. Detaching deletes those attributes, so the class methods are
+# used again and a map that is not being traced pays no overhead at all. While
+# attached, the tracer counts and times every put/get/contains_key/remove (and the
+# single-probe update methods), times each resize and each hash computation, can
+# call a user callback after every operation, and in sampling mode records the
+# probe count (or chain length) seen by a fraction of the operations.
+
+
+import random
+import time
+
+from DynamicArray_and_SinglyLinkedList import DynamicArray
+
+
+# map methods that are counted and timed when present on the traced map
+TRACED_OPERATIONS = ('put', 'get', 'contains_key', 'remove',
+                     'increment', 'setdefault', 'update', 'pop')
+
+# operations whose probe count is sampled after they run, once the key is in the map
+SAMPLED_AFTER = ('put', 'increment', 'setdefault', 'update')
+
+
+class _Timing:
+    """Count, total and maximum duration of one kind of event."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+    def as_dict(self) -> dict:
+        average = self.total_seconds / self.count if self.count else 0.0
+        return {'count': self.count, 'total_seconds': self.total_seconds,
+                'average_seconds': average, 'max_seconds': self.max_seconds}
+
+
+class OperationTracer:
+    """
+    Collects per-operation counters and timings from the maps it is attached to
+    Supported methods are: attach, detach, stats, probe_samples, reset
+    """
+
+    def __init__(self,
+                 callback: callable = None,
+                 sample_rate: float = 0.0,
+                 time_hashing: bool = True,
+                 seed: int = None) -> None:
+        """
+        Initialize a tracer.
+
+        :param callback: Called as callback(operation, key, seconds) after every traced operation.
+        :param sample_rate: Fraction (0.0 - 1.0) of operations whose probe count is recorded.
+        :param time_hashing: If True, every call to the map's hash function is timed.
+        :param seed: Seed for choosing which operations are sampled.
+        """
+        self._callback = callback
+        self._sample_rate = sample_rate
+        self._time_hashing = time_hashing
+        self._random = random.Random(seed)
+        self._depth = 0     # > 0 while a traced operation is running
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        self._operations = {}
+        self._resizes = _Timing()
+        self._hashing = _Timing()
+        self._probe_samples = DynamicArray()
+
+    # ------------------------------------------------------------------ #
+
+    def attach(self, hash_map) -> None:
+        """
+        Start tracing the given map by installing instrumented methods on the instance.
+
+        :complexity: O(1)
+        """
+        for name in TRACED_OPERATIONS:
+            if hasattr(hash_map, name):
+                setattr(hash_map, name, self._wrap_operation(hash_map, name, getattr(hash_map, name)))
+
+        hash_map.resize_table = self._wrap_resize(hash_map.resize_table)
+
+        if self._time_hashing:
+            hash_map._untraced_hash_function = hash_map._hash_function
+            hash_map._hash_function = self._wrap_hash(hash_map._hash_function)
+
+    def detach(self, hash_map) -> None:
+        """
+        Stop tracing the given map, restoring its original methods and hash function.
+
+        :complexity: O(1)
+        """
+        for name in TRACED_OPERATIONS + ('resize_table',):
+            if name in vars(hash_map):
+                delattr(hash_map, name)
+
+        if '_untraced_hash_function' in vars(hash_map):
+            hash_map._hash_function = hash_map._untraced_hash_function
+            del hash_map._untraced_hash_function
+
+    def _wrap_operation(self, hash_map, name: str, method: callable) -> callable:
+        """Return a wrapper that times the operation and samples its probe count."""
+        def traced(key, *args, **kwargs):
+            # operations called from inside another traced operation (such as
+            # remove() calling pop()) are only counted once
+            if self._depth:
+                return method(key, *args, **kwargs)
+
+            sampled = (self._sample_rate and self._random.random() < self._sample_rate
+                       and hasattr(hash_map, 'probe_length'))
+            if sampled and name not in SAMPLED_AFTER:
+                self._probe_samples.append((name, self._probe_length(hash_map, key)))
+
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                result = method(key, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._depth -= 1
+                if name not in self._operations:
+                    self._operations[name] = _Timing()
+                self._operations[name].record(elapsed)
+                if self._callback is not None:
+                    self._callback(name, key, elapsed)
+
+            if sampled and name in SAMPLED_AFTER:
+                self._probe_samples.append((name, self._probe_length(hash_map, key)))
+            return result
+
+        return traced
+
+    @staticmethod
+    def _probe_length(hash_map, key) -> int:
+        """
+        Return hash_map.probe_length(key), computing the key's hash with the untraced
+        hash function so that samples are not counted as hash computations.
+        """
+        if '_untraced_hash_function' not in vars(hash_map):
+            return hash_map.probe_length(key)
+
+        traced_hash_function = hash_map._hash_function
+        hash_map._hash_function = hash_map._untraced_hash_function
+        try:
+            return hash_map.probe_length(key)
+        finally:
+            hash_map._hash_function = traced_hash_function
+
+    def _wrap_resize(self, method: callable) -> callable:
+        """Return a wrapper that times resize_table()."""
+        def traced(new_capacity):
+            start = time.perf_counter()
+            try:
+                return method(new_capacity)
+            finally:
+                self._resizes.record(time.perf_counter() - start)
+
+        return traced
+
+    def _wrap_hash(self, function: callable) -> callable:
+        """Return a wrapper that times the hash function."""
+        def traced(key):
+            start = time.perf_counter()
+            hash = function(key)
+            self._hashing.record(time.perf_counter() - start)
+            return hash
+
+        return traced
+
+    # ------------------------------------------------------------------ #
+
+    def probe_samples(self) -> DynamicArray:
+        """Return a dynamic array of the sampled (operation, probe count) pairs."""
+        return self._probe_samples
+
+    def stats(self) -> dict:
+        """
+        Return a dictionary with the timings of each operation, of resizes and of hash
+        computations, and a summary of the sampled probe counts.
+        """
+        samples = self._probe_samples.length()
+        total = 0
+        longest = 0
+        for index in range(samples):
+            probes = self._probe_samples.get_unchecked(index)[1]
+            total += probes
+            if probes > longest:
+                longest = probes
+
+        return {
+            'operations': {name: timing.as_dict() for name, timing in self._operations.items()},
+            'resize': self._resizes.as_dict(),
+            'hashing': self._hashing.as_dict(),
+            'probes': {'samples': samples,
+                       'average': total / samples if samples else 0.0,
+                       'max': longest},
+        }
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    import hash_map_oa
+    import hash_map_sc
+
+    for module in (hash_map_sc, hash_map_oa):
+        print("\n" + module.__name__ + " tracing example")
+        print("-" * (len(module.__name__) + 16))
+        m = module.HashMap(11, module.hash_function_2)
+        slow = DynamicArray()
+        tracer = OperationTracer(
+            callback=lambda name, key, seconds: slow.append((name, key)) if seconds > 0.001 else None,
+            sample_rate=0.1, seed=1)
+        tracer.attach(m)
+        for i in range(2000):
+            m.put('key' + str(i), i)
+        for i in range(0, 4000, 3):
+            m.get('key' + str(i))
+        for i in range(0, 2000, 5):
+            m.remove('key' + str(i))
+        stats = tracer.stats()
+        print({name: timing['count'] for name, timing in stats['operations'].items()})
+        print(stats['resize']['count'], stats['hashing']['count'] > 0, stats['probes']['samples'] > 0)
+
+        tracer.detach(m)
+        print('put' in vars(m), m.get('key1'), m.get_size())
@@ -0,0 +1,397 @@
+# Description: Optional durability layer for the HashMap classes. A DurableMap wraps
+# a separate chaining or open addressing HashMap, applies every write to it and appends
+# the write to a write-ahead log in a directory, so the map can be rebuilt after a
+# crash by replaying the log. Writes are made durable according to a sync policy:
+#     'always'  fsync after every write (slowest, nothing acknowledged is ever lost)
+#     'batch'   group commit: fsync once per group_size writes, and a background
+#               thread fsyncs any pending writes every group_interval seconds
+#     'none'    hand writes to the operating system but never fsync them
+# Once the log holds compact_after records, it is compacted: the current key/value
+# pairs are copied (as get_keys_and_values() does), new writes move to a fresh log
+# file, and a background thread writes the copy out as a snapshot, after which the
+# older log and snapshot are deleted.
+#
+# Files in the directory, where G is a generation number:
+#     snapshot.G   every key/value pair at the start of wal.G
+#     wal.G        the writes made after snapshot.G (or after wal.G-1)
+# Both start with a magic header and hold records of: CRC-32 of the rest of the record
+# (4 bytes), operation (1 byte), key length (4 bytes), value length (4 bytes), UTF-8
+# key bytes and pickled value bytes. Replay stops at the first incomplete or corrupt
+# record, which can only be the tail of the last log after a crash.
+
+
+import os
+import pickle
+import struct
+import threading
+import zlib
+
+from DynamicArray_and_SinglyLinkedList import DynamicArray
+
+
+MAGIC = b'HMWAL001'
+RECORD = struct.Struct('<IBII')
+
+PUT = 1
+REMOVE = 2
+CLEAR = 3
+
+SYNC_POLICIES = ('always', 'batch', 'none')
+
+
+def _encode_record(operation: int, key: str = '', value: object = None) -> bytes:
+    """Return the bytes of one log record."""
+    encoded_key = key.encode('utf-8')
+    encoded_value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL) if operation == PUT else b''
+    body = struct.pack('<BII', operation, len(encoded_key), len(encoded_value)) + encoded_key + encoded_value
+    return struct.pack('<I', zlib.crc32(body)) + body
+
+
+def read_records(path: str) -> tuple:
+    """
+    Return (dynamic array of (operation, key, value) records, offset after the last
+    valid record) for a log or snapshot file. Reading stops at the first incomplete or
+    corrupt record.
+    """
+    records = DynamicArray()
+    with open(path, 'rb') as file:
+        data = file.read()
+    if data[:len(MAGIC)] != MAGIC:
+        return records, 0
+
+    position = len(MAGIC)
+    while position + RECORD.size <= len(data):
+        crc, operation, key_length, value_length = RECORD.unpack_from(data, position)
+        end = position + RECORD.size + key_length + value_length
+        if end > len(data) or zlib.crc32(data[position + 4:end]) != crc:
+            break
+        key_start = position + RECORD.size
+        key = data[key_start:key_start + key_length].decode('utf-8')
+        value = pickle.loads(data[key_start + key_length:end]) if operation == PUT else None
+        records.append((operation, key, value))
+        position = end
+
+    return records, position
+
+
+class DurableMap:
+    """
+    Write-ahead logged wrapper around a HashMap
+    Supported methods are: put, remove, pop, increment, setdefault, update, clear,
+    sync, compact, close; every other attribute is read from the wrapped map
+    """
+
+    def __init__(self,
+                 hash_map,
+                 directory: str,
+                 sync: str = 'batch',
+                 group_size: int = 64,
+                 group_interval: float = 0.01,
+                 compact_after: int = 100000) -> None:
+        """
+        Initialize a durable map over an empty HashMap, first restoring the contents
+        saved in directory (which is created if needed).
+
+        :param hash_map: The map to make durable; it must be empty.
+        :param directory: The directory holding the snapshot and log files.
+        :param sync: The sync policy: 'always', 'batch' or 'none'.
+        :param group_size: With 'batch', the number of writes that share one fsync.
+        :param group_interval: With 'batch', the longest time in seconds a write waits for its fsync.
+        :param compact_after: The number of log records that triggers a compaction.
+        """
+        if sync not in SYNC_POLICIES:
+            raise ValueError(f"sync must be one of {', '.join(SYNC_POLICIES)}")
+
+        self._map = hash_map
+        self._directory = directory
+        self._sync = sync
+        self._group_size = group_size
+        self._group_interval = group_interval
+        self._compact_after = compact_after
+
+        self._lock = threading.Condition()
+        self._pending = 0           # records written but not yet fsynced
+        self._closed = False
+        self._compactor = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+
+        self._flusher = None
+        if sync == 'batch':
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+
+    def __getattr__(self, name: str):
+        """Forward every attribute that is not a logged write to the wrapped map."""
+        return getattr(self._map, name)
+
+    # ------------------------------------------------------------------ #
+
+    def _path(self, kind: str, generation: int) -> str:
+        return os.path.join(self._directory, f'{kind}.{generation}')
+
+    def _generations(self, kind: str) -> list:
+        """Return the sorted generation numbers of the files of the given kind."""
+        generations = []
+        for name in os.listdir(self._directory):
+            prefix, _, suffix = name.partition('.')
+            if prefix == kind and suffix.isdigit():
+                generations.append(int(suffix))
+        return sorted(generations)
+
+    def _recover(self) -> None:
+        """
+        Load the newest snapshot, replay the logs written after it, delete the files it
+        supersedes, and open the newest log for appending (cutting off a torn tail).
+        """
+        snapshots = self._generations('snapshot')
+        base = snapshots[-1] if snapshots else 0
+        if snapshots:
+            self._apply(read_records(self._path('snapshot', base))[0])
+
+        logs = [generation for generation in self._generations('wal') if generation >= base]
+        valid_end = 0
+        self._records = 0           # records in the logs since the last snapshot
+        for generation in logs:
+            records, valid_end = read_records(self._path('wal', generation))
+            self._apply(records)
+            self._records += records.length()
+
+        for generation in snapshots[:-1]:
+            os.remove(self._path('snapshot', generation))
+        for name in os.listdir(self._directory):
+            # a snapshot that was still being written when the process stopped
+            if name.startswith('snapshot.') and name.endswith('.tmp'):
+                os.remove(os.path.join(self._directory, name))
+        for generation in self._generations('wal'):
+            if generation < base:
+                os.remove(self._path('wal', generation))
+
+        self._generation = logs[-1] if logs else base
+        self._open_log(truncate_at=valid_end if logs else None)
+
+    def _apply(self, records: DynamicArray) -> None:
+        """Apply replayed records to the wrapped map."""
+        hash_map = self._map
+        for index in range(records.length()):
+            operation, key, value = records.get_unchecked(index)
+            if operation == PUT:
+                hash_map.put(key, value)
+            elif operation == REMOVE:
+                hash_map.remove(key)
+            else:
+                hash_map.clear()
+
+    def _open_log(self, truncate_at: int = None) -> None:
+        """Open the current generation's log for appending, creating it if needed."""
+        path = self._path('wal', self._generation)
+        if truncate_at is None or truncate_at < len(MAGIC):
+            with open(path, 'wb') as file:
+                file.write(MAGIC)
+                file.flush()
+                os.fsync(file.fileno())
+        else:
+            os.truncate(path, truncate_at)
+        self._log = open(path, 'ab')
+
+    def _append(self, record: bytes) -> None:
+        """Append a record to the log and make it durable according to the sync policy."""
+        with self._lock:
+            self._log.write(record)
+            self._pending += 1
+            self._records += 1
+            if self._sync == 'always':
+                self._sync_log()
+            elif self._pending >= self._group_size:
+                if self._sync == 'batch':
+                    self._sync_log()
+                else:
+                    self._log.flush()
+                    self._pending = 0
+
+        if self._records >= self._compact_after:
+            self.compact()
+
+    def _sync_log(self) -> None:
+        """Flush and fsync the log. The lock must be held."""
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._pending = 0
+
+    def _flush_periodically(self) -> None:
+        """Group commit thread: fsync pending writes every group_interval seconds."""
+        with self._lock:
+            while not self._closed:
+                self._lock.wait(self._group_interval)
+                if self._pending and not self._closed:
+                    self._sync_log()
+
+    # ------------------------------------------------------------------ #
+
+    # Each write encodes its log record before changing the map, so a value that cannot
+    # be pickled raises without leaving a write in the map that is missing from the log.
+
+    def _current(self, key: str, default: object) -> object:
+        """Return the value associated with key, or default if the key is not in the map."""
+        return self._map.get(key) if self._map.contains_key(key) else default
+
+    def put(self, key: str, value: object) -> None:
+        record = _encode_record(PUT, key, value)
+        self._map.put(key, value)
+        self._append(record)
+
+    def remove(self, key: str) -> None:
+        self.pop(key)
+
+    def pop(self, key: str, default: object = None) -> object:
+        record = _encode_record(REMOVE, key)
+        size = self._map.get_size()
+        value = self._map.pop(key, default)
+        if self._map.get_size() != size:
+            self._append(record)
+        return value
+
+    def increment(self, key: str, delta: object = 1) -> object:
+        missing = object()
+        current = self._current(key, missing)
+        value = delta if current is missing else current + delta
+        self.put(key, value)
+        return value
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        missing = object()
+        current = self._current(key, missing)
+        if current is not missing:
+            return current
+        self.put(key, default)
+        return default
+
+    def update(self, key: str, function: callable, default: object = None) -> object:
+        value = function(self._current(key, default))
+        self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        record = _encode_record(CLEAR)
+        self._map.clear()
+        self._append(record)
+
+    # ------------------------------------------------------------------ #
+
+    def sync(self) -> None:
+        """Make every write so far durable, whatever the sync policy."""
+        with self._lock:
+            self._sync_log()
+
+    def compact(self, wait: bool = False) -> None:
+        """
+        Starts a new log and writes the current contents of the map as a snapshot in a
+        background thread; once the snapshot is durable, the older files are deleted.
+        Values are written as they are when the snapshot thread pickles them, so values
+        should not be mutated in place while a compaction runs.
+
+        :param wait: If True, return only once the snapshot has been written.
+        """
+        if self._compactor is not None:
+            self._compactor.join()
+
+        with self._lock:
+            pairs = self._map.get_keys_and_values()
+            self._sync_log()
+            self._log.close()
+            previous = self._generation
+            self._generation += 1
+            self._records = 0
+            self._open_log()
+
+        self._compactor = threading.Thread(target=self._write_snapshot, args=(pairs, previous), daemon=True)
+        self._compactor.start()
+        if wait:
+            self._compactor.join()
+
+    def _write_snapshot(self, pairs: DynamicArray, previous: int) -> None:
+        """Write the snapshot for the current generation, then delete the superseded files."""
+        path = self._path('snapshot', previous + 1)
+        with open(path + '.tmp', 'wb') as file:
+            file.write(MAGIC)
+            for index in range(pairs.length()):
+                key, value = pairs.get_unchecked(index)
+                file.write(_encode_record(PUT, key, value))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(path + '.tmp', path)
+        self._sync_directory()
+
+        for generation in self._generations('snapshot'):
+            if generation <= previous:
+                os.remove(self._path('snapshot', generation))
+        for generation in self._generations('wal'):
+            if generation <= previous:
+                os.remove(self._path('wal', generation))
+
+    def _sync_directory(self) -> None:
+        """fsync the directory so that a renamed file survives a crash (where supported)."""
+        try:
+            descriptor = os.open(self._directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(descriptor)
+
+    def close(self) -> None:
+        """Make every write durable, finish any compaction and close the log."""
+        if self._compactor is not None:
+            self._compactor.join()
+        with self._lock:
+            self._closed = True
+            self._sync_log()
+            self._log.close()
+            self._lock.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    import tempfile
+
+    import hash_map_oa
+    import hash_map_sc
+
+    for module in (hash_map_sc, hash_map_oa):
+        print("\n" + module.__name__ + " durability example")
+        print("-" * (len(module.__name__) + 19))
+        with tempfile.TemporaryDirectory() as directory:
+            m = DurableMap(module.HashMap(11, module.hash_function_1), directory,
+                           sync='batch', compact_after=500)
+            for i in range(1200):
+                m.put('key' + str(i), i)
+            for i in range(0, 1200, 3):
+                m.remove('key' + str(i))
+            m.increment('counter', 5)
+            m.increment('counter', 2)
+            m.close()
+
+            # rebuild from the snapshot and log, as after a restart
+            restored = DurableMap(module.HashMap(11, module.hash_function_1), directory, sync='always')
+            result = restored.get_size() == 801 and restored.get('counter') == 7
+            for i in range(1200):
+                result &= restored.get('key' + str(i)) == (None if i % 3 == 0 else i)
+            print(result, restored.get_size(), sorted(os.listdir(directory)))
+
+            # a torn record at the end of the log is discarded
+            restored.put('last', 'value')
+            restored.close()
+            log = os.path.join(directory, max(name for name in os.listdir(directory) if name.startswith('wal.')))
+            with open(log, 'ab') as file:
+                file.write(b'\x00\x01\x02')
+            restored = DurableMap(module.HashMap(11, module.hash_function_1), directory, sync='none')
+            print(restored.get('last'), restored.get_size())
+            restored.close()
@@ -0,0 +1,124 @@
+# Description: Vectorized rehashing for the open addressing HashMaps. When a table is
+# resized, the hash values cached in its entries are gathered into one NumPy array, and
+# every entry's new bucket is computed in a single operation instead of one at a time
+# in a Python loop. The probe sequences of all entries are advanced together in rounds
+# until each has claimed a bucket of the new table, which is then filled in one step.
+# Reducing the hash values can be split across a thread pool for huge tables, since
+# NumPy releases the GIL. NumPy is optional: without it, enabled() is False and the
+# object-based map keeps its per-entry loop. The NumPy-backed map in hash_map_numpy.py
+# also places batches of new keys with place_open_addressing().
+
+
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:     # NumPy is optional; the map falls back to rehashing entry by entry
+    np = None
+
+
+# tables with fewer entries than this are rehashed by the map's per-entry loop
+VECTORIZE_MIN_ENTRIES = 2048
+
+# arrays with fewer entries than this are reduced on one thread
+PARALLEL_MIN_ENTRIES = 1 << 18
+
+
+def enabled(count: int) -> bool:
+    """Return True if NumPy is installed and count entries are worth rehashing in bulk."""
+    return np is not None and count >= VECTORIZE_MIN_ENTRIES
+
+
+def hash_array(hashes: list):
+    """
+    Return the cached hash values as a 64-bit integer array, or None if a value does
+    not fit in 64 bits (the map must then rehash entry by entry).
+    """
+    try:
+        return np.array(hashes, dtype=np.int64)
+    except OverflowError:
+        return None
+
+
+def bucket_indices(hashes, capacity: int, threads: int = 1):
+    """
+    Return every hash value reduced modulo capacity. With more than one thread, a
+    large array is split into chunks that are reduced concurrently.
+
+    :complexity: O(n)
+    """
+    if threads <= 1 or hashes.size < PARALLEL_MIN_ENTRIES:
+        return hashes % capacity
+
+    indices = np.empty_like(hashes)
+    bounds = np.linspace(0, hashes.size, threads + 1, dtype=np.int64)
+
+    def reduce(chunk: int) -> None:
+        start, end = bounds[chunk], bounds[chunk + 1]
+        np.remainder(hashes[start:end], capacity, out=indices[start:end])
+
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(reduce, range(threads)))
+    return indices
+
+
+def place_open_addressing(indices, step, increment, capacity: int, occupied=None):
+    """
+    Return the bucket of an open addressing table that each entry would be inserted
+    into, given each entry's initial index and its probe sequence: every probe moves
+    index = (index + step) % capacity and then step += increment. step and increment
+    are either ints shared by all entries or arrays with one per entry. occupied is a
+    boolean array marking the buckets already taken, which is updated in place; if it
+    is None, the table is empty. The entries' keys must not already be in the table.
+
+    In each round, every entry still without a bucket probes its current index; the
+    first of them to reach a free bucket claims it, and the rest move one probe along.
+    An entry only ever moves past occupied buckets, so each key is found by a lookup
+    along its probe sequence exactly as if the entries had been inserted one by one.
+    Returns None if some probe sequence finds no free bucket within capacity probes.
+
+    :complexity: O(n log n) per round; nearly every entry is placed within a few rounds
+    """
+    count = indices.size
+    slots = indices.copy()
+    steps = np.broadcast_to(np.asarray(step, dtype=np.int64), (count,)).copy()
+    increments = np.broadcast_to(np.asarray(increment, dtype=np.int64), (count,))
+    placed = np.empty(count, dtype=np.int64)
+    if occupied is None:
+        occupied = np.zeros(capacity, dtype=bool)
+    pending = np.arange(count)
+
+    for _ in range(capacity):
+        if pending.size == 0:
+            return placed
+
+        # the first pending entry aimed at each free bucket claims it
+        targets = slots[pending]
+        free = np.flatnonzero(~occupied[targets])
+        claimed, first = np.unique(targets[free], return_index=True)
+        winners = free[first]
+        placed[pending[winners]] = claimed
+        occupied[claimed] = True
+
+        waiting = np.ones(pending.size, dtype=bool)
+        waiting[winners] = False
+        pending = pending[waiting]
+        slots[pending] = (slots[pending] + steps[pending]) % capacity
+        steps[pending] += increments[pending]
+
+    return placed if pending.size == 0 else None
+
+
+def scatter(items: list, slots, capacity: int) -> list:
+    """
+    Return a list of the given length holding each item at its slot, and None in
+    every other position.
+
+    :complexity: O(capacity)
+    """
+    values = np.empty(len(items), dtype=object)
+    values[:] = items
+    table = np.empty(capacity, dtype=object)
+    table[slots] = values
+    return table.tolist()
+
@@ -0,0 +1,156 @@
+# Description: Implementation of a skip list holding a sorted set of keys, used as
+# the optional ordered index of the HashMap classes. Each key is stored in a node with
+# a random number of forward links (each extra level kept with probability 1/4), so
+# searches, inserts and removals skip over most of the list and take O(log n) expected
+# time, and the keys can be walked in sorted order from any starting key.
+
+
+import random
+
+
+# enough levels for far more keys than a HashMap holds
+MAX_LEVEL = 24
+LEVEL_PROBABILITY = 0.25
+
+
+class _Node:
+    """A key and its forward links, one per level the node belongs to."""
+    __slots__ = ('key', 'forward')
+
+    def __init__(self, key: object, level: int) -> None:
+        self.key = key
+        self.forward = [None] * level
+
+
+class SkipList:
+    """
+    Sorted set of keys
+    Supported methods are:
+    add, remove, contains, length, first, last, keys_from, clear
+    """
+
+    def __init__(self, seed: int = None) -> None:
+        """Initialize an empty skip list; seed makes the node levels reproducible."""
+        self._random = random.Random(seed)
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove every key."""
+        self._head = _Node(None, MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+
+    def length(self) -> int:
+        """Return the number of keys."""
+        return self._size
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and self._random.random() < LEVEL_PROBABILITY:
+            level += 1
+        return level
+
+    def _predecessors(self, key: object) -> list:
+        """
+        Return, for every level, the last node whose key is less than the given key.
+
+        :complexity: O(log n) expected
+        """
+        update = [self._head] * MAX_LEVEL
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            following = node.forward[level]
+            while following is not None and following.key < key:
+                node = following
+                following = node.forward[level]
+            update[level] = node
+        return update
+
+    def add(self, key: object) -> bool:
+        """
+        Adds the key, returning False if it was already present.
+
+        :complexity: O(log n) expected
+        """
+        update = self._predecessors(key)
+        following = update[0].forward[0]
+        if following is not None and following.key == key:
+            return False
+
+        level = self._random_level()
+        if level > self._level:
+            self._level = level
+
+        node = _Node(key, level)
+        for index in range(level):
+            node.forward[index] = update[index].forward[index]
+            update[index].forward[index] = node
+        self._size += 1
+        return True
+
+    def remove(self, key: object) -> bool:
+        """
+        Removes the key, returning False if it was not present.
+
+        :complexity: O(log n) expected
+        """
+        update = self._predecessors(key)
+        node = update[0].forward[0]
+        if node is None or node.key != key:
+            return False
+
+        for index in range(len(node.forward)):
+            update[index].forward[index] = node.forward[index]
+        while self._level > 1 and self._head.forward[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+        return True
+
+    def contains(self, key: object) -> bool:
+        """
+        Returns True if the key is present.
+
+        :complexity: O(log n) expected
+        """
+        node = self._predecessors(key)[0].forward[0]
+        return node is not None and node.key == key
+
+    def first(self) -> object:
+        """
+        Returns the smallest key, or None if the list is empty.
+
+        :complexity: O(1)
+        """
+        node = self._head.forward[0]
+        return None if node is None else node.key
+
+    def last(self) -> object:
+        """
+        Returns the largest key, or None if the list is empty.
+
+        :complexity: O(log n) expected
+        """
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            while node.forward[level] is not None:
+                node = node.forward[level]
+        return node.key
+
+    def keys_from(self, key: object = None):
+        """
+        Yields the keys in ascending order, starting at the first key greater than or
+        equal to the given key (or at the smallest key if key is None).
+
+        :complexity: O(log n + k) expected for k keys
+        """
+        if key is None:
+            node = self._head.forward[0]
+        else:
+            node = self._predecessors(key)[0].forward[0]
+        while node is not None:
+            yield node.key
+            node = node.forward[0]
+
+    def __iter__(self):
+        """Yields every key in ascending order."""
+        return self.keys_from()
@@ -0,0 +1,294 @@
+# Description: Recording and replay of HashMap workloads for offline capacity planning.
+# A RecordingMap wraps a live HashMap, forwards every call to it, and logs each
+# operation (its kind, its key and, for writes, the size of the value) to a compact
+# binary trace file. The replay tool runs a recorded trace against any map
+# configuration (separate chaining or open addressing, hash function, initial
+# capacity, load factor thresholds) and reports throughput, per-operation latency percentiles, the number
+# of resizes and the memory used by the map.
+#
+# Trace format: the 8-byte header b'HMTRACE2', followed by one record per operation:
+# an operation code (1 byte), the key length in bytes (4 bytes), the value size in
+# bytes (8 bytes), all little-endian, then the UTF-8 encoded key. Traces written with
+# the older b'HMTRACE1' header (2-byte key lengths, 4-byte sizes) can still be read.
+#
+# Usage: python workload_trace.py TRACE_FILE [--map sc|oa ...] [--function 1|2 ...]
+#                                 [--capacity N] [--max-load F] [--growth F] [--min-load F]
+#                                 [--target-probe-length F]
+
+
+import argparse
+import struct
+import sys
+import time
+import tracemalloc
+
+from DynamicArray_and_SinglyLinkedList import hash_function_1, hash_function_2
+import hash_map_oa
+import hash_map_sc
+
+
+TRACE_HEADER = b'HMTRACE2'
+RECORD = struct.Struct('<BIQ')
+
+# record layout of each trace format version, by header
+RECORD_FORMATS = {TRACE_HEADER: RECORD, b'HMTRACE1': struct.Struct('<BHI')}
+
+# operation codes used in the trace file
+OPERATIONS = ('put', 'get', 'contains_key', 'remove', 'increment', 'setdefault', 'update', 'pop', 'clear')
+OPERATION_CODES = {name: code for code, name in enumerate(OPERATIONS)}
+
+# operations whose value (or delta/default) size is recorded
+WRITE_OPERATIONS = ('put', 'increment', 'setdefault')
+
+HASH_FUNCTIONS = {'1': hash_function_1, '2': hash_function_2}
+
+
+def value_size(value: object) -> int:
+    """Return the recorded size of a value: its length for strings and bytes, else its object size."""
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class RecordingMap:
+    """
+    Wraps a HashMap and records every operation made through the wrapper to a trace file.
+    Any other attribute is read from the wrapped map. Recording never stops an operation
+    from reaching the map: an operation that cannot be recorded (for example a key that
+    is not a string, or a write after close()) is still made, and counted by
+    dropped_records().
+    """
+
+    def __init__(self, hash_map, path: str) -> None:
+        """Start recording operations on the given map to a new trace file at path."""
+        self._map = hash_map
+        self._dropped = 0
+        self._file = open(path, 'wb')
+        self._file.write(TRACE_HEADER)
+
+    def __getattr__(self, name: str):
+        """Forward every attribute that is not recorded to the wrapped map."""
+        return getattr(self._map, name)
+
+    def _record(self, operation: str, key: str = '', size: int = 0) -> None:
+        """Append one record to the trace, or count it as dropped if it cannot be written."""
+        try:
+            encoded = key.encode('utf-8')
+            self._file.write(RECORD.pack(OPERATION_CODES[operation], len(encoded), size) + encoded)
+        except (AttributeError, UnicodeError, struct.error, OSError, ValueError):
+            self._dropped += 1
+
+    def dropped_records(self) -> int:
+        """Return the number of operations that were made on the map but not recorded."""
+        return self._dropped
+
+    def put(self, key: str, value: object) -> None:
+        self._record('put', key, value_size(value))
+        self._map.put(key, value)
+
+    def get(self, key: str) -> object:
+        self._record('get', key)
+        return self._map.get(key)
+
+    def contains_key(self, key: str) -> bool:
+        self._record('contains_key', key)
+        return self._map.contains_key(key)
+
+    def remove(self, key: str) -> None:
+        self._record('remove', key)
+        self._map.remove(key)
+
+    def increment(self, key: str, delta: object = 1) -> object:
+        self._record('increment', key, value_size(delta))
+        return self._map.increment(key, delta)
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        self._record('setdefault', key, value_size(default))
+        return self._map.setdefault(key, default)
+
+    def update(self, key: str, function: callable, default: object = None) -> object:
+        self._record('update', key)
+        return self._map.update(key, function, default)
+
+    def pop(self, key: str, default: object = None) -> object:
+        self._record('pop', key)
+        return self._map.pop(key, default)
+
+    def clear(self) -> None:
+        self._record('clear')
+        self._map.clear()
+
+    def close(self) -> None:
+        """Finish the trace file. The wrapped map remains usable."""
+        self._file.close()
+
+
+def read_trace(path: str):
+    """Yield the (operation, key, value size) records of a trace file in order."""
+    with open(path, 'rb') as trace:
+        record = RECORD_FORMATS.get(trace.read(len(TRACE_HEADER)))
+        if record is None:
+            raise ValueError(f"'{path}' is not a HashMap trace file")
+        while True:
+            header = trace.read(record.size)
+            if not header:
+                return
+            if len(header) < record.size:
+                raise ValueError(f"'{path}' ends with a truncated record")
+            code, key_length, size = record.unpack(header)
+            yield OPERATIONS[code], trace.read(key_length).decode('utf-8'), size
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Return the value below which the given fraction of the sorted values fall."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def _value_of(operation: str, size: int, values: dict) -> object:
+    """Return the placeholder value for a write operation of the given recorded size."""
+    if operation not in WRITE_OPERATIONS:
+        return None
+    if operation == 'increment':
+        return size         # increments must stay numeric
+    return values[size]
+
+
+def _apply(hash_map, operation: str, key: str, value: object) -> None:
+    """Perform one recorded operation on the map."""
+    if operation == 'put':
+        hash_map.put(key, value)
+    elif operation == 'get':
+        hash_map.get(key)
+    elif operation == 'contains_key':
+        hash_map.contains_key(key)
+    elif operation == 'remove':
+        hash_map.remove(key)
+    elif operation == 'increment':
+        hash_map.increment(key, value)
+    elif operation == 'setdefault':
+        hash_map.setdefault(key, value)
+    elif operation == 'update':
+        hash_map.update(key, lambda current: current)
+    elif operation == 'pop':
+        hash_map.pop(key)
+    else:
+        hash_map.clear()
+
+
+def measure_memory(records: list, make_map: callable, values: dict) -> tuple:
+    """
+    Run the trace records against a second new map with tracemalloc on and return the
+    (final, peak) memory allocated while building and using it. The placeholder
+    values are created beforehand, so only the map's own allocations are traced.
+    """
+    tracemalloc.start()
+    hash_map = make_map()
+    for operation, key, size in records:
+        _apply(hash_map, operation, key, _value_of(operation, size, values))
+    current_memory, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current_memory, peak_memory
+
+
+def replay(records: list, make_map: callable) -> dict:
+    """
+    Run the given trace records against a new map returned by make_map() and return a
+    dictionary with the total time, throughput, per-operation latencies, number of
+    resizes, final size and capacity, and the peak and final memory of the map. The
+    timed run is made without tracemalloc; memory is measured by measure_memory() in a
+    separate run.
+    """
+    # one placeholder value per recorded size
+    values = {size: b'\0' * size for operation, _, size in records if operation in WRITE_OPERATIONS}
+    latencies = {}
+    hash_map = make_map()
+
+    # count resizes by wrapping resize_table on this instance only
+    resizes = [0]
+    resize_table = hash_map.resize_table
+
+    def counting_resize(new_capacity):
+        resizes[0] += 1
+        resize_table(new_capacity)
+
+    hash_map.resize_table = counting_resize
+
+    started = time.perf_counter()
+    for operation, key, size in records:
+        value = _value_of(operation, size, values)
+
+        start = time.perf_counter()
+        _apply(hash_map, operation, key, value)
+        elapsed = time.perf_counter() - start
+
+        if operation not in latencies:
+            latencies[operation] = []
+        latencies[operation].append(elapsed)
+    total = time.perf_counter() - started
+
+    current_memory, peak_memory = measure_memory(records, make_map, values)
+
+    summary = {}
+    for operation, samples in latencies.items():
+        samples.sort()
+        summary[operation] = {'count': len(samples),
+                              'p50': percentile(samples, 0.50), 'p90': percentile(samples, 0.90),
+                              'p99': percentile(samples, 0.99), 'p999': percentile(samples, 0.999),
+                              'max': samples[-1]}
+
+    return {'seconds': total,
+            'operations_per_second': len(records) / total if total else 0.0,
+            'latency': summary,
+            'resizes': resizes[0],
+            'size': hash_map.get_size(),
+            'capacity': hash_map.get_capacity(),
+            'max_load_factor': hash_map.load_factor_settings()['max_load_factor'],
+            'current_memory': current_memory,
+            'peak_memory': peak_memory}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Replay a recorded HashMap trace against map configurations.')
+    parser.add_argument('trace_file', help='trace written by RecordingMap')
+    parser.add_argument('--map', choices=('sc', 'oa'), action='append',
+                        help='map implementation: separate chaining or open addressing (repeatable)')
+    parser.add_argument('--function', choices=tuple(HASH_FUNCTIONS), action='append',
+                        help='hash function number (repeatable)')
+    parser.add_argument('--capacity', type=int, default=11, help='initial capacity')
+    parser.add_argument('--max-load', type=float, help='max load factor (default: 1.0 for sc, 0.5 for oa)')
+    parser.add_argument('--growth', type=float, default=2.0, help='growth factor')
+    parser.add_argument('--min-load', type=float, default=0.0, help='min load factor that triggers shrinking')
+    parser.add_argument('--target-probe-length', type=float,
+                        help='auto-tune the max load factor toward this average probe length')
+    args = parser.parse_args()
+
+    thresholds = {'growth_factor': args.growth, 'min_load_factor': args.min_load,
+                  'target_probe_length': args.target_probe_length}
+    if args.max_load is not None:
+        thresholds['max_load_factor'] = args.max_load
+
+    records = list(read_trace(args.trace_file))
+    print(f"{len(records)} operations")
+
+    for map_name in args.map or ['sc', 'oa']:
+        for function_name in args.function or ['2']:
+            function = HASH_FUNCTIONS[function_name]
+            module = hash_map_sc if map_name == 'sc' else hash_map_oa
+            result = replay(records, lambda: module.HashMap(args.capacity, function, **thresholds))
+
+            print(f"\n{map_name} hash_function_{function_name} capacity {args.capacity}: "
+                  f"{result['operations_per_second']:,.0f} ops/s, {result['resizes']} resizes, "
+                  f"final size {result['size']} / capacity {result['capacity']} "
+                  f"(max load {result['max_load_factor']:.2f}), "
+                  f"memory {result['current_memory'] / 1024:,.0f} KiB (peak {result['peak_memory'] / 1024:,.0f} KiB)")
+            print(f"{'operation':<14}{'count':>9}{'p50 us':>9}{'p90 us':>9}{'p99 us':>9}{'p99.9 us':>10}{'max us':>10}")
+            for operation, latency in result['latency'].items():
+                print(f"{operation:<14}{latency['count']:>9}{latency['p50'] * 1e6:>9.1f}{latency['p90'] * 1e6:>9.1f}"
+                      f"{latency['p99'] * 1e6:>9.1f}{latency['p999'] * 1e6:>10.1f}{latency['max'] * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()